@@ -0,0 +1,63 @@
+"""
+Import-time benchmark of `fastapi_advanced_filters`.
+
+Every statement runs in a fresh interpreter, so nothing is shared between
+samples. Reports the median wall time and whether SQLAlchemy and Pydantic were
+loaded:
+
+    python benchmarks/import_time.py [--runs 15]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+
+CASES: dict[str, str] = {
+    "enums": "import fastapi_advanced_filters.enums",
+    "package": "import fastapi_advanced_filters",
+    "data classes": "from fastapi_advanced_filters import FieldCriteria, OperationEnum",
+    "BaseFilter": "from fastapi_advanced_filters import BaseFilter",
+}
+
+PROBE: str = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, "sqlalchemy" in sys.modules, "pydantic" in sys.modules)
+"""
+
+
+def measure(statement: str) -> tuple[float, bool, bool]:
+    output: str = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        capture_output=True,
+        check=True,
+        cwd=ROOT,
+        text=True,
+    ).stdout
+    elapsed, sqlalchemy, pydantic = output.split()
+    return float(elapsed), sqlalchemy == "True", pydantic == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+    print(f"{'case':<14}{'median ms':>10}  sqlalchemy  pydantic")
+    for name, statement in CASES.items():
+        measure(statement)  # warm the bytecode cache
+        samples: list[tuple[float, bool, bool]] = [
+            measure(statement) for _ in range(args.runs)
+        ]
+        median: float = statistics.median(sample[0] for sample in samples)
+        _, sqlalchemy, pydantic = samples[-1]
+        print(f"{name:<14}{median * 1000:>10.1f}  {sqlalchemy!s:<10}  {pydantic!s}")
+
+
+if __name__ == "__main__":
+    main()
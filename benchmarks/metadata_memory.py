@@ -0,0 +1,76 @@
+"""
+Memory benchmark of the filter metadata objects.
+
+Measures, with `tracemalloc`, the bytes retained per `FieldCriteria` (one per
+declared field) and per `SortBy`/`Selectable`/`QSearch` over 20 columns:
+
+    python benchmarks/metadata_memory.py [--count 10000]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi_advanced_filters import (  # noqa: E402
+    FieldCriteria,
+    OperationEnum,
+    QSearch,
+    Selectable,
+    SortBy,
+)
+
+COLUMNS: list[str] = [f"column_name_{i}" for i in range(20)]
+
+
+def field_criteria(i: int) -> Any:
+    return FieldCriteria(
+        name=COLUMNS[i % len(COLUMNS)],
+        field_type=int,
+        op=(OperationEnum.EQ, OperationEnum.IN),
+        model_attr=COLUMNS[i % len(COLUMNS)],
+        prefix="user",
+    )
+
+
+def sort_by(_: int) -> Any:
+    return SortBy(model_attrs={name: name for name in COLUMNS}, alias_as_camelcase=True)
+
+
+def selectable(_: int) -> Any:
+    return Selectable(model_attrs={name: name for name in COLUMNS})
+
+
+def q_search(_: int) -> Any:
+    return QSearch(model_attrs=list(COLUMNS))
+
+
+def measure(build: Callable[[int], Any], count: int) -> float:
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    objects: list[Any] = [build(i) for i in range(count)]
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the objects is not part of their cost.
+    return (after - before - sys.getsizeof(objects)) / len(objects)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+    print(f"{'object':<16}{'bytes each':>12}")
+    for name, build in (
+        ("FieldCriteria", field_criteria),
+        ("SortBy", sort_by),
+        ("Selectable", selectable),
+        ("QSearch", q_search),
+    ):
+        print(f"{name:<16}{measure(build, args.count):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark of row mode against ORM entities on pages of selected columns.
+
+Runs the same filtered, sorted query over an in-memory SQLite table, one page
+of `--rows` rows (above the 1000 rows `limit` accepts, so no limit is set),
+and turns every item into a Pydantic response model: from ORM entities (the
+default), from ORM column rows (`select=`), from the dicts of `as_rows=True`
+and with `row_factory` building the response objects directly:
+
+    python benchmarks/row_mode.py [--rows 10000] [--repeat 10]
+
+Row mode still runs through `session.execute`, so autoflush and
+`do_orm_execute` hooks apply: it skips entity hydration, not ORM execution.
+Expect row dicts to be about 15-30% faster than ORM entities (e.g. 55-100 ms
+against 75-115 ms per 10k-row page, depending on the machine), not twice as
+fast.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pydantic import BaseModel  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import mapped_column  # noqa: E402
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session  # noqa: E402
+
+from fastapi_advanced_filters import (  # noqa: E402
+    BaseFilter,
+    FieldCriteria,
+    OperationEnum,
+    Selectable,
+    SortBy,
+)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    price: Mapped[int]
+    category: Mapped[str]
+    description: Mapped[str]
+    sku: Mapped[str]
+    stock: Mapped[int]
+    weight: Mapped[float]
+
+
+class ItemOut(BaseModel):
+    id: int
+    name: str
+    price: int
+
+
+SELECTED: dict[str, Any] = {"id": Item.id, "name": Item.name, "price": Item.price}
+
+
+def item_filter(**selectable: Any) -> type[BaseFilter]:
+    class ItemFilter(BaseFilter):
+        class FilterConfig:
+            model = Item
+            sort_by = SortBy(model_attrs={"id": Item.id})
+            select_only = Selectable(model_attrs=SELECTED, **selectable)
+            fields = [
+                FieldCriteria(
+                    name="price",
+                    field_type=int,
+                    model_attr=Item.price,
+                    op=(OperationEnum.GTE,),
+                ),
+            ]
+
+    return ItemFilter
+
+
+def populate(session: Session, rows: int) -> None:
+    session.execute(
+        Item.__table__.insert(),
+        [
+            {
+                "id": i,
+                "name": f"item {i}",
+                "price": i % 500,
+                "category": f"category {i % 20}",
+                "description": "lorem ipsum " * 10,
+                "sku": f"SKU-{i:08d}",
+                "stock": i % 70,
+                "weight": i / 10,
+            }
+            for i in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def measure(run: Callable[[], list[Any]], session: Session, repeat: int) -> float:
+    run()
+    session.expunge_all()
+    started: float = time.perf_counter()
+    for _ in range(repeat):
+        run()
+        session.expunge_all()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    page: dict[str, Any] = {"price__gte": 0, "sort_by": "id"}
+    orm_filter = item_filter()
+    rows_filter = item_filter(as_rows=True)
+    factory_filter = item_filter(row_factory=ItemOut)
+    with Session(engine) as session:
+        populate(session, args.rows)
+        cases: dict[str, Callable[[], list[Any]]] = {
+            "ORM entities": lambda: [
+                ItemOut.model_validate(item, from_attributes=True)
+                for item in orm_filter(**page).execute(session).items
+            ],
+            "ORM column rows": lambda: [
+                ItemOut.model_validate(row, from_attributes=True)
+                for row in orm_filter(**page, select="all").execute(session).items
+            ],
+            "row dicts": lambda: [
+                ItemOut.model_validate(row)
+                for row in rows_filter(**page).execute(session).items
+            ],
+            "row_factory": lambda: factory_filter(**page).execute(session).items,
+        }
+        print(f"{'path':<18}{'ms per page':>12}")
+        for name, run in cases.items():
+            print(f"{name:<18}{measure(run, session, args.repeat):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
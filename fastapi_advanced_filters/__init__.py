@@ -1,24 +1,46 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from fastapi_advanced_filters.data_classes import (
     AdvancedQSearch,
     FieldCriteria,
     FilterResult,
+    FullTextQSearch,
     Pagination,
     QSearch,
+    QueryResult,
     Selectable,
     SortBy,
+    TermLimits,
 )
 from fastapi_advanced_filters.enums import (
+    CountStrategyEnum,
     LogicalOperator,
+    MatchModeEnum,
     OperationEnum,
     OrderEnum,
     PaginationEnum,
+    RelationshipLoaderEnum,
 )
-from fastapi_advanced_filters.filters import BaseFilter
-from fastapi_advanced_filters.operation_mapping import (
-    SQLALCHEMY_LOGICAL_OP_MAPPING,
-    SQLALCHEMY_OP_MAPPING,
-    SQLALCHEMY_SORTING_MAPPING,
-)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi_advanced_filters.filters import BaseFilter
+    from fastapi_advanced_filters.operation_mapping import (
+        SQLALCHEMY_BIND_OP_MAPPING,
+        SQLALCHEMY_LOGICAL_OP_MAPPING,
+        SQLALCHEMY_OP_MAPPING,
+        SQLALCHEMY_SORTING_MAPPING,
+    )
+
+# Imported on first access, so code only using the enums and data classes does
+# not load Pydantic models, the mixins or SQLAlchemy.
+_LAZY_ATTRS: dict[str, str] = {
+    "BaseFilter": "fastapi_advanced_filters.filters",
+    "SQLALCHEMY_OP_MAPPING": "fastapi_advanced_filters.operation_mapping",
+    "SQLALCHEMY_SORTING_MAPPING": "fastapi_advanced_filters.operation_mapping",
+    "SQLALCHEMY_LOGICAL_OP_MAPPING": "fastapi_advanced_filters.operation_mapping",
+    "SQLALCHEMY_BIND_OP_MAPPING": "fastapi_advanced_filters.operation_mapping",
+}
 
 __all__ = [
     "BaseFilter",
@@ -26,14 +48,34 @@ __all__ = [
     "FieldCriteria",
     "Selectable",
     "SortBy",
+    "TermLimits",
     "QSearch",
     "PaginationEnum",
+    "CountStrategyEnum",
+    "RelationshipLoaderEnum",
     "OrderEnum",
     "FilterResult",
     "Pagination",
     "LogicalOperator",
+    "MatchModeEnum",
     "AdvancedQSearch",
+    "FullTextQSearch",
+    "QueryResult",
     "SQLALCHEMY_OP_MAPPING",
     "SQLALCHEMY_SORTING_MAPPING",
     "SQLALCHEMY_LOGICAL_OP_MAPPING",
+    "SQLALCHEMY_BIND_OP_MAPPING",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name: str | None = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
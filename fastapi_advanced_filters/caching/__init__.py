@@ -0,0 +1,19 @@
+"""
+Caching helpers shared by filter classes.
+"""
+
+from fastapi_advanced_filters.caching.result_cache import (
+    InMemoryResultCache,
+    ResultCacheBackend,
+    estimate_size,
+)
+from fastapi_advanced_filters.caching.single_flight import SingleFlight
+from fastapi_advanced_filters.caching.statement_cache import StatementCache
+
+__all__ = [
+    "InMemoryResultCache",
+    "ResultCacheBackend",
+    "SingleFlight",
+    "StatementCache",
+    "estimate_size",
+]
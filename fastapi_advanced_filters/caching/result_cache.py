@@ -0,0 +1,108 @@
+import pickle
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable
+
+
+class ResultCacheBackend(ABC):
+    """Store used to cache query results by key, e.g. backed by Redis."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the cached value, or `None` when missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store `value`, expiring it after `ttl` seconds when given."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove `key` if it is cached."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached value."""
+
+
+def estimate_size(value: Any) -> int:
+    """Return the size in bytes of the pickled `value`, falling back to
+    `sys.getsizeof` for values that cannot be pickled."""
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class InMemoryResultCache(ResultCacheBackend):
+    """Thread-safe in-process LRU cache with TTL and byte accounting."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        assert max_entries > 0, "Result cache 'max_entries' must be positive."
+        assert (
+            max_bytes is None or max_bytes > 0
+        ), "Result cache 'max_bytes' must be positive."
+        self.max_entries: int = max_entries
+        self.max_bytes: int | None = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.current_bytes: int = 0
+        self.__sizeof: Callable[[Any], int] = sizeof
+        self.__clock: Callable[[], float] = clock
+        # key -> (value, expires_at, size)
+        self.__entries: OrderedDict[str, tuple[Any, float | None, int]] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> Any | None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > self.__clock()):
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                self.__remove(key)
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        size: int = self.__sizeof(value) if self.max_bytes is not None else 0
+        expires_at: float | None = self.__clock() + ttl if ttl is not None else None
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self.__entries[key] = (value, expires_at, size)
+            self.current_bytes += size
+            while len(self.__entries) > self.max_entries or (
+                self.max_bytes is not None and self.current_bytes > self.max_bytes
+            ):
+                self.__remove(next(iter(self.__entries)))
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __remove(self, key: str) -> None:
+        self.current_bytes -= self.__entries.pop(key)[2]
@@ -0,0 +1,39 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls into a single one."""
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.coalesced: int = 0
+        self.__in_flight: dict[tuple[Any, Hashable], asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__in_flight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        # Futures belong to one event loop, so are calls.
+        flight_key: tuple[Any, Hashable] = (loop, key)
+        future: asyncio.Future[Any] | None = self.__in_flight.get(flight_key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(call())
+            self.__in_flight[flight_key] = future
+            future.add_done_callback(
+                lambda done: self.__forget(flight_key, done)  # type: ignore
+            )
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def __forget(self, flight_key: tuple[Any, Hashable], future: Any) -> None:
+        if self.__in_flight.get(flight_key) is future:
+            del self.__in_flight[flight_key]
+        if not future.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            future.exception()
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class StatementCache:
+    """Thread-safe LRU cache of built statements keyed by their shape."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        assert maxsize > 0, "Statement cache 'maxsize' must be positive."
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.__entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], T]) -> T:
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return self.__entries[key]
+            self.misses += 1
+        statement: T = build()
+        with self.__lock:
+            self.__entries[key] = statement
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+        return statement
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.hits = self.misses = 0
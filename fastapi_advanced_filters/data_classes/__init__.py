@@ -1,17 +1,27 @@
 from fastapi_advanced_filters.data_classes.advanced_qsearch import AdvancedQSearch
+from fastapi_advanced_filters.data_classes.attribute_path import AttributePath
 from fastapi_advanced_filters.data_classes.field_criteria import FieldCriteria
+from fastapi_advanced_filters.data_classes.filter_plan import FilterPlanEntry
 from fastapi_advanced_filters.data_classes.filter_result import FilterResult
+from fastapi_advanced_filters.data_classes.full_text_qsearch import FullTextQSearch
 from fastapi_advanced_filters.data_classes.pagination import Pagination
 from fastapi_advanced_filters.data_classes.qsearch import QSearch
+from fastapi_advanced_filters.data_classes.query_result import QueryResult
 from fastapi_advanced_filters.data_classes.selectable import Selectable
 from fastapi_advanced_filters.data_classes.sortby import SortBy
+from fastapi_advanced_filters.data_classes.term_limits import TermLimits
 
 __all__ = [
     "AdvancedQSearch",
+    "AttributePath",
     "FieldCriteria",
+    "FilterPlanEntry",
     "FilterResult",
+    "FullTextQSearch",
     "Pagination",
     "QSearch",
+    "QueryResult",
     "Selectable",
     "SortBy",
+    "TermLimits",
 ]
@@ -1,12 +1,30 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Mapping
 
 from annotated_types import BaseMetadata
 
+from fastapi_advanced_filters.data_classes.term_limits import TermLimits
 from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum
+from fastapi_advanced_filters.utils import frozen_mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdvancedQSearch(BaseMetadata):
-    model_attrs_with_op: dict[OperationEnum, list[Any]]
+    model_attrs_with_op: Mapping[OperationEnum, tuple[Any, ...]]
     logical_op: LogicalOperator = LogicalOperator.OR
+    term_limits: TermLimits | None = None
+    # Run an OR search as a UNION of one primary-key lookup per column, so
+    # each column's index can be used; see `union_conditions`.
+    union_rewrite: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "model_attrs_with_op",
+            frozen_mapping(
+                {
+                    op: tuple(model_attrs)
+                    for op, model_attrs in (self.model_attrs_with_op or {}).items()
+                }
+            ),
+        )
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True, slots=True)
+class AttributePath:
+    """A dotted relationship path (e.g. `"orders.status"`) resolved to a column."""
+
+    model_attr: Any
+    # Relationships to LEFT OUTER JOIN for paths through to-one relationships
+    # only, parents first; shared by every path with the same prefix.
+    joins: tuple[Any, ...] = ()
+    # Wraps a condition on `model_attr` into an EXISTS subquery, for paths
+    # through a to-many relationship (rows are never multiplied).
+    exists: Callable[[Any], Any] | None = None
@@ -1,25 +1,48 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from annotated_types import BaseMetadata
 
-from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum
-from fastapi_advanced_filters.utils import to_camel_case
+from fastapi_advanced_filters.data_classes.term_limits import TermLimits
+from fastapi_advanced_filters.enums import LogicalOperator, MatchModeEnum, OperationEnum
+from fastapi_advanced_filters.utils import EMPTY_MAPPING, frozen_mapping, to_camel_case
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldCriteria(BaseMetadata):
     name: str
     field_type: type
     op: tuple[OperationEnum, ...]
     model_attr: Any = None
-    model_attrs_with_logical_op: tuple[list[Any], LogicalOperator] | None = None
+    model_attrs_with_logical_op: tuple[tuple[Any, ...], LogicalOperator] | None = None
     required_op: tuple[OperationEnum, ...] | None = None
     prefix: str | None = None
     custom_filter_per_op: Callable | None = None
     alias_as_camelcase: bool = False
     snake_case_separator_between_prefix_and_op: str = "__"
-    fields_kwargs: dict[str, Any] = field(default_factory=dict)
+    # Left out of the hash so criteria stay hashable; compared all the same.
+    fields_kwargs: Mapping[str, Any] = field(
+        default_factory=lambda: EMPTY_MAPPING, hash=False
+    )
+    # Pattern built by the LIKE/ILIKE ops of this field; anything but
+    # CONTAINS lets the database use an index.
+    match_mode: MatchModeEnum = MatchModeEnum.CONTAINS
+    term_limits: TermLimits | None = None
+
+    def __post_init__(self) -> None:
+        # Stored read-only: sequences as tuples, and one shared empty mapping
+        # for the fields without `fields_kwargs`.
+        object.__setattr__(self, "op", tuple(self.op))
+        if self.required_op is not None:
+            object.__setattr__(self, "required_op", tuple(self.required_op))
+        if isinstance(self.model_attrs_with_logical_op, (list, tuple)) and isinstance(
+            self.model_attrs_with_logical_op[0], list
+        ):
+            model_attrs, *rest = self.model_attrs_with_logical_op
+            object.__setattr__(
+                self, "model_attrs_with_logical_op", (tuple(model_attrs), *rest)
+            )
+        object.__setattr__(self, "fields_kwargs", frozen_mapping(self.fields_kwargs))
 
     def get_name(self) -> str:
         if self.prefix is None:
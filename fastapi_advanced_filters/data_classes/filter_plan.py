@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from fastapi_advanced_filters.data_classes.field_criteria import FieldCriteria
+from fastapi_advanced_filters.enums import OperationEnum
+
+
+@dataclass(frozen=True)
+class FilterPlanEntry:
+    name: str
+    op: OperationEnum
+    field_criteria: FieldCriteria
+    operation: Callable[[Any], Any] | None = None
+    logical_op: Callable[..., Any] | None = None
+    default: Any = None
+    position: int = 0
+    # Set for entries compiled with a named bind parameter: the expression is
+    # value-independent and `prepare` turns a request value into the parameter.
+    expression: Any = None
+    prepare: Callable[[Any], Any] | None = None
+    # Relationships joined by the field's relationship paths, and whether a
+    # path goes through a to-many relationship (EXISTS conditions, which are
+    # left out of normalization).
+    joins: tuple[Any, ...] = ()
+    to_many: bool = False
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Hashable
 
 from .pagination import Pagination
 
@@ -11,3 +11,23 @@ class FilterResult:
     filters: list[Any] | None = None
     pagination: Pagination | None = None
     q_search: Any | None = None
+    # Values of the bind parameters used by `filters`/`pagination` when the
+    # filter is configured with `bind_params = True`.
+    params: dict[str, Any] | None = None
+    # Hashable key of the statement layout (active fields and ops, sorting,
+    # selection and pagination), `None` when it cannot be computed.
+    shape_key: Hashable | None = None
+    # Set when the filters cannot match any row: `filters` is a single false
+    # condition and executors return an empty result without a query.
+    empty: bool = False
+    # Relationships to LEFT OUTER JOIN for the relationship paths used by the
+    # filters, q_search and sorting, deduplicated and parents first.
+    joins: tuple[Any, ...] | None = None
+    # Loader options (`load_only`, relationship loaders) of a `Selectable`
+    # with `load_entities=True`, used instead of `selected_columns`.
+    load_options: tuple[Any, ...] | None = None
+    # Set by a `Selectable` with `as_rows`/`row_factory`: `selected_columns`
+    # are labeled with their public names and executors return dicts, or
+    # `row_factory(**item)`, built from the rows of the page.
+    as_rows: bool = False
+    row_factory: Callable[..., Any] | None = None
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any
+
+from annotated_types import BaseMetadata
+
+from fastapi_advanced_filters.data_classes.term_limits import TermLimits
+
+
+@dataclass(frozen=True, slots=True)
+class FullTextQSearch(BaseMetadata):
+    model_attrs: tuple[Any, ...]
+    # PostgreSQL text search configuration, e.g. "english" or "simple".
+    language: str = "english"
+    # Order by relevance when the request does not ask for a sorting.
+    rank_ordering: bool = False
+    # Cap the number of results of a search.
+    top_k: int | None = None
+    term_limits: TermLimits | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "model_attrs", tuple(self.model_attrs))
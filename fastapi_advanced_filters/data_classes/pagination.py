@@ -1,7 +1,13 @@
 from dataclasses import dataclass
+from typing import Any, Callable
 
 
 @dataclass(frozen=True)
 class Pagination:
     limit: int | None = None
     offset: int | None = None
+    # Cursor-based pagination: the keyset predicate selecting rows after the
+    # request cursor, and a callable building the next cursor from a page's
+    # last row.
+    seek: Any | None = None
+    next_cursor: Callable[[Any], str] | None = None
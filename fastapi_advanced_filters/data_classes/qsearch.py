@@ -3,11 +3,19 @@ from typing import Any
 
 from annotated_types import BaseMetadata
 
+from fastapi_advanced_filters.data_classes.term_limits import TermLimits
 from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QSearch(BaseMetadata):
-    model_attrs: list[Any]
+    model_attrs: tuple[Any, ...]
     logical_op: LogicalOperator = LogicalOperator.OR
     op: OperationEnum = OperationEnum.ILIKE
+    term_limits: TermLimits | None = None
+    # Run an OR search as a UNION of one primary-key lookup per column, so
+    # each column's index can be used; see `union_conditions`.
+    union_rewrite: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "model_attrs", tuple(self.model_attrs))
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    items: list[Any]
+    # Total number of rows matching the filters, when it was requested.
+    total: int | None = None
+    # With the capped count strategy, `total` stops at the cap and this flag
+    # tells that more rows exist ("N+").
+    total_capped: bool = False
+    # Set when one extra row is fetched to know whether another page follows:
+    # with cursor-based pagination or the has_next count strategy.
+    has_next: bool | None = None
+    next_cursor: str | None = None
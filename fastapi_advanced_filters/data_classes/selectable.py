@@ -1,31 +1,53 @@
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Mapping
 
 from annotated_types import BaseMetadata
 
-from fastapi_advanced_filters.utils import to_camel_case
+from fastapi_advanced_filters.enums import RelationshipLoaderEnum
+from fastapi_advanced_filters.utils import camel_case_aliases, frozen_mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Selectable(BaseMetadata):
-    model_attrs: dict[str, Any]
-    __camelcase_alias_cache: dict[str, Any] = field(default_factory=dict, init=False)
+    model_attrs: Mapping[str, Any]
     alias_as_camelcase: bool = False
+    # Load entities with only the selected columns and relationships instead
+    # of projecting rows of columns; relationships use `relationship_loader`.
+    load_entities: bool = False
+    relationship_loader: RelationshipLoaderEnum = RelationshipLoaderEnum.SELECTIN
+    # Execute a select of the selected columns (all of them when none is
+    # requested) without hydrating entities: items are dicts keyed by the
+    # public names, or `row_factory(**item)` when a factory is given.
+    as_rows: bool = False
+    row_factory: Callable[..., Any] | None = None
+    # `model_attrs` keyed by the public names: the mapping itself, or a copy
+    # keyed by camelCase aliases.
+    _attrs_by_name: Mapping[str, Any] = field(init=False, repr=False, compare=False)
 
-    def __post_init__(self):
-        if self.model_attrs and self.alias_as_camelcase:
-            object.__setattr__(
-                self,
-                "_Selectable__camelcase_alias_cache",
-                {to_camel_case(name): attr for name, attr in self.model_attrs.items()},
-            )
+    def __post_init__(self) -> None:
+        assert not (
+            self.load_entities and (self.as_rows or self.row_factory is not None)
+        ), "Selectable cannot both load entities and return rows."
+        model_attrs: Mapping[str, Any] = frozen_mapping(self.model_attrs)
+        object.__setattr__(self, "model_attrs", model_attrs)
+        object.__setattr__(
+            self,
+            "_attrs_by_name",
+            (
+                camel_case_aliases(model_attrs)
+                if self.alias_as_camelcase
+                else model_attrs
+            ),
+        )
 
     def get_names(self) -> list[str]:
-        if self.alias_as_camelcase:
-            return list(self.__camelcase_alias_cache.keys())
-        return list(self.model_attrs.keys())
+        return list(self._attrs_by_name.keys())
 
     def get_attr(self, sort_attr: str) -> Any:
-        if self.alias_as_camelcase:
-            return self.__camelcase_alias_cache.get(sort_attr)
-        return self.model_attrs.get(sort_attr)
+        return self._attrs_by_name.get(sort_attr)
+
+    def get_items(self) -> list[tuple[str, Any]]:
+        return list(self._attrs_by_name.items())
+
+    def returns_rows(self) -> bool:
+        return self.as_rows or self.row_factory is not None
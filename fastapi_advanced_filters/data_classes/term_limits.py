@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class TermLimits:
+    # Every whitespace-separated term must have at least `min_length`
+    # characters, and there may be at most `max_terms` of them.
+    min_length: int | None = None
+    max_terms: int | None = None
+    # Reject the request instead of skipping the predicate when a value is out
+    # of limits.
+    reject: bool = False
+
+    def allows(self, value: Any) -> bool:
+        """Return whether a predicate should be built for a string `value`."""
+        if not isinstance(value, str):
+            return True
+        terms: list[str] = value.split()
+        return (self.max_terms is None or len(terms) <= self.max_terms) and (
+            self.min_length is None
+            or bool(terms and all(len(term) >= self.min_length for term in terms))
+        )
+
+    def validate(self, value: Any) -> Any:
+        """Validator of the fields with `reject` set: raises `ValueError`
+        (a validation error of the request) for values out of limits."""
+        if not self.allows(value):
+            raise ValueError(
+                f"Search value is out of term limits (min_length="
+                f"{self.min_length}, max_terms={self.max_terms})."
+            )
+        return value
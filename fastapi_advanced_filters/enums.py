@@ -4,6 +4,7 @@ from enum import StrEnum
 class PaginationEnum(StrEnum):
     PAGE_BASED = "page_based"
     OFFSET_BASED = "offset_based"
+    CURSOR_BASED = "cursor_based"
 
 
 class LogicalOperator(StrEnum):
@@ -26,8 +27,31 @@ class OperationEnum(StrEnum):
     BTW = "btw"
     CONT = "cont"
     IS = "is"
+    FTS = "fts"
+    STARTSWITH = "startswith"
+    ENDSWITH = "endswith"
+    IEQ = "ieq"
+
+
+class MatchModeEnum(StrEnum):
+    CONTAINS = "contains"
+    STARTSWITH = "startswith"
+    ENDSWITH = "endswith"
+    EXACT = "exact"
 
 
 class OrderEnum(StrEnum):
     ASC = "asc"
     DESC = "desc"
+
+
+class CountStrategyEnum(StrEnum):
+    EXACT = "exact"
+    CAPPED = "capped"
+    HAS_NEXT = "has_next"
+    WINDOW = "window"
+
+
+class RelationshipLoaderEnum(StrEnum):
+    SELECTIN = "selectin"
+    JOINED = "joined"
@@ -0,0 +1,23 @@
+"""
+Executors applying a `FilterResult` onto a statement and running it.
+
+Currently, only SQLAlchemy is supported.
+"""
+
+from fastapi_advanced_filters.executors.sqlalchemy_executor import (
+    aexecute_filter_result,
+    apply_filter_result,
+    attach_result,
+    build_count_statement,
+    detach_result,
+    execute_filter_result,
+)
+
+__all__ = [
+    "apply_filter_result",
+    "build_count_statement",
+    "execute_filter_result",
+    "aexecute_filter_result",
+    "attach_result",
+    "detach_result",
+]
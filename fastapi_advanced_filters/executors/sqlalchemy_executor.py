@@ -0,0 +1,402 @@
+import asyncio
+from dataclasses import dataclass, replace
+from typing import Any, Mapping
+
+try:
+    from sqlalchemy import bindparam, func, inspect, literal_column, select
+    from sqlalchemy.engine import Row
+    from sqlalchemy.orm import InstanceState, make_transient_to_detached
+    from sqlalchemy.orm.attributes import set_committed_value
+except ImportError:  # pragma: no cover
+    bindparam = func = inspect = literal_column = select = None  # type: ignore
+    Row = InstanceState = None  # type: ignore
+    make_transient_to_detached = set_committed_value = None  # type: ignore
+
+try:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+except ImportError:  # pragma: no cover
+    AsyncEngine = AsyncSession = None  # type: ignore
+
+from fastapi_advanced_filters.data_classes import FilterResult, QueryResult
+from fastapi_advanced_filters.enums import CountStrategyEnum
+from fastapi_advanced_filters.utils import CURSOR_LABEL_PREFIX
+
+WINDOW_COUNT_LABEL: str = "total_count"
+
+
+def apply_filter_result(stmt: Any, filter_result: FilterResult) -> Any:
+    """Apply every part of `filter_result` onto `stmt` in a single pass."""
+    for join in filter_result.joins or ():
+        stmt = stmt.outerjoin(join)
+    conditions: list[Any] = __build_conditions(filter_result)
+    if conditions:
+        stmt = stmt.where(*conditions)
+    stmt = __apply_selection(stmt, filter_result)
+    if filter_result.sorting:
+        stmt = stmt.order_by(None).order_by(*filter_result.sorting)
+    pagination = filter_result.pagination
+    if pagination is not None and pagination.limit is not None:
+        stmt = stmt.limit(__pagination_value(filter_result, "limit"))
+    if pagination is not None and pagination.offset is not None:
+        stmt = stmt.offset(__pagination_value(filter_result, "offset"))
+    return stmt
+
+
+def __pagination_value(filter_result: FilterResult, key: str) -> Any:
+    # With bind parameters, the value is sent in `params` under `key`.
+    if filter_result.params is not None and key in filter_result.params:
+        return bindparam(key)
+    return getattr(filter_result.pagination, key)
+
+
+def build_count_statement(
+    stmt: Any, filter_result: FilterResult, cap: int | None = None
+) -> Any:
+    """Return the statement counting the rows matched by `filter_result`."""
+    stmt = apply_filter_result(
+        stmt,
+        replace(
+            filter_result, selected_columns=None, load_options=None, pagination=None
+        ),
+    ).order_by(None)
+    keeps_columns: bool = bool(stmt._distinct or stmt._group_by_clauses)
+    if cap is not None:
+        if not keeps_columns:
+            stmt = stmt.with_only_columns(
+                literal_column("1"), maintain_column_froms=True
+            )
+        return select(func.count()).select_from(stmt.limit(cap + 1).subquery())
+    if (
+        keeps_columns
+        or stmt._limit_clause is not None
+        or stmt._offset_clause is not None
+    ):
+        return select(func.count()).select_from(stmt.subquery())
+    return stmt.with_only_columns(func.count(), maintain_column_froms=True)
+
+
+@dataclass(frozen=True)
+class _EntitySnapshot:
+    # Loaded column values of an ORM instance, independent of any session.
+    identity_key: tuple[Any, ...]
+    values: Mapping[str, Any]
+
+
+def detach_result(query_result: QueryResult) -> QueryResult | None:
+    """Return `query_result` shareable between sessions, `None` if it cannot be."""
+    if not query_result.items:
+        return query_result
+    item: Any = query_result.items[0]
+    values: tuple[Any, ...] = tuple(item) if isinstance(item, Row) else (item,)
+    if not any(__instance_state(value) is not None for value in values):
+        return query_result
+    if isinstance(item, Row):
+        return None
+    return replace(
+        query_result, items=[__snapshot(item) for item in query_result.items]
+    )
+
+
+def attach_result(session: Any, query_result: QueryResult) -> QueryResult:
+    """Return `query_result` with detached entities merged into `session`."""
+    if not query_result.items or not isinstance(query_result.items[0], _EntitySnapshot):
+        return query_result
+    # Nothing is loaded, so the sync session of an `AsyncSession` can be used.
+    sync_session: Any = getattr(session, "sync_session", session)
+    return replace(
+        query_result,
+        items=[__restore(sync_session, item) for item in query_result.items],
+    )
+
+
+def __instance_state(value: Any) -> Any:
+    state: Any = inspect(value, raiseerr=False)
+    return state if isinstance(state, InstanceState) else None
+
+
+def __snapshot(instance: Any) -> _EntitySnapshot:
+    state: Any = inspect(instance)
+    return _EntitySnapshot(
+        state.key,
+        {
+            key: state.dict[key]
+            for key in state.mapper.column_attrs.keys()
+            if key in state.dict
+        },
+    )
+
+
+def __restore(session: Any, snapshot: _EntitySnapshot) -> Any:
+    existing: Any = session.identity_map.get(snapshot.identity_key)
+    if existing is not None:
+        return existing
+    instance: Any = inspect(snapshot.identity_key[0]).class_manager.new_instance()
+    for key, value in snapshot.values.items():
+        set_committed_value(instance, key, value)
+    make_transient_to_detached(instance)
+    return session.merge(instance, load=False)
+
+
+def execute_filter_result(
+    session: Any,
+    stmt: Any,
+    filter_result: FilterResult,
+    count_strategy: CountStrategyEnum | None = None,
+    count_cap: int = 1000,
+) -> QueryResult:
+    if filter_result.empty:
+        return __empty_query_result(filter_result, count_strategy)
+    page_stmt, params, limit, single_entity = __prepare_page(
+        stmt, filter_result, count_strategy
+    )
+    page: Any = session.execute(page_stmt, params)
+    count_stmt: Any = __build_count_query(
+        stmt, filter_result, count_strategy, count_cap
+    )
+    count: int | None = (
+        session.execute(count_stmt, params).scalar_one()
+        if count_stmt is not None
+        else None
+    )
+    return __build_query_result(
+        page, single_entity, count, filter_result, limit, count_strategy, count_cap
+    )
+
+
+async def aexecute_filter_result(
+    session: Any,
+    stmt: Any,
+    filter_result: FilterResult,
+    count_strategy: CountStrategyEnum | None = None,
+    count_cap: int = 1000,
+    count_session: Any = None,
+) -> QueryResult:
+    """Async variant of `execute_filter_result`, counting concurrently."""
+    if filter_result.empty:
+        return __empty_query_result(filter_result, count_strategy)
+    page_stmt, params, limit, single_entity = __prepare_page(
+        stmt, filter_result, count_strategy
+    )
+    count_stmt: Any = __build_count_query(
+        stmt, filter_result, count_strategy, count_cap
+    )
+    if count_stmt is None:
+        page: Any = await session.execute(page_stmt, params)
+        count: Any = None
+    elif count_session is not None:
+        page, count = await asyncio.gather(
+            session.execute(page_stmt, params),
+            count_session.execute(count_stmt, params),
+        )
+    elif isinstance(getattr(session, "bind", None), AsyncEngine):
+        async with AsyncSession(session.bind) as count_session:
+            page, count = await asyncio.gather(
+                session.execute(page_stmt, params),
+                count_session.execute(count_stmt, params),
+            )
+    else:
+        page = await session.execute(page_stmt, params)
+        count = await session.execute(count_stmt, params)
+    return __build_query_result(
+        page,
+        single_entity,
+        count.scalar_one() if count is not None else None,
+        filter_result,
+        limit,
+        count_strategy,
+        count_cap,
+    )
+
+
+def __apply_selection(stmt: Any, filter_result: FilterResult) -> Any:
+    if filter_result.selected_columns:
+        return stmt.with_only_columns(
+            *filter_result.selected_columns, maintain_column_froms=True
+        )
+    if filter_result.load_options:
+        return stmt.options(*filter_result.load_options)
+    return stmt
+
+
+def __build_conditions(filter_result: FilterResult) -> list[Any]:
+    conditions: list[Any] = list(filter_result.filters or ())
+    if filter_result.q_search is not None:
+        conditions.append(filter_result.q_search)
+    pagination = filter_result.pagination
+    if pagination is not None and pagination.seek is not None:
+        conditions.append(pagination.seek)
+    return conditions
+
+
+def __build_count_query(
+    stmt: Any,
+    filter_result: FilterResult,
+    count_strategy: CountStrategyEnum | None,
+    count_cap: int,
+) -> Any:
+    if count_strategy == CountStrategyEnum.EXACT:
+        return build_count_statement(stmt, filter_result)
+    if count_strategy == CountStrategyEnum.CAPPED:
+        return build_count_statement(stmt, filter_result, cap=count_cap)
+    return None
+
+
+def __prepare_page(
+    stmt: Any, filter_result: FilterResult, count_strategy: CountStrategyEnum | None
+) -> tuple[Any, dict[str, Any] | None, int | None, bool]:
+    # One extra row tells whether a next page exists.
+    params: dict[str, Any] | None = filter_result.params
+    pagination = filter_result.pagination
+    limit: int | None = None
+    if (
+        pagination is not None
+        and pagination.limit is not None
+        and (
+            pagination.next_cursor is not None
+            or count_strategy == CountStrategyEnum.HAS_NEXT
+        )
+    ):
+        if params is not None and "limit" in params:
+            limit = params["limit"]
+            params = {**params, "limit": params["limit"] + 1}
+        else:
+            limit = pagination.limit
+            filter_result = replace(
+                filter_result, pagination=replace(pagination, limit=limit + 1)
+            )
+    page_stmt: Any = apply_filter_result(stmt, filter_result)
+    single_entity: bool = __selects_single_entity(page_stmt)
+    if count_strategy == CountStrategyEnum.WINDOW:
+        page_stmt = page_stmt.add_columns(func.count().over().label(WINDOW_COUNT_LABEL))
+    return page_stmt, params, limit, single_entity
+
+
+def __selects_single_entity(stmt: Any) -> bool:
+    descriptions: list[dict[str, Any]] = stmt.column_descriptions
+    return (
+        len(descriptions) == 1
+        and descriptions[0]["entity"] is not None
+        and descriptions[0]["expr"] is descriptions[0]["entity"]
+    )
+
+
+def __fetch_items(result: Any, single_entity: bool, unique: bool = False) -> list[Any]:
+    # Joined eager loads of collections repeat the parent row per child.
+    if unique:
+        result = result.unique()
+    if single_entity:
+        return list(result.scalars().all())
+    return list(result.all())
+
+
+def __fetch_items_with_window_count(
+    result: Any, single_entity: bool, unique: bool = False
+) -> tuple[list[Any], int | None]:
+    frozen: Any = result.freeze()
+    rows: list[Any] = frozen().all()
+    if not rows:
+        return [], None
+    columns: range = range(len(frozen().keys()) - 1)
+    return (
+        __fetch_items(frozen().columns(*columns), single_entity, unique),
+        rows[0][-1],
+    )
+
+
+def __build_query_result(
+    result: Any,
+    single_entity: bool,
+    count: int | None,
+    filter_result: FilterResult,
+    limit: int | None,
+    count_strategy: CountStrategyEnum | None,
+    count_cap: int,
+) -> QueryResult:
+    unique: bool = filter_result.load_options is not None
+    if count_strategy == CountStrategyEnum.WINDOW:
+        items, count = __fetch_items_with_window_count(result, single_entity, unique)
+        if count is None:
+            count = __empty_page_count(filter_result)
+    else:
+        items = __fetch_items(result, single_entity, unique)
+    total_capped: bool = (
+        count_strategy == CountStrategyEnum.CAPPED
+        and count is not None
+        and count > count_cap
+    )
+    query_result: QueryResult = QueryResult(
+        items=items,
+        total=count_cap if total_capped else count,
+        total_capped=total_capped,
+    )
+    if limit is not None:
+        query_result = __with_next_page(query_result, filter_result, limit)
+    if filter_result.as_rows:
+        query_result = replace(
+            query_result, items=__row_items(query_result.items, filter_result)
+        )
+    return query_result
+
+
+def __row_items(rows: list[Any], filter_result: FilterResult) -> list[Any]:
+    # Converted last, so the next cursor is still read from the raw row.
+    if not rows:
+        return []
+    # Cursor keys come last and are left out.
+    keys: tuple[str, ...] = tuple(
+        key for key in rows[0]._fields if not key.startswith(CURSOR_LABEL_PREFIX)
+    )
+    items: list[Any] = [dict(zip(keys, row)) for row in rows]
+    row_factory: Any = filter_result.row_factory
+    if row_factory is None:
+        return items
+    return [row_factory(**item) for item in items]
+
+
+def __empty_query_result(
+    filter_result: FilterResult, count_strategy: CountStrategyEnum | None
+) -> QueryResult:
+    # Unsatisfiable filters: the result is known without running a query.
+    pagination = filter_result.pagination
+    probes_next_page: bool = pagination is not None and (
+        pagination.next_cursor is not None
+        or count_strategy == CountStrategyEnum.HAS_NEXT
+    )
+    return QueryResult(
+        items=[],
+        total=(
+            0
+            if count_strategy is not None
+            and count_strategy != CountStrategyEnum.HAS_NEXT
+            else None
+        ),
+        has_next=False if probes_next_page else None,
+    )
+
+
+def __empty_page_count(filter_result: FilterResult) -> int | None:
+    # Past the first page the window count is unknown.
+    pagination = filter_result.pagination
+    if pagination is None or not pagination.offset and pagination.seek is None:
+        return 0
+    return None
+
+
+def __with_next_page(
+    query_result: QueryResult, filter_result: FilterResult, limit: int
+) -> QueryResult:
+    has_next: bool = len(query_result.items) > limit
+    items: list[Any] = query_result.items[:limit]
+    next_cursor: Any = (
+        filter_result.pagination.next_cursor  # type: ignore
+        if filter_result.pagination is not None
+        else None
+    )
+    return replace(
+        query_result,
+        items=items,
+        has_next=has_next,
+        next_cursor=(
+            next_cursor(items[-1]) if has_next and next_cursor is not None else None
+        ),
+    )
@@ -1,7 +1,12 @@
 from fastapi_advanced_filters.filter_metaclass.helpers.field_criteria import (
+    as_query_parameter,
     attrs_to_field_criteria,
+    field_annotations_from_model,
     from_field_criteria_to_attr,
 )
+from fastapi_advanced_filters.filter_metaclass.helpers.filter_plan import (
+    generate_filter_plan,
+)
 from fastapi_advanced_filters.filter_metaclass.helpers.pagination import (
     generate_annotations_for_pagination,
 )
@@ -1,14 +1,47 @@
-from typing import Annotated, Any, Dict, Generator, TypeVar, Union
-
+from datetime import date, datetime
+from functools import cache
+from inspect import Parameter
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Generator,
+    Hashable,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AfterValidator, BeforeValidator
 from pydantic.fields import Field, FieldInfo
 
 try:
+    from sqlalchemy import inspect as sa_inspect
     from sqlalchemy.orm.attributes import InstrumentedAttribute
 except ImportError:  # pragma: no cover
+    sa_inspect = None  # type: ignore
     InstrumentedAttribute = TypeVar("InstrumentedAttribute")  # type: ignore
 
-from fastapi_advanced_filters.data_classes import FieldCriteria
+from fastapi_advanced_filters.data_classes import FieldCriteria, TermLimits
 from fastapi_advanced_filters.enums import OperationEnum
+from fastapi_advanced_filters.utils import split_comma_separated
+
+_LIST_OPS: tuple[OperationEnum, ...] = (
+    OperationEnum.IN,
+    OperationEnum.NOTIN,
+    OperationEnum.CONT,
+)
+_TYPED_OPS: tuple[OperationEnum, ...] = (*_LIST_OPS, OperationEnum.BTW)
+
+# Attribute of a model holding its generated annotations, per
+# `(fields, prefix, op)`. The annotations reference the model's columns, so a
+# module-level mapping (even weakly keyed) would keep every model alive; kept
+# on the model, they are collected with it.
+_MODEL_ANNOTATIONS_ATTR: str = "__filter_annotations__"
 
 
 def attrs_to_field_criteria(
@@ -43,6 +76,48 @@ def attrs_to_field_criteria(
         )
 
 
+def field_annotations_from_model(
+    model_cls: type,
+    fields: list[Any] | str | None = None,
+    prefix: str | None = None,
+    op: tuple[OperationEnum, ...] | None = None,
+) -> Mapping[str, Any]:
+    """Return the filter field annotations generated for `model_cls`."""
+    key: Hashable = (
+        fields if fields is None or isinstance(fields, str) else tuple(fields),
+        prefix,
+        op,
+    )
+    model_annotations: dict[
+        Hashable, Mapping[str, Any]
+    ] | None = model_cls.__dict__.get(_MODEL_ANNOTATIONS_ATTR)
+    if model_annotations is None:
+        model_annotations = {}
+        setattr(model_cls, _MODEL_ANNOTATIONS_ATTR, model_annotations)
+    try:
+        cached: Mapping[str, Any] | None = model_annotations.get(key)
+    except TypeError:
+        return __generate_field_annotations(model_cls, fields, prefix, op)
+    if cached is None:
+        cached = MappingProxyType(
+            __generate_field_annotations(model_cls, fields, prefix, op)
+        )
+        model_annotations[key] = cached
+    return cached
+
+
+def __generate_field_annotations(
+    model_cls: type,
+    fields: list[Any] | str | None,
+    prefix: str | None,
+    op: tuple[OperationEnum, ...] | None,
+) -> dict[str, Any]:
+    annotations: dict[str, Any] = {}
+    for field in attrs_to_field_criteria(model_cls, fields, prefix, op):
+        annotations.update(from_field_criteria_to_attr(field))
+    return annotations
+
+
 def __type_from_attr(attr: Any) -> type:
     if hasattr(attr, "property") and hasattr(attr.property, "columns"):
         column = attr.property.columns[0]
@@ -52,14 +127,17 @@ def __type_from_attr(attr: Any) -> type:
 
 def __get_all_fields_from_model(model_cls: type) -> list[str]:
     assert model_cls is not None, "Model class cannot be None."
+    mapper: Any = sa_inspect(model_cls, raiseerr=False) if sa_inspect else None
+    if mapper is not None and hasattr(mapper, "column_attrs"):
+        # Column attributes only: relationships have no column to compare.
+        return sorted(
+            prop.key for prop in mapper.column_attrs if not prop.key.startswith("_")
+        )
     return [
         attr
         for attr in dir(model_cls)
         if not attr.startswith("_")
-        and (
-            isinstance(getattr(model_cls, attr), FieldInfo)
-            or isinstance(getattr(model_cls, attr), InstrumentedAttribute)
-        )
+        and isinstance(getattr(model_cls, attr), (FieldInfo, InstrumentedAttribute))
     ]
 
 
@@ -89,13 +167,13 @@ def from_field_criteria_to_attr(
         is_required: bool = (
             field_criteria.required_op is not None and op in field_criteria.required_op
         )
-        kwargs: dict[str, Any] = field_criteria.fields_kwargs.copy()
+        kwargs: dict[str, Any] = dict(field_criteria.fields_kwargs)
         if is_required:
             kwargs["default"] = ...  # type: ignore
         else:
             kwargs["default"] = None
         fields[field_name] = Annotated[
-            Union[annotation_type, str, None],
+            __value_annotation(op, annotation_type, field_criteria.term_limits),
             Field(
                 alias=(field_criteria.get_alias_name(op)),
                 title=f"Filter by {field_criteria.name} with operation {op}",
@@ -106,3 +184,54 @@ def from_field_criteria_to_attr(
             field_criteria,
         ]
     return fields
+
+
+@cache
+def __value_annotation(
+    op: OperationEnum, annotation_type: type, term_limits: TermLimits | None = None
+) -> Any:
+    typed: Any = __typed_value_type(op, annotation_type)
+    # Accepts both `?age__in=1,2` and `?age__in=1&age__in=2`.
+    value: Any = (
+        Union[annotation_type, str]
+        if typed is None
+        else Annotated[typed, BeforeValidator(split_comma_separated)]
+    )
+    return Optional[with_term_limits(value, term_limits)]
+
+
+def __typed_value_type(op: OperationEnum, annotation_type: type) -> Any:
+    if op in _LIST_OPS:
+        return list[annotation_type]  # type: ignore[valid-type]
+    if op == OperationEnum.BTW:
+        # Whole dates are kept as dates, so a datetime range covers full days.
+        bound: Any = (
+            Union[date, datetime] if annotation_type is datetime else annotation_type
+        )
+        return tuple[bound, bound]
+    return None
+
+
+def with_term_limits(annotation: Any, term_limits: TermLimits | None) -> Any:
+    """Validate the values of `annotation` against `term_limits` when they
+    reject values out of limits; other limits skip the predicate instead."""
+    if term_limits is None or not term_limits.reject:
+        return annotation
+    return Annotated[annotation, AfterValidator(term_limits.validate)]
+
+
+def as_query_parameter(parameter: Parameter) -> Parameter:
+    """Mark the signature parameter of a list or range filter as a query one."""
+    annotation: Any = parameter.annotation
+    metadata: tuple[Any, ...] = (
+        get_args(annotation)[1:] if get_origin(annotation) is Annotated else ()
+    )
+    if not any(
+        isinstance(item, OperationEnum) and item in _TYPED_OPS for item in metadata
+    ):
+        return parameter
+    # Imported here: only FastAPI reads the signature, and importing it is
+    # slower than importing this package.
+    from fastapi import Query
+
+    return parameter.replace(annotation=Annotated[annotation, Query()])
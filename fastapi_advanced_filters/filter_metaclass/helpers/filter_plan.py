@@ -0,0 +1,258 @@
+from dataclasses import replace
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+from pydantic.fields import FieldInfo
+
+from fastapi_advanced_filters.data_classes import (
+    AttributePath,
+    FieldCriteria,
+    FilterPlanEntry,
+    TermLimits,
+)
+from fastapi_advanced_filters.enums import LogicalOperator, MatchModeEnum, OperationEnum
+
+BindOperation = tuple[Callable[[Any, str], Any], Callable[[Any, Any], Any]]
+Paths = tuple[AttributePath | None, ...]
+
+# Operations taking a `match_mode` keyword from `FieldCriteria.match_mode`.
+_MATCH_MODE_OPS: frozenset[OperationEnum] = frozenset(
+    {OperationEnum.LIKE, OperationEnum.ILIKE}
+)
+
+
+def generate_filter_plan(
+    model_fields: Mapping[str, FieldInfo],
+    op_mapping: Mapping[OperationEnum, Callable[..., Any]],
+    logical_op_mapping: Mapping[LogicalOperator, Callable[..., Any]],
+    bind_op_mapping: Mapping[OperationEnum, BindOperation] | None = None,
+    resolve_path: Callable[[Any], AttributePath | None] | None = None,
+) -> Mapping[str, FilterPlanEntry]:
+    """Resolve every filterable field of a model into a ready-to-run entry."""
+    plan: dict[str, FilterPlanEntry] = {}
+    for name, field in model_fields.items():
+        metadata = __get_filterable_field_metadata(field)
+        if metadata is None:
+            continue
+        op, field_criteria = metadata
+        field_criteria, paths = __resolve_paths(field_criteria, resolve_path)
+        operation, logical_op = __bind_operation(
+            op, field_criteria, op_mapping, logical_op_mapping, paths
+        )
+        expression, prepare = (
+            __bind_parameter(
+                name, op, field_criteria, bind_op_mapping, logical_op, paths
+            )
+            if bind_op_mapping is not None and operation is not None
+            else (None, None)
+        )
+        plan[name] = FilterPlanEntry(
+            name=name,
+            op=op,
+            field_criteria=field_criteria,
+            operation=__with_term_limits(operation, field_criteria),
+            logical_op=logical_op,
+            default=field.default,
+            position=len(plan),
+            expression=expression,
+            prepare=__with_term_limits(prepare, field_criteria),
+            joins=tuple(
+                join for path in paths if path is not None for join in path.joins
+            ),
+            to_many=any(path is not None and path.exists for path in paths),
+        )
+    return MappingProxyType(plan)
+
+
+def __get_filterable_field_metadata(
+    field: FieldInfo,
+) -> tuple[OperationEnum, FieldCriteria] | None:
+    if (
+        hasattr(field, "metadata")
+        and field.metadata
+        and isinstance(field.metadata, list)
+        and len(field.metadata) == 2
+    ) and (
+        (operation := field.metadata[0])
+        and (field_metadata := field.metadata[1])
+        and isinstance(field_metadata, FieldCriteria)
+    ):
+        return operation, field_metadata
+    return None
+
+
+def __bind_operation(
+    op: OperationEnum,
+    field: FieldCriteria,
+    op_mapping: Mapping[OperationEnum, Callable[..., Any]],
+    logical_op_mapping: Mapping[LogicalOperator, Callable[..., Any]],
+    paths: Paths = (),
+) -> tuple[Callable[[Any], Any] | None, Callable[..., Any] | None]:
+    assert (
+        field.model_attr is not None
+        or field.custom_filter_per_op is not None
+        or field.model_attrs_with_logical_op is not None
+    ), (
+        f"Field '{field.name}' must have either 'model_attr', "
+        f"'custom_filter_per_op' or 'model_attrs_with_logical_op' defined."
+    )
+    if field.custom_filter_per_op and callable(field.custom_filter_per_op):
+        return partial(field.custom_filter_per_op, op), None
+    operation: Callable[..., Any] | None = op_mapping.get(op, None)
+    if operation is None:
+        return None, None
+    operation = __with_match_mode(operation, op, field)
+    if field.model_attr is not None:
+        assert isinstance(field.model_attr, (list, tuple)) is False, (
+            f"Field '{field.name}' has multiple 'model_attr' defined. "
+            f"Use 'model_attrs_with_logical_op' instead."
+        )
+        return __bind_column(operation, field.model_attr, __path_at(paths, 0)), None
+    return __bind_logical_operation(operation, field, logical_op_mapping, paths)
+
+
+def __bind_column(
+    operation: Callable[..., Any], model_attr: Any, path: AttributePath | None = None
+) -> Callable[..., Any]:
+    bound: Callable[..., Any] = __bind_to(operation, model_attr)
+    if path is None or path.exists is None:
+        return bound
+    return partial(__exists_condition, path.exists, bound)
+
+
+def __bind_to(operation: Callable[..., Any], model_attr: Any) -> Callable[..., Any]:
+    # Operations exposing `bind(model_attr)` resolve their per-column setup now.
+    bind: Callable[[Any], Callable[..., Any]] | None = getattr(operation, "bind", None)
+    return bind(model_attr) if bind is not None else partial(operation, model_attr)
+
+
+def __exists_condition(
+    exists: Callable[[Any], Any], operation: Callable[[Any], Any], value: Any
+) -> Any:
+    condition: Any = operation(value)
+    return exists(condition) if condition is not None else None
+
+
+def __path_at(paths: Paths, position: int) -> AttributePath | None:
+    return paths[position] if position < len(paths) else None
+
+
+def __resolve_paths(
+    field: FieldCriteria, resolve_path: Callable[[Any], AttributePath | None] | None
+) -> tuple[FieldCriteria, Paths]:
+    # Custom filters get the raw value, so their attributes are left as is.
+    if resolve_path is None or field.custom_filter_per_op is not None:
+        return field, ()
+    if field.model_attr is not None:
+        path: AttributePath | None = resolve_path(field.model_attr)
+        if path is None:
+            return field, ()
+        return replace(field, model_attr=path.model_attr), (path,)
+    model_attrs_with_logical_op: Any = field.model_attrs_with_logical_op
+    if not (
+        isinstance(model_attrs_with_logical_op, (list, tuple))
+        and isinstance(model_attrs_with_logical_op[0], (list, tuple))
+    ):
+        return field, ()
+    model_attrs, *rest = model_attrs_with_logical_op
+    paths: Paths = tuple(resolve_path(model_attr) for model_attr in model_attrs)
+    if all(path is None for path in paths):
+        return field, ()
+    columns: tuple[Any, ...] = tuple(
+        model_attr if path is None else path.model_attr
+        for model_attr, path in zip(model_attrs, paths)
+    )
+    return replace(field, model_attrs_with_logical_op=(columns, *rest)), paths
+
+
+def __bind_logical_operation(
+    operation: Callable[..., Any],
+    field: FieldCriteria,
+    logical_op_mapping: Mapping[LogicalOperator, Callable[..., Any]],
+    paths: Paths = (),
+) -> tuple[Callable[[Any], Any], Callable[..., Any]]:
+    assert isinstance(field.model_attrs_with_logical_op, (tuple, list)), (
+        f"Field '{field.name}' must have 'model_attrs_with_logical_op' "
+        f"defined as a list."
+    )
+    model_attrs, logical_operator = field.model_attrs_with_logical_op
+    assert isinstance(model_attrs, (list, tuple)), (
+        f"Field '{field.name}' must have list of 'model_attrs' defined in "
+        f"'model_attrs_with_logical_op'."
+    )
+    assert (
+        isinstance(logical_operator, LogicalOperator)
+        and logical_op_mapping.get(logical_operator, None) is not None
+    ), (
+        f"Field '{field.name}' must have 'logical_operator' defined in "
+        f"'model_attrs_with_logical_op'."
+    )
+    logical_op: Callable[..., Any] = logical_op_mapping[logical_operator]
+    operations = tuple(
+        __bind_column(operation, model_attr, __path_at(paths, position))
+        for position, model_attr in enumerate(model_attrs)
+    )
+    return partial(__combine_operations, operations, logical_op), logical_op
+
+
+def __bind_parameter(
+    name: str,
+    op: OperationEnum,
+    field: FieldCriteria,
+    bind_op_mapping: Mapping[OperationEnum, BindOperation],
+    logical_op: Callable[..., Any] | None,
+    paths: Paths = (),
+) -> tuple[Any, Callable[[Any], Any] | None]:
+    if field.custom_filter_per_op is not None or op not in bind_op_mapping:
+        return None, None
+    build, prepare = bind_op_mapping[op]
+    model_attrs: Any = (
+        (field.model_attr,)
+        if field.model_attr is not None
+        else field.model_attrs_with_logical_op[0]  # type: ignore
+    )
+    if not model_attrs:
+        return None, None
+    conditions: list[Any] = [build(model_attr, name) for model_attr in model_attrs]
+    if any(condition is None for condition in conditions):
+        return None, None
+    for position, condition in enumerate(conditions):
+        if (path := __path_at(paths, position)) is not None and path.exists:
+            conditions[position] = path.exists(condition)
+    expression: Any = (
+        logical_op(*conditions) if logical_op is not None else conditions[0]
+    )
+    return expression, __bind_to(__with_match_mode(prepare, op, field), model_attrs[0])
+
+
+def __with_match_mode(
+    operation: Callable[..., Any], op: OperationEnum, field: FieldCriteria
+) -> Callable[..., Any]:
+    if op not in _MATCH_MODE_OPS or field.match_mode == MatchModeEnum.CONTAINS:
+        return operation
+    return partial(operation, match_mode=field.match_mode)
+
+
+def __with_term_limits(
+    operation: Callable[[Any], Any] | None, field: FieldCriteria
+) -> Callable[[Any], Any] | None:
+    if operation is None or field.term_limits is None:
+        return operation
+    return partial(__limited_operation, operation, field.term_limits)
+
+
+def __limited_operation(
+    operation: Callable[[Any], Any], term_limits: TermLimits, value: Any
+) -> Any:
+    # `None` skips the predicate, like an unparsable value.
+    return operation(value) if term_limits.allows(value) else None
+
+
+def __combine_operations(
+    operations: tuple[Callable[[Any], Any], ...],
+    logical_op: Callable[..., Any],
+    value: Any,
+) -> Any:
+    conditions: list[Any] = [operation(value) for operation in operations]
+    return logical_op(*conditions) if conditions else None
@@ -1,8 +1,23 @@
 from typing import Annotated, Any, Dict, Optional
 
+from pydantic import PlainValidator
 from pydantic.fields import Field
 
+from fastapi_advanced_filters.data_classes import SortBy
 from fastapi_advanced_filters.enums import PaginationEnum
+from fastapi_advanced_filters.utils import validate_cursor_schema
+
+__LIMIT_ANNOTATION: Any = Annotated[
+    int,
+    Field(
+        default=100,
+        alias="limit",
+        title="Limit the number of results",
+        description="Limit the number of results returned. Default is 100.",
+        ge=1,
+        le=1000,
+    ),
+]
 
 
 def generate_annotations_for_pagination(
@@ -14,19 +29,34 @@ def generate_annotations_for_pagination(
         or not isinstance(filter_config_cls.pagination, PaginationEnum)
     ):
         return None
-    if filter_config_cls.pagination == PaginationEnum.OFFSET_BASED:
+    if filter_config_cls.pagination == PaginationEnum.CURSOR_BASED:
+        cursor_secret: str | bytes | None = getattr(
+            filter_config_cls, "cursor_secret", None
+        )
+        assert cursor_secret, (
+            "'cursor_secret' must be defined in FilterConfig to use "
+            "cursor-based pagination."
+        )
+        __assert_cursor_sort_keys(getattr(filter_config_cls, "sort_by", None))
         return {
-            "limit": Annotated[
-                int,
+            "limit": __LIMIT_ANNOTATION,
+            "cursor": Annotated[
+                str | None,
                 Field(
-                    default=100,
-                    alias="limit",
-                    title="Limit the number of results",
-                    description="Limit the number of results returned. Default is 100.",
-                    ge=1,
-                    le=1000,
+                    default=None,
+                    alias="cursor",
+                    title="Cursor of the page to fetch",
+                    description=(
+                        "Opaque cursor returned with the previous page. Omit it to"
+                        " fetch the first page."
+                    ),
                 ),
+                PlainValidator(validate_cursor_schema(cursor_secret)),
             ],
+        }
+    if filter_config_cls.pagination == PaginationEnum.OFFSET_BASED:
+        return {
+            "limit": __LIMIT_ANNOTATION,
             "offset": Annotated[
                 int,
                 Field(
@@ -61,3 +91,12 @@ def generate_annotations_for_pagination(
             ),
         ],
     }
+
+
+def __assert_cursor_sort_keys(sort_by: SortBy | None) -> None:
+    # Cursor values are read from page items, which lack joined columns.
+    for name, model_attr in sort_by.model_attrs.items() if sort_by else ():
+        assert not (isinstance(model_attr, str) and "." in model_attr), (
+            f"Cannot sort by the relationship path '{model_attr}' ('{name}') "
+            f"with cursor-based pagination."
+        )
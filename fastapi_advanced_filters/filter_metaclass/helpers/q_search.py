@@ -2,19 +2,28 @@ from typing import Annotated, Any, Dict, Optional
 
 from pydantic.fields import Field
 
-from fastapi_advanced_filters.data_classes import AdvancedQSearch, QSearch
+from fastapi_advanced_filters.data_classes import (
+    AdvancedQSearch,
+    FullTextQSearch,
+    QSearch,
+)
+from fastapi_advanced_filters.filter_metaclass.helpers.field_criteria import (
+    with_term_limits,
+)
 
 
 def generate_annotations_for_qsearch(
     filter_config_cls: type,
 ) -> Optional[Dict[str, Any]]:
     if hasattr(filter_config_cls, "q_search") and isinstance(
-        filter_config_cls.q_search, (QSearch, AdvancedQSearch)
+        filter_config_cls.q_search, (QSearch, AdvancedQSearch, FullTextQSearch)
     ):
-        q_search: QSearch | AdvancedQSearch = filter_config_cls.q_search
+        q_search: QSearch | AdvancedQSearch | FullTextQSearch = (
+            filter_config_cls.q_search
+        )
         return {
             "q_search": Annotated[
-                str | None,
+                Optional[with_term_limits(str, q_search.term_limits)],
                 Field(
                     default=None,
                     title="Search by query string",
@@ -1,18 +1,44 @@
-from typing import Any
+from inspect import Signature
+from typing import Any, Mapping
 
 from pydantic import BaseModel
 
+from fastapi_advanced_filters.data_classes import FilterPlanEntry
 from fastapi_advanced_filters.enums import OperationEnum
 from fastapi_advanced_filters.filter_metaclass.helpers import (
-    attrs_to_field_criteria,
+    as_query_parameter,
+    field_annotations_from_model,
     from_field_criteria_to_attr,
     generate_annotations_for_pagination,
     generate_annotations_for_qsearch,
     generate_annotations_for_selectable_fields,
     generate_annotations_for_sortable_fields,
+    generate_filter_plan,
 )
 
 
+class _QuerySignature:
+    """Class signature read by FastAPI's `Depends()`: the Pydantic one, with
+    list and range filters marked as query parameters. Built on first use."""
+
+    def __init__(self, pydantic_signature: Any) -> None:
+        self.pydantic_signature: Any = pydantic_signature
+        self.signature: Signature | None = None
+
+    def __get__(self, instance: Any, owner: type) -> Signature:
+        if instance is not None:
+            raise AttributeError("'__signature__' is only available on the class.")
+        if self.signature is None:
+            signature: Signature = self.pydantic_signature.__get__(None, owner)
+            self.signature = signature.replace(
+                parameters=[
+                    as_query_parameter(parameter)
+                    for parameter in signature.parameters.values()
+                ]
+            )
+        return self.signature
+
+
 class FilterMetaClass(type(BaseModel)):  # type: ignore
     """Metaclass to dynamically create filter fields from configuration.
 
@@ -38,24 +64,62 @@ class FilterMetaClass(type(BaseModel)):  # type: ignore
                 attrs["__annotations__"].update(
                     mcs.generate_annotations_for_filters(attrs["FilterConfig"])
                 )
-        return super().__new__(mcs, name, bases, attrs, **kwargs)
+            if getattr(attrs["FilterConfig"], "defer_build", False):
+                attrs["model_config"] = {
+                    **attrs.get("model_config", {}),
+                    "defer_build": True,
+                }
+        cls = super().__new__(mcs, name, bases, attrs, **kwargs)
+        if "__signature__" in cls.__dict__:
+            cls.__signature__ = _QuerySignature(cls.__dict__["__signature__"])
+        # Deferred models get their schema and plan on first use (or `warm_up`).
+        if not cls.model_config.get("defer_build", False):
+            cls.__filter_plan__ = mcs.generate_plan_for_filters(cls)
+        return cls
+
+    def generate_plan_for_filters(
+        filter_cls: type,
+    ) -> Mapping[str, FilterPlanEntry]:
+        # Built from the final `model_fields` so inherited and hand-written
+        # filter fields are part of the plan as well as generated ones.
+        filter_config_cls: type | None = getattr(filter_cls, "FilterConfig", None)
+        if hasattr(filter_cls, "resolve_declared_paths"):
+            filter_cls.resolve_declared_paths()  # type: ignore
+        return generate_filter_plan(
+            model_fields=getattr(filter_cls, "model_fields", {}),
+            op_mapping=(
+                filter_cls.get_op_mapping()  # type: ignore
+                if hasattr(filter_cls, "get_op_mapping")
+                else getattr(filter_cls, "__op_mapping__", {})
+            ),
+            logical_op_mapping=getattr(filter_cls, "__logical_op_mapping__", {}),
+            bind_op_mapping=(
+                getattr(filter_cls, "__bind_op_mapping__", None)
+                if getattr(filter_config_cls, "bind_params", False)
+                else None
+            ),
+            resolve_path=getattr(filter_cls, "resolve_attribute_path", None),
+        )
 
     def generate_annotations_for_filters(  # noqa: C901
         filter_config_cls: type,
     ) -> dict[str, Any]:
         annotations: dict[str, Any] = {}
         if hasattr(filter_config_cls, "fields"):
-            fields = filter_config_cls.fields
             if hasattr(filter_config_cls, "model"):
-                fields = attrs_to_field_criteria(
-                    model_cls=filter_config_cls.model,
-                    fields=filter_config_cls.fields,
-                    prefix=getattr(filter_config_cls, "prefix", None),
-                    op=getattr(filter_config_cls, "default_op", (OperationEnum.EQ,)),
+                annotations.update(
+                    field_annotations_from_model(
+                        model_cls=filter_config_cls.model,
+                        fields=filter_config_cls.fields,
+                        prefix=getattr(filter_config_cls, "prefix", None),
+                        op=getattr(
+                            filter_config_cls, "default_op", (OperationEnum.EQ,)
+                        ),
+                    )
                 )
-
-            for field in fields:
-                annotations.update(from_field_criteria_to_attr(field))
+            else:
+                for field in filter_config_cls.fields:
+                    annotations.update(from_field_criteria_to_attr(field))
         if q_search_annotation := generate_annotations_for_qsearch(filter_config_cls):
             annotations.update(q_search_annotation)
         if selectable_annotation := generate_annotations_for_selectable_fields(
@@ -1,5 +1,6 @@
 from fastapi_advanced_filters.filters.base import BaseFilter
 from fastapi_advanced_filters.filters.mixins import (
+    ExecutionMixin,
     FilterMixin,
     PaginationMixin,
     QSearchMixin,
@@ -14,4 +15,5 @@ __all__ = [
     "SelectMixin",
     "QSearchMixin",
     "PaginationMixin",
+    "ExecutionMixin",
 ]
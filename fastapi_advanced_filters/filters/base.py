@@ -1,17 +1,43 @@
-from typing import Any, Callable
+import hashlib
+from dataclasses import replace
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
-from fastapi_advanced_filters.data_classes import FilterResult
+try:
+    from sqlalchemy import false, select
+except ImportError:  # pragma: no cover
+    false = select = None  # type: ignore
+
+from fastapi_advanced_filters.caching import StatementCache
+from fastapi_advanced_filters.data_classes import (
+    AttributePath,
+    FilterResult,
+    Pagination,
+    QueryResult,
+)
 from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum, OrderEnum
+from fastapi_advanced_filters.executors import (
+    aexecute_filter_result,
+    apply_filter_result,
+    attach_result,
+    build_count_statement,
+    detach_result,
+    execute_filter_result,
+)
 from fastapi_advanced_filters.filter_metaclass import FilterMetaClass
 from fastapi_advanced_filters.filters.mixins import (
+    ExecutionMixin,
     FilterMixin,
     PaginationMixin,
     QSearchMixin,
     SelectMixin,
     SortingMixin,
 )
+from fastapi_advanced_filters.operation_mapping import (
+    SQLALCHEMY_BIND_OP_MAPPING as BIND_OP_MAPPING,
+)
 from fastapi_advanced_filters.operation_mapping import (
     SQLALCHEMY_LOGICAL_OP_MAPPING as LOGICAL_OP_MAPPING,
 )
@@ -21,6 +47,21 @@ from fastapi_advanced_filters.operation_mapping import (
 from fastapi_advanced_filters.operation_mapping import (
     SQLALCHEMY_SORTING_MAPPING as SORTING_MAPPING,
 )
+from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
+    bind_param,
+    cursor_ordering,
+    full_text_rank,
+    keyset_condition,
+    load_options,
+    primary_key_attrs,
+    resolve_attribute_path,
+    union_conditions,
+)
+from fastapi_advanced_filters.utils import freeze
+
+T = TypeVar("T")
+
+_PAGINATION_FIELDS: tuple[str, ...] = ("limit", "offset", "page", "page_size", "cursor")
 
 
 class BaseFilter(
@@ -30,6 +71,7 @@ class BaseFilter(
     SelectMixin,
     QSearchMixin,
     PaginationMixin,
+    ExecutionMixin,
     metaclass=FilterMetaClass,
 ):
     # Explicit types to satisfy mypy against the mixins' expectations
@@ -38,17 +80,238 @@ class BaseFilter(
     __logical_op_mapping__: dict[
         LogicalOperator, Callable[..., Any]
     ] = LOGICAL_OP_MAPPING
+    __bind_op_mapping__: dict[
+        OperationEnum, tuple[Callable[[Any, str], Any], Callable[[Any, Any], Any]]
+    ] = BIND_OP_MAPPING
+    __bind_param__: Callable[[str], Any] = staticmethod(bind_param)
+    __keyset_condition__: Callable[
+        [list[tuple[Any, OrderEnum]], list[Any]], Any
+    ] = staticmethod(keyset_condition)
+    __cursor_ordering__: Callable[[Any, OrderEnum], list[Any]] = staticmethod(
+        cursor_ordering
+    )
+    __primary_key_attrs__: Callable[[Any], list[Any]] = staticmethod(primary_key_attrs)
+    __full_text_rank__: Callable[..., Any] = staticmethod(full_text_rank)
+    __union_conditions__: Callable[[list[Any], list[Any]], Any] = staticmethod(
+        union_conditions
+    )
+    __resolve_attribute_path__: Callable[..., AttributePath] = staticmethod(
+        resolve_attribute_path
+    )
+    __load_options__: Callable[..., tuple[Any, ...]] = staticmethod(load_options)
+    __select__: Callable[..., Any] = staticmethod(select)
+    __false_condition__: Callable[[], Any] = staticmethod(false)
+    __apply_filter_result__: Callable[[Any, FilterResult], Any] = staticmethod(
+        apply_filter_result
+    )
+    __build_count_statement__: Callable[[Any, FilterResult], Any] = staticmethod(
+        build_count_statement
+    )
+    __execute_filter_result__: Callable[..., QueryResult] = staticmethod(
+        execute_filter_result
+    )
+    __aexecute_filter_result__: Callable[..., Awaitable[QueryResult]] = staticmethod(
+        aexecute_filter_result
+    )
+    __detach_result__: Callable[[QueryResult], QueryResult | None] = staticmethod(
+        detach_result
+    )
+    __attach_result__: Callable[[Any, QueryResult], QueryResult] = staticmethod(
+        attach_result
+    )
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         validate_assignment=False,
     )
 
+    @classmethod
+    def get_op_mapping(cls) -> dict[OperationEnum, Callable[..., Any]]:
+        # `FilterConfig.in_offload_threshold` overrides the list length above
+        # which IN/NOTIN switch to a derived-table join (`None` disables it).
+        filter_config_cls: type | None = getattr(cls, "FilterConfig", None)
+        if not hasattr(filter_config_cls, "in_offload_threshold"):
+            return cls.__op_mapping__
+        threshold: int | None = filter_config_cls.in_offload_threshold  # type: ignore
+        op_mapping: dict[OperationEnum, Callable[..., Any]] = dict(cls.__op_mapping__)
+        for op in (OperationEnum.IN, OperationEnum.NOTIN):
+            if op in op_mapping:
+                op_mapping[op] = cls.__with_offload_threshold(op_mapping[op], threshold)
+        return op_mapping
+
+    @staticmethod
+    def __with_offload_threshold(
+        operation: Callable[..., Any], threshold: int | None
+    ) -> Callable[..., Any]:
+        # Column operations keep their `bind`, so the plan still binds them.
+        with_options: Callable[..., Any] | None = getattr(
+            operation, "with_options", None
+        )
+        if with_options is not None:
+            return with_options(offload_threshold=threshold)
+        return partial(operation, offload_threshold=threshold)
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Build the schema and filter plan of this class and its subclasses."""
+        pending: list[type[BaseFilter]] = [cls]
+        seen: set[type[BaseFilter]] = set()
+        while pending:
+            filter_cls: type[BaseFilter] = pending.pop()
+            if filter_cls in seen:
+                continue
+            seen.add(filter_cls)
+            if not filter_cls.__pydantic_complete__:
+                filter_cls.model_rebuild()
+            filter_cls.get_filter_plan()
+            pending.extend(filter_cls.__subclasses__())
+
+    @classmethod
+    def uses_bind_params(cls) -> bool:
+        return bool(getattr(getattr(cls, "FilterConfig", None), "bind_params", False))
+
+    @classmethod
+    def get_statement_cache(cls) -> StatementCache:
+        cache: StatementCache | None = cls.__dict__.get("__statement_cache__")
+        if cache is None:
+            cache = StatementCache(
+                maxsize=getattr(
+                    getattr(cls, "FilterConfig", None), "statement_cache_size", 128
+                )
+            )
+            cls.__statement_cache__ = cache
+        return cache
+
+    @classmethod
+    def get_cached_statement(
+        cls, filter_result: FilterResult, build: Callable[[FilterResult], T]
+    ) -> T:
+        """Return the statement built by `build` for this result's shape."""
+        if filter_result.shape_key is None:
+            return build(filter_result)
+        return cls.get_statement_cache().get_or_build(
+            (build, filter_result.shape_key), partial(build, filter_result)
+        )
+
+    def canonical_form(self) -> Hashable:
+        """Return a hashable form identifying the semantics of this request."""
+        return (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self.get_canonical_filters(),
+            freeze(getattr(self, "q_search", None)),
+            freeze(getattr(self, "sorting", None) or None),
+            freeze(getattr(self, "select", None) or None),
+            tuple(
+                (name, freeze(getattr(self, name)))
+                for name in _PAGINATION_FIELDS
+                if hasattr(self, name)
+            ),
+        )
+
+    def fingerprint(self) -> str:
+        """Return a stable hex digest of `canonical_form()`."""
+        return hashlib.blake2b(
+            repr(self.canonical_form()).encode(), digest_size=16
+        ).hexdigest()
+
     def get_filter_model(self) -> FilterResult:
+        active: list[tuple[Any, Any]] | None = self.get_normalized_filters()
+        filters, params, filters_shape = self.build_filters_from(active)
+        pagination: Pagination | None = self.__cap_to_top_k(self.build_pagination())
+        sorting: list[Any] | None = (
+            self.build_cursor_sorting()
+            if pagination is not None and pagination.next_cursor is not None
+            else self.build_sorting() or self.build_q_search_ordering()
+        )
+        pagination_shape: Hashable = None
+        if pagination is not None and self.uses_bind_params():
+            pagination_shape = self.__bind_pagination(pagination, params)
+        elif pagination is not None:
+            pagination_shape = (
+                pagination.limit,
+                pagination.offset,
+                freeze(getattr(self, "cursor", None)),
+            )
         return FilterResult(
-            filters=self.build_filters(),
-            sorting=self.build_sorting(),
-            pagination=self.build_pagination(),
-            selected_columns=self.build_selectable_fields(),
+            filters=filters,
+            sorting=sorting,
+            pagination=pagination,
+            **self.__with_cursor_columns(
+                self.build_selection(key_attrs=self.__get_key_attrs(pagination)),
+                pagination,
+            ),
             q_search=self.build_q_search(),
+            params=params if params else None,
+            shape_key=self.__build_shape_key(filters_shape, pagination_shape),
+            empty=active is None,
+            joins=self.merge_joins(
+                self.get_filter_joins(active),
+                self.get_q_search_joins(),
+                self.get_sort_joins() if sorting else (),
+            ),
+        )
+
+    def __get_key_attrs(self, pagination: Pagination | None) -> list[Any]:
+        # The cursor keys, or the requested sort keys.
+        if pagination is not None and pagination.next_cursor is not None:
+            return [field_attr for field_attr, _ in self.get_cursor_keys()]
+        return [field_attr for _, field_attr, _ in self.get_sort_keys()]
+
+    def __with_cursor_columns(
+        self, selection: dict[str, Any], pagination: Pagination | None
+    ) -> dict[str, Any]:
+        # The next cursor is read from the last row.
+        if (
+            pagination is None
+            or pagination.next_cursor is None
+            or not selection.get("selected_columns")
+        ):
+            return selection
+        return {
+            **selection,
+            "selected_columns": [
+                *selection["selected_columns"],
+                *self.get_cursor_columns(),
+            ],
+        }
+
+    def __cap_to_top_k(self, pagination: Pagination | None) -> Pagination | None:
+        # A full-text `top_k` bounds the results across all pages.
+        top_k: int | None = self.get_q_search_top_k()
+        if top_k is None:
+            return pagination
+        if pagination is None:
+            return Pagination(limit=top_k)
+        remaining: int = max(top_k - (pagination.offset or 0), 0)
+        limit: int = (
+            remaining if pagination.limit is None else min(pagination.limit, remaining)
+        )
+        return replace(pagination, limit=limit)
+
+    def __bind_pagination(
+        self, pagination: Pagination, params: dict[str, Any]
+    ) -> Hashable:
+        # Executors bind `limit`/`offset` to the parameters of the same name.
+        bound: list[str] = []
+        for key in ("limit", "offset"):
+            if (value := getattr(pagination, key)) is not None:
+                params[key] = value
+                bound.append(key)
+        # The keyset predicate embeds the cursor values.
+        return (tuple(bound), freeze(getattr(self, "cursor", None)))
+
+    def __build_shape_key(
+        self, filters_shape: tuple[Hashable, ...], pagination_shape: Hashable
+    ) -> Hashable | None:
+        shape_key: Hashable = (
+            filters_shape,
+            freeze(getattr(self, "q_search", None)),
+            freeze(getattr(self, "sorting", None)),
+            freeze(getattr(self, "select", None)),
+            pagination_shape,
         )
+        try:
+            hash(shape_key)
+        except TypeError:
+            return None
+        return shape_key
@@ -1,3 +1,5 @@
+from .attribute_path import AttributePathMixin
+from .execution import ExecutionMixin
 from .filter import FilterMixin
 from .pagination import PaginationMixin
 from .q_search import QSearchMixin
@@ -5,9 +7,11 @@ from .selecting import SelectMixin
 from .sorting import SortingMixin
 
 __all__ = [
+    "AttributePathMixin",
     "FilterMixin",
     "SortingMixin",
     "SelectMixin",
     "QSearchMixin",
     "PaginationMixin",
+    "ExecutionMixin",
 ]
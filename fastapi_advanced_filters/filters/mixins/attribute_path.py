@@ -0,0 +1,105 @@
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from fastapi_advanced_filters.data_classes import (
+    AdvancedQSearch,
+    AttributePath,
+    QSearch,
+    SortBy,
+)
+
+# Concurrent first requests must share one alias per relationship.
+_PATHS_LOCK: Lock = Lock()
+
+
+class AttributePathMixin:
+    __resolve_attribute_path__: Callable[
+        [Any, str, dict[str, tuple[Any, Any]]], AttributePath
+    ]
+    __attribute_paths__: dict[str, AttributePath]
+    __attribute_path_aliases__: dict[str, tuple[Any, Any]]
+
+    @classmethod
+    def resolve_attribute_path(cls, model_attr: Any) -> AttributePath | None:
+        """Resolve a dotted relationship path such as `"orders.status"`."""
+        if not isinstance(model_attr, str) or "." not in model_attr:
+            return None
+        paths: dict[str, AttributePath] | None = cls.__dict__.get("__attribute_paths__")
+        path: AttributePath | None = paths.get(model_attr) if paths else None
+        if path is not None:
+            return path
+        with _PATHS_LOCK:
+            return cls.__resolve_new_path(model_attr)
+
+    @classmethod
+    def __resolve_new_path(cls, model_attr: str) -> AttributePath:
+        paths: dict[str, AttributePath] | None = cls.__dict__.get("__attribute_paths__")
+        if paths is None:
+            paths = {}
+            cls.__attribute_paths__ = paths
+            cls.__attribute_path_aliases__ = {}
+        path: AttributePath | None = paths.get(model_attr)
+        if path is None:
+            model: Any = getattr(getattr(cls, "FilterConfig", None), "model", None)
+            assert model is not None, (
+                f"'model' must be defined in FilterConfig to use the "
+                f"relationship path '{model_attr}'."
+            )
+            path = cls.__resolve_attribute_path__(
+                model, model_attr, cls.__attribute_path_aliases__
+            )
+            paths[model_attr] = path
+        return path
+
+    @classmethod
+    def resolve_declared_paths(cls) -> None:
+        """Resolve the `sort_by` and `q_search` paths, rejecting to-many sort keys."""
+        filter_config_cls: type | None = getattr(cls, "FilterConfig", None)
+        sort_by: Any = getattr(filter_config_cls, "sort_by", None)
+        if isinstance(sort_by, SortBy):
+            for model_attr in sort_by.model_attrs.values():
+                path: AttributePath | None = cls.resolve_attribute_path(model_attr)
+                if path is not None and path.exists is not None:
+                    raise ValueError(
+                        f"Cannot sort by '{model_attr}': it goes through a "
+                        f"to-many relationship."
+                    )
+        q_search: Any = getattr(filter_config_cls, "q_search", None)
+        if isinstance(q_search, QSearch):
+            cls.get_path_joins(q_search.model_attrs)
+        elif isinstance(q_search, AdvancedQSearch):
+            for model_attrs in q_search.model_attrs_with_op.values():
+                cls.get_path_joins(model_attrs)
+
+    @classmethod
+    def build_path_condition(
+        cls, model_attr: Any, build: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Return `build(column, *args)` for `model_attr` or its path's column."""
+        path: AttributePath | None = cls.resolve_attribute_path(model_attr)
+        if path is None:
+            return build(model_attr, *args)
+        condition: Any = build(path.model_attr, *args)
+        if condition is None or path.exists is None:
+            return condition
+        return path.exists(condition)
+
+    @staticmethod
+    def merge_joins(*groups: Iterable[Any]) -> tuple[Any, ...] | None:
+        """Concatenate join groups, keeping the first occurrence of each."""
+        joins: list[Any] = []
+        for group in groups:
+            for join in group:
+                if all(join is not other for other in joins):
+                    joins.append(join)
+        return tuple(joins) if joins else None
+
+    @classmethod
+    def get_path_joins(cls, model_attrs: Iterable[Any]) -> list[Any]:
+        """Return the joins needed by the relationship paths in `model_attrs`."""
+        joins: list[Any] = []
+        for model_attr in model_attrs:
+            path: AttributePath | None = cls.resolve_attribute_path(model_attr)
+            if path is not None:
+                joins.extend(path.joins)
+        return joins
@@ -0,0 +1,255 @@
+from functools import partial
+from typing import Any, Awaitable, Callable, Hashable
+
+from fastapi_advanced_filters.caching import (
+    InMemoryResultCache,
+    ResultCacheBackend,
+    SingleFlight,
+)
+from fastapi_advanced_filters.data_classes import FilterResult, QueryResult
+from fastapi_advanced_filters.enums import CountStrategyEnum
+
+
+class ExecutionMixin:
+    __select__: Callable[..., Any]
+    __apply_filter_result__: Callable[[Any, FilterResult], Any]
+    __build_count_statement__: Callable[[Any, FilterResult], Any]
+    __execute_filter_result__: Callable[..., QueryResult]
+    __aexecute_filter_result__: Callable[..., Awaitable[QueryResult]]
+    __detach_result__: Callable[[QueryResult], QueryResult | None]
+    __attach_result__: Callable[[Any, QueryResult], QueryResult]
+    __result_cache__: ResultCacheBackend
+    __single_flight__: SingleFlight
+
+    @classmethod
+    def get_base_statement(cls) -> Any:
+        """Return the statement selecting every row of `FilterConfig.model`."""
+        model: Any = getattr(getattr(cls, "FilterConfig", None), "model", None)
+        assert model is not None, (
+            "'model' must be defined in FilterConfig to build a statement "
+            "without passing one."
+        )
+        return cls.__select__(model)
+
+    @classmethod
+    def get_count_strategy(
+        cls, with_count: bool | None = None
+    ) -> tuple[CountStrategyEnum | None, int]:
+        """Resolve the count strategy and cap used by `execute`."""
+        filter_config_cls: type | None = getattr(cls, "FilterConfig", None)
+        count_strategy: Any = getattr(filter_config_cls, "count_strategy", None)
+        assert count_strategy is None or isinstance(
+            count_strategy, CountStrategyEnum
+        ), "'count_strategy' must be a CountStrategyEnum."
+        if with_count is False:
+            count_strategy = None
+        elif with_count is True and count_strategy is None:
+            count_strategy = CountStrategyEnum.EXACT
+        return count_strategy, getattr(filter_config_cls, "count_cap", 1000)
+
+    @classmethod
+    def get_result_cache(cls) -> ResultCacheBackend | None:
+        """Return the result cache of this class, `None` when disabled."""
+        filter_config_cls: type | None = getattr(cls, "FilterConfig", None)
+        if not getattr(filter_config_cls, "result_cache", False):
+            return None
+        cache: ResultCacheBackend | None = cls.__dict__.get("__result_cache__")
+        if cache is None:
+            cache = getattr(filter_config_cls, "result_cache_backend", None)
+            assert cache is None or isinstance(
+                cache, ResultCacheBackend
+            ), "'result_cache_backend' must be a ResultCacheBackend."
+            if cache is None:
+                cache = InMemoryResultCache(
+                    max_entries=getattr(
+                        filter_config_cls, "result_cache_max_entries", 1024
+                    ),
+                    max_bytes=getattr(
+                        filter_config_cls, "result_cache_max_bytes", None
+                    ),
+                )
+            cls.__result_cache__ = cache
+        return cache
+
+    @classmethod
+    def get_single_flight(cls) -> SingleFlight | None:
+        """Return the per-class `SingleFlight` coalescing identical concurrent
+        `aexecute` calls, `None` unless `FilterConfig.single_flight` is set."""
+        if not getattr(getattr(cls, "FilterConfig", None), "single_flight", False):
+            return None
+        single_flight: SingleFlight | None = cls.__dict__.get("__single_flight__")
+        if single_flight is None:
+            single_flight = SingleFlight()
+            cls.__single_flight__ = single_flight
+        return single_flight
+
+    @classmethod
+    def get_result_cache_scope(cls, session: Any) -> Hashable:
+        """Scope of the results cached for `session`, `None` when unscoped."""
+        scope: Callable[[Any], Hashable] | None = getattr(
+            getattr(cls, "FilterConfig", None), "result_cache_scope", None
+        )
+        return scope(session) if scope is not None else None
+
+    def get_result_cache_key(
+        self,
+        count_strategy: CountStrategyEnum | None,
+        cache_key: str | None = None,
+        scope: Hashable = None,
+    ) -> str:
+        """Key of a query result for `cache_key` and `scope`."""
+        key: str = f"{self.fingerprint()}:{count_strategy or ''}"  # type: ignore
+        if cache_key is not None:
+            key = f"{key}:{cache_key}"
+        return f"{key}:scope={scope}" if scope is not None else key
+
+    def apply(self, stmt: Any = None) -> Any:
+        """Return `stmt` (by default the model's select) with the filters,
+        q_search, sorting, selection and pagination of this request applied."""
+        return self.__apply_filter_result__(
+            self.get_base_statement() if stmt is None else stmt,
+            self.get_filter_model(),  # type: ignore
+        )
+
+    def count(self, stmt: Any = None) -> Any:
+        """Return the statement counting the rows matched by this request."""
+        return self.__build_count_statement__(
+            self.get_base_statement() if stmt is None else stmt,
+            self.get_filter_model(),  # type: ignore
+        )
+
+    def execute(
+        self,
+        session: Any,
+        stmt: Any = None,
+        with_count: bool | None = None,
+        cache_key: str | None = None,
+    ) -> QueryResult:
+        """Run the request and return its `QueryResult`."""
+        count_strategy, count_cap = self.get_count_strategy(with_count)
+        cache, key = self.__get_result_cache_entry(
+            session, stmt, count_strategy, cache_key
+        )
+        if cache is not None and (cached := cache.get(key)) is not None:  # type: ignore
+            return self.__attach_result__(session, cached)
+        result: QueryResult = self.__execute_filter_result__(
+            session,
+            self.get_base_statement() if stmt is None else stmt,
+            self.get_filter_model(),  # type: ignore
+            count_strategy,
+            count_cap,
+        )
+        self.__store_result(cache, key, result)
+        return result
+
+    async def aexecute(
+        self,
+        session: Any,
+        stmt: Any = None,
+        with_count: bool | None = None,
+        count_session: Any = None,
+        cache_key: str | None = None,
+    ) -> QueryResult:
+        """Async variant of `execute`."""
+        count_strategy, count_cap = self.get_count_strategy(with_count)
+        cache, key = self.__get_result_cache_entry(
+            session, stmt, count_strategy, cache_key
+        )
+        if cache is not None and (cached := cache.get(key)) is not None:  # type: ignore
+            return self.__attach_result__(session, cached)
+        single_flight: SingleFlight | None = self.get_single_flight()
+        if single_flight is not None and key is None:
+            key = self.__get_execution_key(session, stmt, count_strategy, cache_key)
+        run: Callable[[], Awaitable[QueryResult]] = partial(
+            self.__aexecute_and_store,
+            session,
+            stmt,
+            self.get_filter_model(),  # type: ignore
+            count_strategy,
+            count_cap,
+            count_session,
+            cache,
+            key,
+        )
+        if single_flight is None or key is None:
+            return await run()
+        own: list[QueryResult] = []
+        shared: QueryResult | None = await single_flight.do(
+            key, partial(self.__run_shared, run, own)
+        )
+        if own:
+            return own[0]
+        if shared is None:
+            return await run()
+        return self.__attach_result__(session, shared)
+
+    async def __run_shared(
+        self, run: Callable[[], Awaitable[QueryResult]], own: list[QueryResult]
+    ) -> QueryResult | None:
+        # The other callers get the result detached from its session.
+        result: QueryResult = await run()
+        own.append(result)
+        return self.__detach_result__(result)
+
+    async def __aexecute_and_store(
+        self,
+        session: Any,
+        stmt: Any,
+        filter_result: FilterResult,
+        count_strategy: CountStrategyEnum | None,
+        count_cap: int,
+        count_session: Any,
+        cache: ResultCacheBackend | None,
+        key: str | None,
+    ) -> QueryResult:
+        result: QueryResult = await self.__aexecute_filter_result__(
+            session,
+            self.get_base_statement() if stmt is None else stmt,
+            filter_result,
+            count_strategy,
+            count_cap,
+            count_session,
+        )
+        self.__store_result(cache, key, result)
+        return result
+
+    def __get_result_cache_entry(
+        self,
+        session: Any,
+        stmt: Any,
+        count_strategy: CountStrategyEnum | None,
+        cache_key: str | None,
+    ) -> tuple[ResultCacheBackend | None, str | None]:
+        cache: ResultCacheBackend | None = self.get_result_cache()
+        if cache is None:
+            return None, None
+        key: str | None = self.__get_execution_key(
+            session, stmt, count_strategy, cache_key
+        )
+        return (cache, key) if key is not None else (None, None)
+
+    def __get_execution_key(
+        self,
+        session: Any,
+        stmt: Any,
+        count_strategy: CountStrategyEnum | None,
+        cache_key: str | None,
+    ) -> str | None:
+        # Custom statements only share results when named with `cache_key`.
+        if stmt is not None and cache_key is None:
+            return None
+        return self.get_result_cache_key(
+            count_strategy, cache_key, self.get_result_cache_scope(session)
+        )
+
+    def __store_result(
+        self, cache: ResultCacheBackend | None, key: str | None, result: QueryResult
+    ) -> None:
+        if cache is None or key is None:
+            return
+        detached: QueryResult | None = self.__detach_result__(result)
+        if detached is not None:
+            filter_config_cls: type | None = getattr(self, "FilterConfig", None)
+            cache.set(
+                key, detached, getattr(filter_config_cls, "result_cache_ttl", None)
+            )
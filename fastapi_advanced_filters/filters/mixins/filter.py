@@ -1,115 +1,117 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Hashable, Mapping
 
-from pydantic.fields import FieldInfo
-
-from fastapi_advanced_filters.data_classes import FieldCriteria
+from fastapi_advanced_filters.data_classes import FilterPlanEntry
 from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum
+from fastapi_advanced_filters.filter_metaclass import FilterMetaClass
+from fastapi_advanced_filters.normalization import normalize_filters
+from fastapi_advanced_filters.utils import canonical_value, freeze
+
+
+def _by_position(item: tuple[FilterPlanEntry, Any]) -> int:
+    return item[0].position
+
+
+# Filter shape of a request whose filters cannot match any row.
+UNSATISFIABLE_SHAPE: str = "__unsatisfiable__"
 
 
 class FilterMixin:
     __op_mapping__: dict[OperationEnum, Any]
     __logical_op_mapping__: dict[LogicalOperator, Any]
+    __filter_plan__: Mapping[str, FilterPlanEntry]
+    __false_condition__: Callable[[], Any]
 
-    def __get_filterable_field_metadata(
-        self, attr_name: str
-    ) -> tuple[OperationEnum, FieldCriteria] | None:
-        # Access model_fields on the class to avoid Pydantic V2.11 deprecation warnings
-        field: FieldInfo = type(self).model_fields.get(attr_name)  # type: ignore
-        if (
-            hasattr(field, "metadata")
-            and field.metadata
-            and isinstance(field.metadata, list)
-            and len(field.metadata) == 2
-        ) and (
-            (operation := field.metadata[0])
-            and (field_metadata := field.metadata[1])
-            and isinstance(field_metadata, FieldCriteria)
-        ):
-            return operation, field_metadata
-        return None
-
-    def __build_operation(
-        self, operation: OperationEnum, field: FieldCriteria, value: Any
-    ) -> list[Any] | Any:
-        assert (
-            field.model_attr is not None
-            or field.custom_filter_per_op is not None
-            or field.model_attrs_with_logical_op is not None
-        ), (
-            f"Field '{field.name}' must have either 'model_attr', "
-            f"'custom_filter_per_op' or 'model_attrs_with_logical_op' defined."
+    @classmethod
+    def get_op_mapping(cls) -> Mapping[OperationEnum, Any]:
+        """Return the operations the filter plan is compiled with."""
+        return cls.__op_mapping__
+
+    @classmethod
+    def get_filter_plan(cls) -> Mapping[str, FilterPlanEntry]:
+        # `FilterMetaClass` precompiles the plan at class creation; models built
+        # with another metaclass get theirs on first use. Read from the class
+        # `__dict__` so subclasses never reuse their parent's plan.
+        plan: Mapping[str, FilterPlanEntry] | None = cls.__dict__.get("__filter_plan__")
+        if plan is None:
+            plan = FilterMetaClass.generate_plan_for_filters(cls)
+            cls.__filter_plan__ = plan
+        return plan
+
+    def get_active_filters(self) -> list[tuple[FilterPlanEntry, Any]]:
+        """Return the filter fields set on this instance with their values."""
+        plan: Mapping[str, FilterPlanEntry] = self.get_filter_plan()
+        values: dict[str, Any] = self.__dict__
+        active: list[tuple[FilterPlanEntry, Any]] = []
+        for name in self.model_fields_set:  # type: ignore
+            value: Any = values.get(name)
+            if value is None or name not in plan:
+                continue
+            entry: FilterPlanEntry = plan[name]
+            if value != entry.default:
+                active.append((entry, value))
+        if len(active) > 1:
+            active.sort(key=_by_position)
+        return active
+
+    @staticmethod
+    def get_filter_joins(
+        active: list[tuple[FilterPlanEntry, Any]] | None,
+    ) -> list[Any]:
+        """Return the joins needed by the relationship paths of `active`."""
+        return [join for entry, _ in active or () for join in entry.joins]
+
+    def get_canonical_filters(self) -> tuple[tuple[str, Hashable], ...]:
+        """Return the active `(field name, normalized value)` pairs."""
+        return tuple(
+            (entry.name, canonical_value(entry.op, value))
+            for entry, value in self.get_active_filters()
         )
-        if isinstance(value, datetime):
-            value = value.replace(tzinfo=None)
-        if field.custom_filter_per_op and callable(field.custom_filter_per_op):
-            return field.custom_filter_per_op(operation, value)
-        if (
-            self.__op_mapping__.get(operation, None) is not None
-            and field.model_attr is not None
-        ):
-            assert isinstance(field.model_attr, (list, tuple)) is False, (
-                f"Field '{field.name}' has multiple 'model_attr' defined. "
-                f"Use 'model_attrs_with_logical_op' instead."
-            )
-            condition = self.__op_mapping__[operation](field.model_attr, value)
-            return condition
-        if (
-            field.model_attrs_with_logical_op is not None
-            and self.__op_mapping__.get(operation, None) is not None
+
+    def get_normalized_filters(self) -> list[tuple[FilterPlanEntry, Any]] | None:
+        """Return the active filters merged per column, `None` if unsatisfiable."""
+        active: list[tuple[FilterPlanEntry, Any]] = self.get_active_filters()
+        if not getattr(
+            getattr(type(self), "FilterConfig", None), "normalize_filters", True
         ):
-            assert isinstance(field.model_attrs_with_logical_op, (tuple, list)), (
-                f"Field '{field.name}' must have 'model_attrs_with_logical_op' "
-                f"defined as a list."
-            )
-            model_attrs, logical_operator = field.model_attrs_with_logical_op
-            assert isinstance(model_attrs, (list, tuple)), (
-                f"Field '{field.name}' must have list of 'model_attrs' defined in "
-                f"'model_attrs_with_logical_op'."
-            )
-            assert (
-                isinstance(logical_operator, LogicalOperator)
-                and self.__logical_op_mapping__.get(logical_operator, None) is not None
-            ), (
-                f"Field '{field.name}' must have 'logical_operator' defined in "
-                f"'model_attrs_with_logical_op'."
-            )
-            conditions: list[Any] = []
-            for model_attr in model_attrs:
-                if (condition := self.__op_mapping__.get(operation, None)) is not None:
-                    conditions.append(condition(model_attr, value))
-            return (
-                self.__logical_op_mapping__[logical_operator](*conditions)
-                if conditions
-                else None
-            )
-        return None
+            return active
+        return normalize_filters(active)
 
     def build_filters(self) -> list[Any] | None:
+        return self.build_filters_with_params()[0]
+
+    def build_filters_with_params(
+        self,
+    ) -> tuple[list[Any] | None, dict[str, Any], tuple[Hashable, ...]]:
+        """Build the filter conditions along with their bind parameters."""
+        return self.build_filters_from(self.get_normalized_filters())
+
+    def build_filters_from(
+        self, active: list[tuple[FilterPlanEntry, Any]] | None
+    ) -> tuple[list[Any] | None, dict[str, Any], tuple[Hashable, ...]]:
+        """Build the conditions of `get_normalized_filters()`'s result."""
+        if active is None:
+            return [self.__false_condition__()], {}, (UNSATISFIABLE_SHAPE,)
+        return self.__build_active_filters(active)
+
+    def __build_active_filters(
+        self, active: list[tuple[FilterPlanEntry, Any]]
+    ) -> tuple[list[Any] | None, dict[str, Any], tuple[Hashable, ...]]:
         filters: list[Any] = []
-        for key, value in self.model_dump(  # type: ignore
-            exclude_defaults=True,
-            exclude_none=True,
-            exclude_unset=True,
-            exclude=(
-                "sorting",
-                "select",
-                "q_search",
-                "limit",
-                "offset",
-                "page",
-                "page_size",
-            ),
-        ).items():
-            metadata: tuple[
-                OperationEnum, FieldCriteria
-            ] | None = self.__get_filterable_field_metadata(key)
-            if metadata is None:
-                continue
-            assert isinstance(metadata, (tuple, list)) and len(metadata) == 2, (
-                f"Field '{key}' must have metadata defined as a tuple of "
-                f"(operation, metadata)."
-            )
-            if (conditions := self.__build_operation(*metadata, value)) is not None:
+        params: dict[str, Any] = {}
+        shape: list[Hashable] = []
+        for entry, value in active:
+            if isinstance(value, datetime):
+                value = value.replace(tzinfo=None)
+            if entry.prepare is not None:
+                if (param := entry.prepare(value)) is None:
+                    continue
+                params[entry.name] = param
+                filters.append(entry.expression)
+                shape.append(entry.name)
+            elif entry.operation is not None:
+                if (conditions := entry.operation(value)) is None:
+                    continue
                 filters.append(conditions)
-        return filters if filters else None
+                shape.append((entry.name, freeze(value)))
+        return filters if filters else None, params, tuple(shape)
@@ -1,8 +1,101 @@
+from typing import Any, Callable
+
 from fastapi_advanced_filters.data_classes import Pagination
+from fastapi_advanced_filters.enums import OrderEnum
+from fastapi_advanced_filters.utils import CURSOR_LABEL_PREFIX, encode_cursor
 
 
 class PaginationMixin:
+    __sorting_mapping__: dict[OrderEnum, Any]
+    __keyset_condition__: Callable[[list[tuple[Any, OrderEnum]], list[Any]], Any]
+    __cursor_ordering__: Callable[[Any, OrderEnum], list[Any]]
+    __primary_key_attrs__: Callable[[Any], list[Any]]
+    __cursor_tiebreaker__: tuple[Any, ...]
+
+    @classmethod
+    def get_cursor_tiebreaker(cls) -> tuple[Any, ...]:
+        # Resolved once per class: `FilterConfig.cursor_tiebreaker` or the
+        # primary key of `FilterConfig.model`.
+        tiebreaker: tuple[Any, ...] | None = cls.__dict__.get("__cursor_tiebreaker__")
+        if tiebreaker is None:
+            filter_config_cls: type | None = getattr(cls, "FilterConfig", None)
+            model_attrs: Any = getattr(filter_config_cls, "cursor_tiebreaker", None)
+            if model_attrs is None:
+                model: Any = getattr(filter_config_cls, "model", None)
+                assert model is not None, (
+                    "Either 'model' or 'cursor_tiebreaker' must be defined in "
+                    "FilterConfig to use cursor-based pagination."
+                )
+                model_attrs = cls.__primary_key_attrs__(model)
+            tiebreaker = (
+                tuple(model_attrs)
+                if isinstance(model_attrs, (list, tuple))
+                else (model_attrs,)
+            )
+            cls.__cursor_tiebreaker__ = tiebreaker
+        return tiebreaker
+
+    def get_cursor_keys(self) -> list[tuple[Any, OrderEnum]]:
+        """Return the requested sort keys followed by the tiebreaker columns."""
+        keys: list[tuple[Any, OrderEnum]] = [
+            (field_attr, op)
+            for _, field_attr, op in self.get_sort_keys()  # type: ignore
+        ]
+        for model_attr in self.get_cursor_tiebreaker():
+            if all(model_attr is not field_attr for field_attr, _ in keys):
+                keys.append((model_attr, OrderEnum.ASC))
+        return keys
+
+    def build_cursor_sorting(self) -> list[Any]:
+        return [
+            ordering
+            for field_attr, op in self.get_cursor_keys()
+            for ordering in self.__cursor_ordering__(field_attr, op)
+        ]
+
+    def get_cursor_columns(self) -> list[Any]:
+        """Return the cursor keys labeled to be added to a column selection."""
+        return [
+            field_attr.label(f"{CURSOR_LABEL_PREFIX}{position}")
+            for position, (field_attr, _) in enumerate(self.get_cursor_keys())
+        ]
+
+    def build_next_cursor(self, row: Any) -> str:
+        """Return the cursor of the page that follows `row`."""
+        values: list[Any] = [
+            self.__get_row_value(row, position, field_attr)
+            for position, (field_attr, _) in enumerate(self.get_cursor_keys())
+        ]
+        return encode_cursor(
+            getattr(self, "sorting", None) or [],
+            values,
+            type(self).FilterConfig.cursor_secret,  # type: ignore
+        )
+
+    @staticmethod
+    def __get_row_value(row: Any, position: int, field_attr: Any) -> Any:
+        mapping: Any = getattr(row, "_mapping", None)
+        if mapping is not None:
+            label: str = f"{CURSOR_LABEL_PREFIX}{position}"
+            if label in mapping:
+                return mapping[label]
+            if field_attr in mapping:
+                return mapping[field_attr]
+        return getattr(row, field_attr.key)
+
+    def __build_seek(self, cursor: list[Any]) -> Any:
+        keys: list[tuple[Any, OrderEnum]] = self.get_cursor_keys()
+        if len(keys) != len(cursor):
+            raise ValueError("Invalid cursor")
+        return self.__keyset_condition__(keys, cursor)
+
     def build_pagination(self) -> Pagination | None:
+        if hasattr(self, "cursor") and hasattr(self, "limit"):
+            return Pagination(
+                limit=self.limit,
+                seek=self.__build_seek(self.cursor) if self.cursor else None,
+                next_cursor=self.build_next_cursor,
+            )
         if hasattr(self, "limit") and hasattr(self, "offset"):
             return Pagination(limit=self.limit, offset=self.offset)
         if hasattr(self, "page") and hasattr(self, "page_size"):
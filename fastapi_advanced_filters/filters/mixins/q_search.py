@@ -2,56 +2,127 @@ from typing import Any, Callable
 
 from pydantic.fields import FieldInfo
 
-from fastapi_advanced_filters.data_classes import AdvancedQSearch, QSearch
-from fastapi_advanced_filters.enums import OperationEnum
+from fastapi_advanced_filters.data_classes import (
+    AdvancedQSearch,
+    FullTextQSearch,
+    QSearch,
+    TermLimits,
+)
+from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum
+from fastapi_advanced_filters.filters.mixins.attribute_path import AttributePathMixin
 
 
-class QSearchMixin:
+class QSearchMixin(AttributePathMixin):
     __op_mapping__: dict[OperationEnum, Callable[..., Any]]
     __logical_op_mapping__: dict[Any, Callable[..., Any]]
+    __full_text_rank__: Callable[..., Any]
+    __union_conditions__: Callable[[list[Any], list[Any]], Any]
 
-    def __get_q_search_metadata(self, attr_name: str) -> QSearch | AdvancedQSearch:
+    def __get_q_search_metadata(
+        self, attr_name: str
+    ) -> QSearch | AdvancedQSearch | FullTextQSearch:
         # Access model_fields on the class to avoid Pydantic V2.11 deprecation warnings
         field: FieldInfo = type(self).model_fields.get(attr_name)  # type: ignore
         assert (
             hasattr(field, "metadata")
         ) and field.metadata, f"Field '{attr_name}' has no metadata."
-        assert isinstance(field.metadata[0], (QSearch, AdvancedQSearch)), (
+        assert isinstance(
+            field.metadata[0], (QSearch, AdvancedQSearch, FullTextQSearch)
+        ), (
             f"Field '{attr_name}' metadata is not of type "
-            f"(QSearch, AdvancedQSearch)."
+            f"(QSearch, AdvancedQSearch, FullTextQSearch)."
         )
         return field.metadata[0]
 
-    def build_q_search(self, attr_name: str = "q_search") -> Any | None:
+    def __get_active_q_search_metadata(
+        self, attr_name: str
+    ) -> QSearch | AdvancedQSearch | FullTextQSearch | None:
+        # `None` when no search is requested or it is out of the term limits.
         if not hasattr(self, attr_name) or not getattr(self, attr_name):
             return None
         field_metadata = self.__get_q_search_metadata(attr_name)
+        term_limits: TermLimits | None = field_metadata.term_limits
+        if term_limits is not None and not term_limits.allows(getattr(self, attr_name)):
+            return None
+        return field_metadata
+
+    def build_q_search(self, attr_name: str = "q_search") -> Any | None:
+        field_metadata = self.__get_active_q_search_metadata(attr_name)
+        if field_metadata is None:
+            return None
         q_search: str = getattr(self, attr_name)
-        assert field_metadata is not None and isinstance(
-            field_metadata, (QSearch, AdvancedQSearch)
+        assert isinstance(
+            field_metadata, (QSearch, AdvancedQSearch, FullTextQSearch)
         ), (
             f"Field '{attr_name}' must have metadata of type "
-            f"(QSearch, AdvancedQSearch)."
+            f"(QSearch, AdvancedQSearch, FullTextQSearch)."
         )
         if isinstance(field_metadata, QSearch):
             return self.__build_q_search_operation(field_metadata, q_search)
+        if isinstance(field_metadata, FullTextQSearch):
+            return self.__build_full_text_q_search_operation(field_metadata, q_search)
         return self.__build_advanced_q_search_operation(field_metadata, q_search)
 
+    def get_q_search_joins(self, attr_name: str = "q_search") -> list[Any]:
+        """Return the joins needed by the relationship paths of the search."""
+        field_metadata = self.__get_active_q_search_metadata(attr_name)
+        if isinstance(field_metadata, QSearch):
+            return self.get_path_joins(field_metadata.model_attrs)
+        if isinstance(field_metadata, AdvancedQSearch):
+            return self.get_path_joins(
+                model_attr
+                for model_attrs in field_metadata.model_attrs_with_op.values()
+                for model_attr in model_attrs
+            )
+        return []
+
+    def __get_full_text_q_search(self, attr_name: str) -> FullTextQSearch | None:
+        field_metadata = self.__get_active_q_search_metadata(attr_name)
+        return field_metadata if isinstance(field_metadata, FullTextQSearch) else None
+
+    def build_q_search_ordering(self, attr_name: str = "q_search") -> list[Any] | None:
+        """Return the relevance ordering of a full-text search, if enabled."""
+        field_metadata = self.__get_full_text_q_search(attr_name)
+        if field_metadata is None or not field_metadata.rank_ordering:
+            return None
+        return [
+            self.__full_text_rank__(
+                field_metadata.model_attrs,
+                getattr(self, attr_name),
+                language=field_metadata.language,
+            )
+        ]
+
+    def get_q_search_top_k(self, attr_name: str = "q_search") -> int | None:
+        """Return the result cap of an active full-text search, if any."""
+        field_metadata = self.__get_full_text_q_search(attr_name)
+        return field_metadata.top_k if field_metadata is not None else None
+
+    def __build_full_text_q_search_operation(
+        self, field: FullTextQSearch, value: str
+    ) -> Any:
+        condition: Callable[..., Any] | None = self.__op_mapping__.get(
+            OperationEnum.FTS, None
+        )
+        assert field.model_attrs and condition is not None, (
+            f"FullTextQSearch must have 'model_attrs' defined and a "
+            f"'{OperationEnum.FTS.value}' operation mapped."
+        )
+        return condition(field.model_attrs, value, language=field.language)
+
     def __build_q_search_operation(self, field: QSearch, value: str) -> Any:
         condition: Callable[..., Any] | None = self.__op_mapping__.get(field.op, None)
         assert (
             field.model_attrs is not None and condition is not None
         ), f"Field '{field.name}' must have 'model_attrs' and valid 'op' defined."
+        model_attrs: list[Any] = [
+            model_attr for model_attr in field.model_attrs if model_attr is not None
+        ]
         conditions = [
-            condition(model_attr, value)
-            for model_attr in field.model_attrs
-            if model_attr is not None
+            self.build_path_condition(model_attr, condition, value)
+            for model_attr in model_attrs
         ]
-        return (
-            self.__logical_op_mapping__[field.logical_op](*conditions)
-            if conditions
-            else None
-        )
+        return self.__combine_q_search_conditions(field, model_attrs, conditions)
 
     def __build_advanced_q_search_operation(
         self, field: AdvancedQSearch, value: str
@@ -62,19 +133,32 @@ class QSearchMixin:
         assert (
             field.logical_op is not None
         ), f"Field '{field.name}' must have 'logical_op' defined."
+        searched_attrs: list[Any] = []
         conditions = []
         for op, model_attrs in field.model_attrs_with_op.items():
             if (condition := self.__op_mapping__.get(op, None)) is not None:
-                conditions.extend(
-                    [
-                        condition(model_attr, value)
-                        for model_attr in model_attrs
-                        if model_attr is not None
-                    ]
-                )
+                for model_attr in model_attrs:
+                    if model_attr is not None:
+                        searched_attrs.append(model_attr)
+                        conditions.append(
+                            self.build_path_condition(model_attr, condition, value)
+                        )
+        return self.__combine_q_search_conditions(field, searched_attrs, conditions)
 
-        return (
-            self.__logical_op_mapping__[field.logical_op](*conditions)
-            if conditions
-            else None
-        )
+    def __combine_q_search_conditions(
+        self,
+        field: QSearch | AdvancedQSearch,
+        model_attrs: list[Any],
+        conditions: list[Any],
+    ) -> Any:
+        if not conditions:
+            return None
+        # The UNION rewrite only applies to columns of the filtered model.
+        if (
+            field.union_rewrite
+            and all(self.resolve_attribute_path(attr) is None for attr in model_attrs)
+            and field.logical_op == LogicalOperator.OR
+            and len(conditions) > 1
+        ):
+            return self.__union_conditions__(model_attrs, conditions)
+        return self.__logical_op_mapping__[field.logical_op](*conditions)
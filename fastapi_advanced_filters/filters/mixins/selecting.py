@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 
 from pydantic.fields import FieldInfo
 
@@ -6,6 +6,8 @@ from fastapi_advanced_filters.data_classes import Selectable
 
 
 class SelectMixin:
+    __load_options__: Callable[..., tuple[Any, ...]]
+
     def __get_selectable_metadata(self, attr_name: str) -> Selectable:
         # Access model_fields on the class to avoid Pydantic V2.11 deprecation warnings
         field: FieldInfo = type(self).model_fields.get(attr_name)  # type: ignore
@@ -29,3 +31,53 @@ class SelectMixin:
             if field_attr := field_metadata.get_attr(field):
                 fields.append(field_attr)
         return fields if fields else None
+
+    def build_load_options(
+        self, attr_name: str = "select", key_attrs: list[Any] | None = None
+    ) -> tuple[Any, ...] | None:
+        """Return the loader options of a `load_entities` selection, if any."""
+        selected: list[Any] | None = self.build_selectable_fields(attr_name)
+        if selected is None:
+            return None
+        field_metadata: Selectable = self.__get_selectable_metadata(attr_name)
+        if not field_metadata.load_entities:
+            return None
+        return self.__load_options__(
+            selected, field_metadata.relationship_loader, key_attrs
+        )
+
+    def build_row_columns(self, attr_name: str = "select") -> list[Any] | None:
+        """Return the selected columns labeled with their public names when the
+        `Selectable` returns rows; all of its columns when none is selected."""
+        if attr_name not in type(self).model_fields:  # type: ignore
+            return None
+        field_metadata: Selectable = self.__get_selectable_metadata(attr_name)
+        if not field_metadata.returns_rows():
+            return None
+        select: str | list[str] | None = getattr(self, attr_name, None)
+        items: list[tuple[str, Any]] = field_metadata.get_items()
+        if select and select != "all":
+            items = [
+                (name, field_attr)
+                for name in select
+                if (field_attr := field_metadata.get_attr(name)) is not None
+            ] or items
+        return [field_attr.label(name) for name, field_attr in items]
+
+    def build_selection(
+        self, attr_name: str = "select", key_attrs: list[Any] | None = None
+    ) -> dict[str, Any]:
+        """Return the `FilterResult` fields describing the selection."""
+        row_columns: list[Any] | None = self.build_row_columns(attr_name)
+        if row_columns is not None:
+            return {
+                "selected_columns": row_columns,
+                "as_rows": True,
+                "row_factory": self.__get_selectable_metadata(attr_name).row_factory,
+            }
+        load_options: tuple[Any, ...] | None = self.build_load_options(
+            attr_name, key_attrs
+        )
+        if load_options is not None:
+            return {"load_options": load_options}
+        return {"selected_columns": self.build_selectable_fields(attr_name)}
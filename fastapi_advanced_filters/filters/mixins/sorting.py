@@ -2,11 +2,12 @@ from typing import Any
 
 from pydantic.fields import FieldInfo
 
-from fastapi_advanced_filters.data_classes import SortBy
+from fastapi_advanced_filters.data_classes import AttributePath, SortBy
 from fastapi_advanced_filters.enums import OrderEnum
+from fastapi_advanced_filters.filters.mixins.attribute_path import AttributePathMixin
 
 
-class SortingMixin:
+class SortingMixin(AttributePathMixin):
     __sorting_mapping__: dict[OrderEnum, Any]
 
     def __get_sorting_metadata(self, attr_name: str) -> SortBy:
@@ -20,14 +21,37 @@ class SortingMixin:
         ), f"Field '{attr_name}' metadata is not of type {SortBy.__name__}."
         return field.metadata[0]
 
-    def build_sorting(self, attr_name: str = "sorting") -> list[Any] | None:
+    def get_sort_keys(
+        self, attr_name: str = "sorting"
+    ) -> list[tuple[str, Any, OrderEnum]]:
+        """Return the requested `(name, model_attr, order)` sort keys."""
         if not hasattr(self, attr_name) or not getattr(self, attr_name):
-            return None
+            return []
         field_metadata: SortBy = self.__get_sorting_metadata(attr_name)
         sorting: list[tuple[str, OrderEnum]] = getattr(self, attr_name)
-        sort_by: list[Any] = []
+        sort_keys: list[tuple[str, Any, OrderEnum]] = []
         for sort_field, op in sorting:
-            field_attr = field_metadata.get_attr(sort_field)
-            if field_attr and self.__sorting_mapping__.get(op) is not None:
-                sort_by.append(self.__sorting_mapping__[op](field_attr))
+            if (field_attr := field_metadata.get_attr(sort_field)) is not None:
+                path: AttributePath | None = self.resolve_attribute_path(field_attr)
+                if path is not None:
+                    field_attr = path.model_attr
+                sort_keys.append((sort_field, field_attr, op))
+        return sort_keys
+
+    def get_sort_joins(self, attr_name: str = "sorting") -> list[Any]:
+        """Return the joins needed by the requested relationship sort keys."""
+        if not hasattr(self, attr_name) or not getattr(self, attr_name):
+            return []
+        field_metadata: SortBy = self.__get_sorting_metadata(attr_name)
+        return self.get_path_joins(
+            field_metadata.get_attr(sort_field)
+            for sort_field, _ in getattr(self, attr_name)
+        )
+
+    def build_sorting(self, attr_name: str = "sorting") -> list[Any] | None:
+        sort_by: list[Any] = [
+            self.__sorting_mapping__[op](field_attr)
+            for _, field_attr, op in self.get_sort_keys(attr_name)
+            if self.__sorting_mapping__.get(op) is not None
+        ]
         return sort_by if sort_by else None
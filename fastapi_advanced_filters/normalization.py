@@ -0,0 +1,220 @@
+"""
+Normalization of the active filters of a request before SQL generation.
+
+Only numbers, dates and datetimes are merged: strings compare by the
+collation of the column, which Python comparisons cannot reproduce.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable
+
+from fastapi_advanced_filters.data_classes import FilterPlanEntry
+from fastapi_advanced_filters.enums import OperationEnum
+from fastapi_advanced_filters.utils import datetime_comparison
+
+ActiveFilter = tuple[FilterPlanEntry, Any]
+
+_SET_OPS: frozenset[OperationEnum] = frozenset({OperationEnum.EQ, OperationEnum.IN})
+_LOWER_OPS: frozenset[OperationEnum] = frozenset({OperationEnum.GT, OperationEnum.GTE})
+_UPPER_OPS: frozenset[OperationEnum] = frozenset({OperationEnum.LT, OperationEnum.LTE})
+_EXCLUDE_OPS: frozenset[OperationEnum] = frozenset(
+    {OperationEnum.NEQ, OperationEnum.NOTIN}
+)
+_NORMALIZED_OPS: frozenset[OperationEnum] = (
+    _SET_OPS | _LOWER_OPS | _UPPER_OPS | _EXCLUDE_OPS
+)
+
+
+@dataclass
+class _Bound:
+    value: Any
+    inclusive: bool
+    entry: ActiveFilter
+
+
+@dataclass
+class _ColumnConstraints:
+    allowed: set[Any] | None = None
+    lower: _Bound | None = None
+    upper: _Bound | None = None
+    excluded: set[Any] = field(default_factory=set)
+    exclusions: list[ActiveFilter] = field(default_factory=list)
+
+    def admits(self, value: Any) -> bool:
+        return (
+            value not in self.excluded
+            and (
+                self.lower is None
+                or value > self.lower.value
+                or (self.lower.inclusive and value == self.lower.value)
+            )
+            and (
+                self.upper is None
+                or value < self.upper.value
+                or (self.upper.inclusive and value == self.upper.value)
+            )
+        )
+
+
+def normalize_filters(active: list[ActiveFilter]) -> list[ActiveFilter] | None:
+    """Return the simplified active filters, `None` if unsatisfiable."""
+    if len(active) < 2:
+        return active
+    normalized: list[ActiveFilter] = []
+    columns: dict[int, list[ActiveFilter]] = {}
+    for entry, value in active:
+        if __is_normalizable(entry):
+            columns.setdefault(id(entry.field_criteria.model_attr), []).append(
+                (entry, value)
+            )
+        else:
+            normalized.append((entry, value))
+    for column_filters in columns.values():
+        merged: list[ActiveFilter] | None = (
+            __normalize_column(column_filters)
+            if len(column_filters) > 1
+            else column_filters
+        )
+        if merged is None:
+            return None
+        normalized.extend(merged)
+    normalized.sort(key=lambda item: item[0].position)
+    return normalized
+
+
+def __is_normalizable(entry: FilterPlanEntry) -> bool:
+    field_criteria: Any = entry.field_criteria
+    return (
+        entry.op in _NORMALIZED_OPS
+        and not entry.to_many
+        and field_criteria.model_attr is not None
+        and field_criteria.custom_filter_per_op is None
+        and field_criteria.term_limits is None
+    )
+
+
+def __value_parser(field_type: Any) -> Callable[[Any], Any] | None:
+    if field_type is datetime:
+        return __parse_datetime
+    if field_type is date:
+        return __parse_date
+    # Strings are left out, as collations may make `'a' = 'A'` true.
+    if field_type in (int, float, Decimal):
+        return lambda value: value if type(value) is field_type else field_type(value)
+    return None
+
+
+def __parse_datetime(value: Any) -> datetime:
+    parsed: datetime = (
+        value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    )
+    return parsed.replace(tzinfo=None)
+
+
+def __parse_date(value: Any) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def __normalize_column(column_filters: list[ActiveFilter]) -> list[ActiveFilter] | None:
+    parser = __value_parser(column_filters[0][0].field_criteria.field_type)
+    if parser is None:
+        return column_filters
+    try:
+        constraints: _ColumnConstraints = __collect_constraints(column_filters, parser)
+    except (TypeError, ValueError):
+        return column_filters
+    if constraints.allowed is not None:
+        return __rewrite_allowed(column_filters, constraints)
+    return __rewrite_range(constraints)
+
+
+def __parse_values(
+    op: OperationEnum, value: Any, parser: Callable[[Any], Any]
+) -> set[Any]:
+    if op in (OperationEnum.IN, OperationEnum.NOTIN):
+        items: Any = value.split(",") if isinstance(value, str) else value
+        return {parser(item) for item in items}
+    return {parser(value)}
+
+
+def __collect_constraints(
+    column_filters: list[ActiveFilter], parser: Callable[[Any], Any]
+) -> _ColumnConstraints:
+    constraints: _ColumnConstraints = _ColumnConstraints()
+    for entry, value in column_filters:
+        if entry.op in _LOWER_OPS or entry.op in _UPPER_OPS:
+            op, bound = __range_bound(entry.op, value, parser)
+            __tighten(constraints, op, bound, (entry, value))
+            continue
+        values: set[Any] = __parse_values(entry.op, value, parser)
+        if entry.op in _EXCLUDE_OPS:
+            constraints.excluded |= values
+            constraints.exclusions.append((entry, value))
+        elif constraints.allowed is None:
+            constraints.allowed = values
+        else:
+            constraints.allowed &= values
+    return constraints
+
+
+def __range_bound(
+    op: OperationEnum, value: Any, parser: Callable[[Any], Any]
+) -> tuple[OperationEnum, Any]:
+    # Whole dates cover their day on datetime columns, as in the SQL.
+    if parser is __parse_datetime:
+        op, value = datetime_comparison(op, value)
+    return op, parser(value)
+
+
+def __tighten(
+    constraints: _ColumnConstraints, op: OperationEnum, value: Any, item: ActiveFilter
+) -> None:
+    if op in _LOWER_OPS:
+        bound: _Bound = _Bound(value, op == OperationEnum.GTE, item)
+        current: _Bound | None = constraints.lower
+        if current is None or value > current.value:
+            constraints.lower = bound
+        elif value == current.value and not bound.inclusive:
+            constraints.lower = bound
+        return
+    bound = _Bound(value, op == OperationEnum.LTE, item)
+    current = constraints.upper
+    if current is None or value < current.value:
+        constraints.upper = bound
+    elif value == current.value and not bound.inclusive:
+        constraints.upper = bound
+
+
+def __rewrite_allowed(
+    column_filters: list[ActiveFilter], constraints: _ColumnConstraints
+) -> list[ActiveFilter] | None:
+    # The remaining EQ/IN values imply every range and exclusion predicate.
+    allowed: list[Any] = sorted(
+        value for value in constraints.allowed or () if constraints.admits(value)
+    )
+    if not allowed:
+        return None
+    entries: dict[OperationEnum, FilterPlanEntry] = {}
+    for entry, _ in column_filters:
+        entries.setdefault(entry.op, entry)
+    if len(allowed) == 1 and OperationEnum.EQ in entries:
+        return [(entries[OperationEnum.EQ], allowed[0])]
+    return [(entries[OperationEnum.IN], allowed)]
+
+
+def __rewrite_range(constraints: _ColumnConstraints) -> list[ActiveFilter] | None:
+    lower: _Bound | None = constraints.lower
+    upper: _Bound | None = constraints.upper
+    if lower is not None and upper is not None:
+        if lower.value > upper.value:
+            return None
+        if lower.value == upper.value and not (
+            lower.inclusive and upper.inclusive and constraints.admits(lower.value)
+        ):
+            return None
+    bounds: list[ActiveFilter] = [
+        bound.entry for bound in (lower, upper) if bound is not None
+    ]
+    return bounds + constraints.exclusions
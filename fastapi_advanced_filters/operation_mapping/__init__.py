@@ -1,21 +1,54 @@
 """
 Operation mappings for different ORMs.
 
-Currently, only SQLAlchemy is supported.
+Currently, only SQLAlchemy is supported. The mappings are imported on first
+access, so SQLAlchemy is only loaded once a mapping is used.
 """
 
-from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
-    LOGICAL_OP_MAPPING as SQLALCHEMY_LOGICAL_OP_MAPPING,
-)
-from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
-    OP_MAPPING as SQLALCHEMY_OP_MAPPING,
-)
-from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
-    SORTING_MAPPING as SQLALCHEMY_SORTING_MAPPING,
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
+        BIND_OP_MAPPING as SQLALCHEMY_BIND_OP_MAPPING,
+    )
+    from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
+        LOGICAL_OP_MAPPING as SQLALCHEMY_LOGICAL_OP_MAPPING,
+    )
+    from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
+        OP_MAPPING as SQLALCHEMY_OP_MAPPING,
+    )
+    from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
+        SORTING_MAPPING as SQLALCHEMY_SORTING_MAPPING,
+    )
+
+_SQLALCHEMY_MAPPING: str = (
+    "fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping"
 )
 
+_LAZY_ATTRS: dict[str, tuple[str, str]] = {
+    "SQLALCHEMY_OP_MAPPING": (_SQLALCHEMY_MAPPING, "OP_MAPPING"),
+    "SQLALCHEMY_SORTING_MAPPING": (_SQLALCHEMY_MAPPING, "SORTING_MAPPING"),
+    "SQLALCHEMY_LOGICAL_OP_MAPPING": (_SQLALCHEMY_MAPPING, "LOGICAL_OP_MAPPING"),
+    "SQLALCHEMY_BIND_OP_MAPPING": (_SQLALCHEMY_MAPPING, "BIND_OP_MAPPING"),
+}
+
 __all__ = [
     "SQLALCHEMY_OP_MAPPING",
     "SQLALCHEMY_SORTING_MAPPING",
     "SQLALCHEMY_LOGICAL_OP_MAPPING",
+    "SQLALCHEMY_BIND_OP_MAPPING",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_ATTRS[name]
+    value: Any = getattr(import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,264 @@
+"""
+Custom SQLAlchemy elements compiled differently per dialect.
+
+This module requires SQLAlchemy; `sqlalchemy_mapping` only imports it when
+SQLAlchemy is installed.
+"""
+
+from typing import Any
+
+from sqlalchemy import (
+    ARRAY,
+    Boolean,
+    Float,
+    String,
+    bindparam,
+    func,
+    literal_column,
+    or_,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from fastapi_advanced_filters.utils import (
+    LIKE_ESCAPE_CHAR,
+    escape_like,
+    quote_match_terms,
+)
+
+
+class InValues(ColumnElement[bool]):
+    """`column IN (...)`, or `column = ANY(:array)` on PostgreSQL."""
+
+    __visit_name__ = "in_values"
+    inherit_cache = True
+    type = Boolean()
+    # Rendered as-is in WHERE, not compared to 1 on dialects without booleans.
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("expanding", InternalTraversal.dp_clauseelement),
+        ("array", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(
+        self, column: Any, values: Any = None, key: str | None = None, negate=False
+    ) -> None:
+        self.column: Any = column
+        # Both parameters are part of the element so they get the values of
+        # the statement being executed when it is served from the cache; only
+        # the one matching the dialect is rendered.
+        self.expanding: Any = bindparam(key, values, expanding=True)
+        self.array: Any = bindparam(key, values, type_=ARRAY(column.type))
+        self.negate: bool = negate
+
+    def _negate(self) -> Any:
+        negated: InValues = type(self).__new__(type(self))
+        negated.__dict__.update(self.__dict__)
+        negated.negate = not self.negate
+        return negated
+
+
+class OffloadedInValues(InValues):
+    """`InValues` as a join against a derived table, for long lists."""
+
+    __visit_name__ = "offloaded_in_values"
+    inherit_cache = False
+
+    def __init__(self, column: Any, values: Any, negate: bool = False) -> None:
+        super().__init__(column, values, negate=negate)
+        self.values: list[Any] = list(values)
+
+
+@compiles(InValues)
+@compiles(OffloadedInValues)
+def __compile_in_values(element: InValues, compiler: Any, **kw: Any) -> str:
+    expression: Any = (
+        element.column.not_in(element.expanding)
+        if element.negate
+        else element.column.in_(element.expanding)
+    )
+    return compiler.process(expression, **kw)
+
+
+@compiles(InValues, "postgresql")
+def __compile_any_values(element: InValues, compiler: Any, **kw: Any) -> str:
+    column: str = compiler.process(element.column, **kw)
+    array: str = compiler.process(element.array, **kw)
+    if element.negate:
+        return f"{column} != ALL ({array})"
+    return f"{column} = ANY ({array})"
+
+
+def __render_values_rows(element: OffloadedInValues, compiler: Any) -> str:
+    column_type: Any = element.column.type
+    return ", ".join(
+        f"({compiler.render_literal_value(value, column_type)})"
+        for value in element.values
+    )
+
+
+@compiles(OffloadedInValues, "sqlite")
+def __compile_sqlite_offloaded_in_values(
+    element: OffloadedInValues, compiler: Any, **kw: Any
+) -> str:
+    # SQLite has no column list on derived table aliases.
+    column: str = compiler.process(element.column, **kw)
+    operator: str = "NOT IN" if element.negate else "IN"
+    return f"{column} {operator} (VALUES {__render_values_rows(element, compiler)})"
+
+
+@compiles(OffloadedInValues, "postgresql")
+def __compile_postgresql_offloaded_in_values(
+    element: OffloadedInValues, compiler: Any, **kw: Any
+) -> str:
+    column: str = compiler.process(element.column, **kw)
+    array: str = compiler.process(element.array, **kw)
+    if element.negate:
+        return (
+            f"({column} IS NOT NULL AND NOT EXISTS (SELECT 1 FROM "
+            f"unnest({array}) AS in_values (v) WHERE in_values.v = {column}))"
+        )
+    return f"{column} IN (SELECT unnest({array}))"
+
+
+class FullTextMatch(ColumnElement[bool]):
+    """Full-text match of `columns` against a web-search style `query`."""
+
+    __visit_name__ = "full_text_match"
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("columns", InternalTraversal.dp_clauseelement_tuple),
+        ("query", InternalTraversal.dp_clauseelement),
+        ("quoted_query", InternalTraversal.dp_clauseelement),
+        ("language", InternalTraversal.dp_string),
+    ]
+
+    def __init__(self, columns: Any, query: str, language: str = "english") -> None:
+        self.columns: tuple[Any, ...] = (
+            tuple(columns) if isinstance(columns, (list, tuple)) else (columns,)
+        )
+        self.query: Any = bindparam(None, query, type_=String())
+        self.quoted_query: Any = bindparam(
+            None, quote_match_terms(query), type_=String()
+        )
+        self.language: str = language
+
+
+class FullTextRank(FullTextMatch):
+    """Relevance ordering of a `FullTextMatch`, best matches first."""
+
+    __visit_name__ = "full_text_rank"
+    inherit_cache = True
+    type = Float()
+    _is_implicitly_boolean = False
+
+
+def __regconfig(element: FullTextMatch) -> Any:
+    return literal_column(
+        f"'{element.language.replace(chr(39), chr(39) * 2)}'::regconfig"
+    )
+
+
+def __tsvector_document(element: FullTextMatch) -> Any:
+    if len(element.columns) == 1 and isinstance(element.columns[0].type, TSVECTOR):
+        return element.columns[0]
+    document: Any = func.coalesce(element.columns[0], "")
+    for column in element.columns[1:]:
+        document = document.concat(" ").concat(func.coalesce(column, ""))
+    return func.to_tsvector(__regconfig(element), document)
+
+
+def __tsquery(element: FullTextMatch) -> Any:
+    return func.websearch_to_tsquery(__regconfig(element), element.query)
+
+
+@compiles(FullTextMatch)
+def __compile_full_text_match(element: FullTextMatch, compiler: Any, **kw: Any) -> str:
+    return compiler.process(
+        or_(*(column.match(element.quoted_query) for column in element.columns)),
+        **kw,
+    )
+
+
+@compiles(FullTextMatch, "postgresql")
+def __compile_postgresql_full_text_match(
+    element: FullTextMatch, compiler: Any, **kw: Any
+) -> str:
+    return compiler.process(
+        __tsvector_document(element).bool_op("@@")(__tsquery(element)), **kw
+    )
+
+
+@compiles(FullTextRank)
+def __compile_full_text_rank(element: FullTextRank, compiler: Any, **kw: Any) -> str:
+    raise CompileError(
+        f"Full-text rank ordering is not supported by the "
+        f"'{compiler.dialect.name}' dialect."
+    )
+
+
+@compiles(FullTextRank, "sqlite")
+def __compile_sqlite_full_text_rank(
+    element: FullTextRank, compiler: Any, **kw: Any
+) -> str:
+    # FTS5 ranks a whole table; lower bm25 scores are better matches.
+    return f"bm25({compiler.preparer.format_table(element.columns[0].table)})"
+
+
+@compiles(FullTextRank, "postgresql")
+def __compile_postgresql_full_text_rank(
+    element: FullTextRank, compiler: Any, **kw: Any
+) -> str:
+    rank: Any = func.ts_rank(__tsvector_document(element), __tsquery(element))
+    return compiler.process(rank.desc(), **kw)
+
+
+class SuffixMatch(ColumnElement[bool]):
+    """`column LIKE '%suffix'`, or `reverse(column) LIKE 'xiffus%'`."""
+
+    __visit_name__ = "suffix_match"
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("reversed_pattern", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column: Any, suffix: str) -> None:
+        self.column: Any = column
+        self.pattern: Any = bindparam(None, f"%{escape_like(suffix)}", type_=String())
+        self.reversed_pattern: Any = bindparam(
+            None, f"{escape_like(suffix[::-1])}%", type_=String()
+        )
+
+
+@compiles(SuffixMatch)
+def __compile_suffix_match(element: SuffixMatch, compiler: Any, **kw: Any) -> str:
+    return compiler.process(
+        element.column.like(element.pattern, escape=LIKE_ESCAPE_CHAR), **kw
+    )
+
+
+@compiles(SuffixMatch, "postgresql")
+@compiles(SuffixMatch, "mysql")
+def __compile_reversed_suffix_match(
+    element: SuffixMatch, compiler: Any, **kw: Any
+) -> str:
+    return compiler.process(
+        func.reverse(element.column).like(
+            element.reversed_pattern, escape=LIKE_ESCAPE_CHAR
+        ),
+        **kw,
+    )
@@ -1,85 +1,367 @@
 import operator
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from functools import partial
 from typing import Any, Callable
+from weakref import WeakKeyDictionary
 
 try:
-    from sqlalchemy import ARRAY, Boolean, Column, String, and_, or_
+    from sqlalchemy import (
+        ARRAY,
+        Boolean,
+        Column,
+        String,
+        and_,
+        bindparam,
+        case,
+        false,
+        func,
+        inspect,
+        or_,
+        select,
+        tuple_,
+        union,
+    )
+    from sqlalchemy.orm import (
+        RelationshipProperty,
+        aliased,
+        joinedload,
+        load_only,
+        raiseload,
+        selectinload,
+    )
+
+    from fastapi_advanced_filters.operation_mapping.sqlalchemy_elements import (
+        FullTextMatch,
+        FullTextRank,
+        InValues,
+        OffloadedInValues,
+        SuffixMatch,
+    )
 except ImportError:  # pragma: no cover
     ARRAY = Boolean = Column = or_ = and_ = String = None  # type: ignore
+    bindparam = inspect = tuple_ = InValues = OffloadedInValues = None  # type: ignore
+    case = false = None  # type: ignore
+    select = union = None  # type: ignore
+    FullTextMatch = FullTextRank = SuffixMatch = func = None  # type: ignore
+    RelationshipProperty = aliased = None  # type: ignore
+    joinedload = load_only = raiseload = selectinload = None  # type: ignore
+
+from fastapi_advanced_filters.data_classes import AttributePath
+from fastapi_advanced_filters.enums import (
+    LogicalOperator,
+    MatchModeEnum,
+    OperationEnum,
+    OrderEnum,
+    RelationshipLoaderEnum,
+)
+from fastapi_advanced_filters.utils import (
+    LIKE_ESCAPE_CHAR,
+    RangeBound,
+    datetime_bound,
+    datetime_comparison,
+    escape_like,
+    whole_date,
+)
+
+__VALUE_PARSERS: "WeakKeyDictionary[Any, Callable[[str], Any]]" = WeakKeyDictionary()
+
+
+def value_parser(field: Any) -> Callable[[str], Any]:
+    """Return the function parsing a raw value for `field`'s column type."""
+    column_type: Any = field.type
+    parser: Callable[[str], Any] | None = __VALUE_PARSERS.get(column_type)
+    if parser is None:
+        parser = __resolve_value_parser(column_type)
+        __VALUE_PARSERS[column_type] = parser
+    return parser
+
+
+def __resolve_value_parser(column_type: Any) -> Callable[[str], Any]:
+    if Boolean is not None and isinstance(column_type, Boolean):
+        return __parse_bool
+    python_type: Any = column_type.python_type
+    if python_type is datetime:
+        return __parse_datetime
+    if python_type is date:
+        return __parse_date
+    if python_type is Decimal:
+        return __parse_decimal
+    return partial(__parse_python_type, python_type)
+
+
+# Parsers also accept values of the parsed type, e.g. normalized filters.
+def __parse_bool(value: str | bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    return False if value == "false" or value == "0" else True
+
+
+def __parse_python_type(python_type: type, value: Any) -> Any:
+    return value if isinstance(value, python_type) else python_type(value)
+
+
+def __parse_datetime(value: str | datetime) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def __parse_date(value: str | date) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def __parse_decimal(value: str | float | Decimal) -> Decimal:
+    # `str` first so floats keep their shortest decimal form.
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
 
-from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum, OrderEnum
+def bind_in_values(field: Any) -> Callable[[Any], list[Any] | None]:
+    """Return the IN/NOTIN value parser of `field`."""
+    if not hasattr(field, "type"):
+        # Not a column: its parser is looked up when values are parsed.
+        return partial(__parse_field_values, field)
+    return partial(__parse_in_values, value_parser(field))
 
 
-def in_funct(field: Any, values: str) -> Any:  # type: ignore
+def __parse_field_values(field: Any, values: str | list[Any]) -> list[Any] | None:
+    return __parse_in_values(value_parser(field), values)
+
+
+def __parse_in_values(
+    parser: Callable[[Any], Any], values: str | list[Any]
+) -> list[Any] | None:
+    raw_values: Any = values.split(",") if isinstance(values, str) else values
     try:
-        conditions = []
-        if ARRAY is not None and isinstance(getattr(field, "type", None), ARRAY):
-            return field.contains([val for val in values.split(",") if val])
-        for value in values.split(","):
-            if Boolean is not None and isinstance(field.type, Boolean):
-                conditions.append(False if value == "false" or value == "0" else True)
-            else:
-                conditions.append(field.type.python_type(value))
-        return field.in_(conditions)
-    except ValueError:
+        parsed: list[Any] = list(dict.fromkeys(map(parser, raw_values)))
+    except (TypeError, ValueError):
         return None
+    try:
+        parsed.sort()
+    except TypeError:
+        pass
+    return parsed
 
 
-def not_in_funct(field: Any, values: str) -> Any:  # type: ignore
-    try:
-        conditions = []
-        for value in values.split(","):
-            if Boolean is not None and isinstance(field.type, Boolean):
-                conditions.append(False if value == "false" or value == "0" else True)
-            else:
-                conditions.append(field.type.python_type(value))
-        return ~field.in_(conditions)
-    except ValueError:
+def __in_values_condition(
+    field: Any, values: list[Any], negate: bool, offload_threshold: int | None
+) -> Any:
+    if offload_threshold is not None and len(values) > offload_threshold:
+        return OffloadedInValues(field, values, negate=negate)
+    return InValues(field, values, negate=negate)
+
+
+def __list_values(values: str | list[Any]) -> list[Any]:
+    raw_values: Any = values.split(",") if isinstance(values, str) else values
+    return [value for value in raw_values if value != ""]
+
+
+def bind_in(
+    field: Any, negate: bool = False, offload_threshold: int | None = None
+) -> Callable[[Any], Any]:
+    """Return the IN (or NOTIN with `negate`) operation of `field`."""
+    if (
+        not negate
+        and ARRAY is not None
+        and isinstance(getattr(field, "type", None), ARRAY)
+    ):
+        return partial(__array_contains, field)
+    return partial(
+        __in_condition, field, bind_in_values(field), negate, offload_threshold
+    )
+
+
+def __array_contains(field: Any, values: str | list[Any]) -> Any:
+    return field.contains(__list_values(values))
+
+
+def __in_condition(
+    field: Any,
+    parse: Callable[[Any], list[Any] | None],
+    negate: bool,
+    offload_threshold: int | None,
+    values: str | list[Any],
+) -> Any:
+    conditions: list[Any] | None = parse(values)
+    if conditions is None:
         return None
+    return __in_values_condition(field, conditions, negate, offload_threshold)
 
 
-def contains(field: Any, val: str) -> Any:  # type: ignore
+def contains(field: Any, values: str | list[Any]) -> Any:
+    items: list[Any] = __list_values(values)
+    if not items:
+        return None
     if ARRAY is not None and isinstance(getattr(field, "type", None), ARRAY):
-        return field.any([val for val in val.split(",") if val])
+        return field.any(items)
     if String is not None and isinstance(field.type, String):
-        return or_(field.contains(val) for val in val.split(",") if val)
-    return or_(field == i for i in val.split(",") if i)
-
-
-def between(field: Any, values: str) -> Any:  # type: ignore
-    parts = [p for p in values.split(",") if p]
-    if len(parts) >= 2 and getattr(field.type, "python_type", None) in (int, float):
-        split_values = list(map(int, parts))
-        return field.between(min(split_values), max(split_values))
-    if len(parts) >= 2 and getattr(field.type, "python_type", None) in (
-        date,
-        datetime,
-    ):
-        # parse into date if date-like, otherwise datetime.fromisoformat
-        # would be fallback
+        return or_(*(field.contains(val, autoescape=True) for val in items))
+    return or_(*(field == val for val in items))
+
+
+class ColumnOperation:
+    """An operation whose per-column setup is resolved once by `bind`."""
+
+    def __init__(self, bind: Callable[..., Callable[[Any], Any]]) -> None:
+        self.bind: Callable[..., Callable[[Any], Any]] = bind
+
+    def __call__(self, field: Any, value: Any, **options: Any) -> Any:
+        return self.bind(field, **options)(value)
+
+    def with_options(self, **options: Any) -> "ColumnOperation":
+        return ColumnOperation(partial(self.bind, **options))
+
+
+in_values: ColumnOperation = ColumnOperation(bind_in_values)
+in_funct: ColumnOperation = ColumnOperation(bind_in)
+not_in_funct: ColumnOperation = ColumnOperation(partial(bind_in, negate=True))
+
+
+def __column_python_type(field: Any) -> Any:
+    try:
+        return field.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def __bound_parser(field: Any) -> Callable[[Any], RangeBound] | None:
+    python_type: Any = __column_python_type(field)
+    if python_type is datetime:
+        return datetime_bound
+    if python_type is date:
+        return __date_bound
+    if python_type in (int, float, Decimal):
+        parser: Callable[[Any], Any] = value_parser(field)
+        return lambda value: RangeBound(parser(value))
+    return None
+
+
+def __date_bound(value: Any) -> RangeBound:
+    day: date | None = whole_date(value)
+    if day is None:
+        day = __parse_datetime(value).date()
+    return RangeBound(day, day + timedelta(days=1))
+
+
+def bind_between(field: Any) -> Callable[[Any], Any]:
+    """Return the BTW operation of `field`."""
+    parse: Callable[[Any], RangeBound] | None = __bound_parser(field)
+
+    def between_values(values: Any) -> Any:
+        parts: list[Any] = (
+            [p for p in values.split(",") if p] if isinstance(values, str) else values
+        )
+        if parse is None or len(parts) < 2:
+            raise ValueError("Invalid values for between operation")
         try:
-            split_dates = list(map(date.fromisoformat, parts))
-        except ValueError:
-            split_dates = list(map(lambda x: datetime.fromisoformat(x).date(), parts))
-        return field.between(min(split_dates), max(split_dates))
-    raise ValueError("Invalid values for between operation")
+            bounds: list[RangeBound] = [parse(part) for part in parts]
+        except (TypeError, ValueError, InvalidOperation):
+            raise ValueError("Invalid values for between operation")
+        low: Any = min(bound.start for bound in bounds)
+        high: RangeBound = max(bounds, key=lambda bound: bound.start)
+        if high.end is None:
+            return and_(field >= low, field <= high.start)
+        return and_(field >= low, field < high.end)
 
+    return between_values
 
-OP_MAPPING: dict[OperationEnum, Callable[..., Any]] = {
-    OperationEnum.LIKE: lambda x, y: x.like(f"%{y}%"),
-    OperationEnum.ILIKE: lambda x, y: x.ilike(f"%{y}%"),
-    OperationEnum.EQ: operator.eq,
-    OperationEnum.NEQ: operator.ne,
+
+def between(field: Any, values: Any) -> Any:
+    return bind_between(field)(values)
+
+
+def bind_range(op: OperationEnum, field: Any) -> Callable[[Any], Any]:
+    """Return the GT/GTE/LT/LTE operation of `field`."""
+    if __column_python_type(field) is not datetime:
+        return partial(__RANGE_OPERATORS[op], field)
+    return partial(__compare_datetime, op, field)
+
+
+def __compare_datetime(op: OperationEnum, field: Any, value: Any) -> Any:
+    try:
+        compared_op, bound = datetime_comparison(op, value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid value for {op} operation")
+    return __RANGE_OPERATORS[compared_op](field, bound)
+
+
+__RANGE_OPERATORS: dict[OperationEnum, Callable[[Any, Any], Any]] = {
     OperationEnum.GT: operator.gt,
     OperationEnum.GTE: operator.ge,
-    OperationEnum.LTE: operator.le,
     OperationEnum.LT: operator.lt,
+    OperationEnum.LTE: operator.le,
+}
+
+
+__LIKE_PATTERNS: dict[MatchModeEnum, str] = {
+    MatchModeEnum.CONTAINS: "%{}%",
+    MatchModeEnum.STARTSWITH: "{}%",
+    MatchModeEnum.ENDSWITH: "%{}",
+    MatchModeEnum.EXACT: "{}",
+}
+
+
+def like_pattern(
+    _: Any, value: Any, match_mode: MatchModeEnum = MatchModeEnum.CONTAINS
+) -> str:
+    """Return the LIKE pattern matching `value` literally in `match_mode`."""
+    return __LIKE_PATTERNS[match_mode].format(escape_like(value))
+
+
+def like(
+    field: Any, value: Any, match_mode: MatchModeEnum = MatchModeEnum.CONTAINS
+) -> Any:
+    return field.like(like_pattern(field, value, match_mode), escape=LIKE_ESCAPE_CHAR)
+
+
+def ilike(
+    field: Any, value: Any, match_mode: MatchModeEnum = MatchModeEnum.CONTAINS
+) -> Any:
+    return field.ilike(like_pattern(field, value, match_mode), escape=LIKE_ESCAPE_CHAR)
+
+
+def startswith(field: Any, value: Any) -> Any:
+    """`field LIKE 'value%'`, which a b-tree index on `field` can serve."""
+    return like(field, value, MatchModeEnum.STARTSWITH)
+
+
+def endswith(field: Any, value: Any) -> Any:
+    """Suffix match, as a prefix match on `reverse(field)` where supported."""
+    return SuffixMatch(field, str(value))
+
+
+def iequals(field: Any, value: Any) -> Any:
+    """`lower(field) = lower(value)`, matching an index on `lower(field)`."""
+    return func.lower(field) == func.lower(value)
+
+
+def full_text_match(fields: Any, value: str, language: str = "english") -> Any:
+    """Match `value` as a web-search query against one or more text columns."""
+    return FullTextMatch(fields, value, language=language)
+
+
+def full_text_rank(fields: Any, value: str, language: str = "english") -> Any:
+    """Order by the relevance of `value` to the text columns, best first."""
+    return FullTextRank(fields, value, language=language)
+
+
+OP_MAPPING: dict[OperationEnum, Callable[..., Any]] = {
+    OperationEnum.LIKE: like,
+    OperationEnum.ILIKE: ilike,
+    OperationEnum.STARTSWITH: startswith,
+    OperationEnum.ENDSWITH: endswith,
+    OperationEnum.IEQ: iequals,
+    OperationEnum.EQ: operator.eq,
+    OperationEnum.NEQ: operator.ne,
+    OperationEnum.GT: ColumnOperation(partial(bind_range, OperationEnum.GT)),
+    OperationEnum.GTE: ColumnOperation(partial(bind_range, OperationEnum.GTE)),
+    OperationEnum.LTE: ColumnOperation(partial(bind_range, OperationEnum.LTE)),
+    OperationEnum.LT: ColumnOperation(partial(bind_range, OperationEnum.LT)),
     OperationEnum.IS: lambda x, y: x.is_(y),
     OperationEnum.IN: in_funct,
     OperationEnum.CONT: contains,
     OperationEnum.NOTIN: not_in_funct,
     OperationEnum.ISNULL: lambda x, y: x.is_(None) if y else x.is_not(None),
-    OperationEnum.BTW: between,
+    OperationEnum.BTW: ColumnOperation(bind_between),
+    OperationEnum.FTS: full_text_match,
 }
 
 SORTING_MAPPING: dict[OrderEnum, Callable[[Any], Any]] = {
@@ -87,7 +369,262 @@ SORTING_MAPPING: dict[OrderEnum, Callable[[Any], Any]] = {
     OrderEnum.DESC: lambda x: x.desc(),
 }
 
+
+def bind_param(key: str, expanding: bool = False) -> Any:
+    return bindparam(key, expanding=expanding)
+
+
+# Bound IN/NOTIN lists are never offloaded: their length is not known yet.
+def __bind_in(field: Any, key: str) -> Any:
+    if ARRAY is not None and isinstance(getattr(field, "type", None), ARRAY):
+        return None
+    return InValues(field, key=key)
+
+
+def __bind_not_in(field: Any, key: str) -> Any:
+    if ARRAY is not None and isinstance(getattr(field, "type", None), ARRAY):
+        return None
+    return InValues(field, key=key, negate=True)
+
+
+def __bind_like(field: Any, key: str) -> Any:
+    return field.like(bind_param(key), escape=LIKE_ESCAPE_CHAR)
+
+
+def __bind_ilike(field: Any, key: str) -> Any:
+    return field.ilike(bind_param(key), escape=LIKE_ESCAPE_CHAR)
+
+
+def __bind_range(compare: Callable[[Any, Any], Any], field: Any, key: str) -> Any:
+    # Whole dates change the comparison on datetime columns (see `bind_range`).
+    if __column_python_type(field) is datetime:
+        return None
+    return compare(field, bind_param(key))
+
+
+def __identity(_: Any, value: Any) -> Any:
+    return value
+
+
+def __prefix_pattern(field: Any, value: Any) -> str:
+    return like_pattern(field, value, MatchModeEnum.STARTSWITH)
+
+
+# Operations that can be compiled once with a named bind parameter in place of
+# the value: `(build(field, key), prepare(field, value))`. `build` may return
+# `None` to opt a column out, `prepare` returns `None` for invalid values.
+BIND_OP_MAPPING: dict[
+    OperationEnum,
+    tuple[Callable[[Any, str], Any], Callable[[Any, Any], Any]],
+] = {
+    OperationEnum.EQ: (lambda x, key: x == bind_param(key), __identity),
+    OperationEnum.NEQ: (lambda x, key: x != bind_param(key), __identity),
+    OperationEnum.GT: (partial(__bind_range, operator.gt), __identity),
+    OperationEnum.GTE: (partial(__bind_range, operator.ge), __identity),
+    OperationEnum.LT: (partial(__bind_range, operator.lt), __identity),
+    OperationEnum.LTE: (partial(__bind_range, operator.le), __identity),
+    OperationEnum.LIKE: (__bind_like, like_pattern),
+    OperationEnum.ILIKE: (__bind_ilike, like_pattern),
+    OperationEnum.STARTSWITH: (
+        __bind_like,
+        __prefix_pattern,
+    ),
+    OperationEnum.IEQ: (
+        lambda x, key: func.lower(x) == func.lower(bind_param(key)),
+        __identity,
+    ),
+    OperationEnum.IN: (__bind_in, in_values),
+    OperationEnum.NOTIN: (__bind_not_in, in_values),
+}
+
+
+def primary_key_attrs(model: Any) -> list[Any]:
+    mapper: Any = inspect(model)
+    return [
+        mapper.get_property_by_column(column).class_attribute
+        for column in mapper.primary_key
+    ]
+
+
+def keyset_condition(keys: list[tuple[Any, OrderEnum]], values: list[Any]) -> Any:
+    """Build the seek predicate selecting the rows that follow `values`."""
+    directions: set[OrderEnum] = {order for _, order in keys}
+    nullable: list[bool] = [is_nullable(column) for column, _ in keys]
+    if (
+        len(directions) == 1
+        and len(keys) > 1
+        and not any(nullable)
+        and None not in values
+    ):
+        columns: Any = tuple_(*(column for column, _ in keys))
+        if OrderEnum.DESC in directions:
+            return columns < tuple(values)
+        return columns > tuple(values)
+    conditions: list[Any] = []
+    for index, (column, order) in enumerate(keys):
+        if values[index] is None:
+            continue
+        after: Any = (
+            column < values[index]
+            if order == OrderEnum.DESC
+            else column > values[index]
+        )
+        conditions.append(
+            and_(
+                *(__equals(keys[i][0], values[i]) for i in range(index)),
+                or_(after, column.is_(None)) if nullable[index] else after,
+            )
+        )
+    return or_(*conditions) if conditions else false()
+
+
+def __equals(column: Any, value: Any) -> Any:
+    return column.is_(None) if value is None else column == value
+
+
+def cursor_ordering(column: Any, order: OrderEnum) -> list[Any]:
+    """Return the ORDER BY terms of a cursor key."""
+    ordering: Any = SORTING_MAPPING[order](column)
+    if not is_nullable(column):
+        return [ordering]
+    return [case((column.is_(None), 1), else_=0), ordering]
+
+
+def is_nullable(column: Any) -> bool:
+    # ORM attributes expose their column through `__clause_element__`; other
+    # expressions (labels, functions) are assumed nullable.
+    clause_element: Callable[[], Any] | None = getattr(
+        column, "__clause_element__", None
+    )
+    expression: Any = clause_element() if clause_element is not None else column
+    return bool(getattr(expression, "nullable", True))
+
+
+def __entity_of(model_attr: Any) -> Any:
+    # The mapped class of an ORM attribute, or the table of a Core column.
+    return getattr(model_attr, "class_", None) or getattr(model_attr, "table", None)
+
+
+def __primary_key_of(entity: Any) -> list[Any]:
+    if isinstance(entity, type):
+        return primary_key_attrs(entity)
+    return list(getattr(entity, "primary_key", ()))
+
+
+def union_conditions(model_attrs: list[Any], conditions: list[Any]) -> Any:
+    """OR `conditions` together as a semi-join on a UNION of key lookups."""
+    entity: Any = __entity_of(model_attrs[0])
+    primary_key: list[Any] = __primary_key_of(entity) if entity is not None else []
+    if not primary_key or any(
+        __entity_of(model_attr) is not entity for model_attr in model_attrs[1:]
+    ):
+        return or_(*conditions)
+    lookups: Any = union(
+        *(
+            select(*primary_key).where(condition).correlate(None)
+            for condition in conditions
+        )
+    )
+    if len(primary_key) == 1:
+        return primary_key[0].in_(lookups)
+    return tuple_(*primary_key).in_(lookups)
+
+
+def resolve_attribute_path(
+    model: Any, path: str, aliases: dict[str, tuple[Any, Any]]
+) -> AttributePath:
+    """Resolve a dotted `relationship.column` path from `model`."""
+    *names, column_name = path.split(".")
+    relationships: list[Any] = []
+    target: Any = model
+    for name in names:
+        relationship: Any = getattr(target, name, None)
+        assert isinstance(
+            getattr(relationship, "property", None), RelationshipProperty
+        ), f"'{name}' in '{path}' is not a relationship of {target.__name__}."
+        relationships.append(relationship)
+        target = relationship.property.mapper.class_
+    if any(relationship.property.uselist for relationship in relationships):
+        return AttributePath(
+            model_attr=__path_column(target, column_name, path),
+            exists=partial(__exists_through, tuple(relationships)),
+        )
+    joins: list[Any] = []
+    parent: Any = model
+    for position, relationship in enumerate(relationships, start=1):
+        prefix: str = ".".join(names[:position])
+        if prefix not in aliases:
+            alias: Any = aliased(relationship.property.mapper.class_)
+            aliases[prefix] = (
+                alias,
+                getattr(parent, relationship.key).of_type(alias),
+            )
+        parent, join = aliases[prefix]
+        joins.append(join)
+    return AttributePath(
+        model_attr=__path_column(parent, column_name, path), joins=tuple(joins)
+    )
+
+
+def __path_column(target: Any, column_name: str, path: str) -> Any:
+    column: Any = getattr(target, column_name, None)
+    assert column is not None, f"'{column_name}' in '{path}' is not an attribute."
+    return column
+
+
+def __exists_through(relationships: tuple[Any, ...], condition: Any) -> Any:
+    for relationship in reversed(relationships):
+        condition = (
+            relationship.any(condition)
+            if relationship.property.uselist
+            else relationship.has(condition)
+        )
+    return condition
+
+
+def load_options(
+    model_attrs: list[Any],
+    relationship_loader: RelationshipLoaderEnum,
+    key_attrs: list[Any] | None = None,
+) -> tuple[Any, ...]:
+    """Build the loader options loading only `model_attrs` of their entity."""
+    mapper: Any = model_attrs[0].parent
+    columns: dict[Any, None] = dict.fromkeys(
+        key_attr
+        for key_attr in key_attrs or ()
+        if getattr(key_attr, "parent", None) is mapper
+    )
+    relationships: list[Any] = []
+    for model_attr in model_attrs:
+        if isinstance(getattr(model_attr, "property", None), RelationshipProperty):
+            relationships.append(model_attr)
+            columns.update(dict.fromkeys(__local_attrs(model_attr)))
+        else:
+            columns[model_attr] = None
+    if not columns:
+        columns = dict.fromkeys(primary_key_attrs(relationships[0].class_))
+    loader: Callable[[Any], Any] = LOADER_MAPPING[relationship_loader]
+    return (
+        load_only(*columns, raiseload=True),
+        *(loader(relationship) for relationship in relationships),
+        raiseload("*"),
+    )
+
+
+def __local_attrs(relationship: Any) -> list[Any]:
+    mapper: Any = relationship.property.parent
+    return [
+        mapper.get_property_by_column(column).class_attribute
+        for column in relationship.property.local_columns
+    ]
+
+
 LOGICAL_OP_MAPPING: dict[LogicalOperator, Callable[..., Any]] = {
     LogicalOperator.AND: and_,
     LogicalOperator.OR: or_,
 }
+
+LOADER_MAPPING: dict[RelationshipLoaderEnum, Callable[[Any], Any]] = {
+    RelationshipLoaderEnum.SELECTIN: selectinload,
+    RelationshipLoaderEnum.JOINED: joinedload,
+}
@@ -1,6 +1,25 @@
-from typing import Callable, Optional
+import base64
+import hashlib
+import hmac
+import json
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Mapping, Optional
+from uuid import UUID
 
-from fastapi_advanced_filters.enums import OrderEnum
+from fastapi_advanced_filters.enums import OperationEnum, OrderEnum
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydantic import ValidationInfo
+
+
+# Label prefix of the cursor keys added to column selections with cursor
+# pagination, so the next cursor can be read from any selected row.
+CURSOR_LABEL_PREFIX: str = "_cursor_"
 
 
 def to_camel_case(snake_str: str) -> str:
@@ -75,3 +94,209 @@ def validate_selectable_schema(
         return formatted_selectable_data
 
     return validate_schema
+
+
+def freeze(value: Any) -> Hashable:
+    """Return a hashable equivalent of `value`, with sets and dicts sorted."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((freeze(item) for item in value), key=repr))
+    if isinstance(value, dict):
+        return tuple((key, freeze(value[key])) for key in sorted(value, key=repr))
+    return value
+
+
+# Shared by every metadata object declared without entries.
+EMPTY_MAPPING: Mapping[Any, Any] = MappingProxyType({})
+
+
+def frozen_mapping(mapping: Mapping[Any, Any] | None) -> Mapping[Any, Any]:
+    """Return a read-only copy of `mapping` (`EMPTY_MAPPING` when empty)."""
+    if not mapping:
+        return EMPTY_MAPPING
+    if isinstance(mapping, MappingProxyType):
+        return mapping
+    return MappingProxyType(dict(mapping))
+
+
+def camel_case_aliases(model_attrs: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return `model_attrs` keyed by the camelCase form of each name."""
+    return frozen_mapping(
+        {sys.intern(to_camel_case(name)): attr for name, attr in model_attrs.items()}
+    )
+
+
+def split_comma_separated(value: Any) -> Any:
+    """Split `"a,b"` (or `["a,b", "c"]`) into `["a", "b"(, "c")]`."""
+    if isinstance(value, str):
+        return value.split(",")
+    if isinstance(value, (list, tuple)):
+        return [
+            part
+            for item in value
+            for part in (item.split(",") if isinstance(item, str) else (item,))
+        ]
+    return value
+
+
+# Escape character of the LIKE patterns built from user input, the same one
+# SQLAlchemy uses for `autoescape`.
+LIKE_ESCAPE_CHAR: str = "/"
+
+
+def escape_like(value: Any) -> str:
+    """Escape the LIKE wildcards of `value` so it only matches literally."""
+    return (
+        str(value)
+        .replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+        .replace("%", f"{LIKE_ESCAPE_CHAR}%")
+        .replace("_", f"{LIKE_ESCAPE_CHAR}_")
+    )
+
+
+def quote_match_terms(query: str) -> str:
+    """Quote every whitespace-separated term of `query` as a MATCH string."""
+    terms: list[str] = query.split() or [""]
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+@dataclass(frozen=True)
+class RangeBound:
+    # `end` is the exclusive upper bound of a whole date, `None` for values
+    # without a successor (numbers, datetimes).
+    start: Any
+    end: Any = None
+
+
+def whole_date(value: Any) -> date | None:
+    """Return `value` as a date when it has no time part, else `None`."""
+    if isinstance(value, datetime):
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def datetime_bound(value: Any) -> RangeBound:
+    """Parse a datetime range bound; a whole date covers its day."""
+    day: date | None = whole_date(value)
+    if day is None:
+        return RangeBound(
+            value if isinstance(value, datetime) else datetime.fromisoformat(value)
+        )
+    start: datetime = datetime.combine(day, time.min)
+    return RangeBound(start, start + timedelta(days=1))
+
+
+def datetime_comparison(op: OperationEnum, value: Any) -> tuple[OperationEnum, Any]:
+    """Return the comparison of a datetime column with `value`."""
+    bound: RangeBound = datetime_bound(value)
+    if bound.end is not None and op == OperationEnum.GT:
+        return OperationEnum.GTE, bound.end
+    if bound.end is not None and op == OperationEnum.LTE:
+        return OperationEnum.LT, bound.end
+    return op, bound.start
+
+
+def canonical_value(op: OperationEnum, value: Any) -> Hashable:
+    """Return the normalized, hashable form of a filter value."""
+    if op in (OperationEnum.IN, OperationEnum.NOTIN):
+        items: Any = value.split(",") if isinstance(value, str) else value
+        if isinstance(items, (list, tuple, set, frozenset)):
+            return tuple(sorted({freeze(item) for item in items}, key=repr))
+    return freeze(value)
+
+
+def __encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, UUID):
+        return {"$uuid": str(value)}
+    raise TypeError(f"Value of type {type(value).__name__} can't be stored in a cursor")
+
+
+def __decode_cursor_value(value: dict[str, str]) -> Any:
+    decoders: dict[str, Callable[[str], Any]] = {
+        "$dt": datetime.fromisoformat,
+        "$d": date.fromisoformat,
+        "$dec": Decimal,
+        "$uuid": UUID,
+    }
+    ((tag, raw),) = value.items()
+    return decoders[tag](raw)
+
+
+def __sign_cursor(payload: bytes, secret: str | bytes) -> bytes:
+    key: bytes = secret.encode() if isinstance(secret, str) else secret
+    return hmac.new(key, payload, hashlib.sha256).digest()[:16]
+
+
+def __b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def __b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def encode_cursor(
+    sorting: list[tuple[str, OrderEnum]], values: list[Any], secret: str | bytes
+) -> str:
+    """Encode the keyset values of a row into an opaque, signed cursor token."""
+    payload: bytes = json.dumps(
+        {"s": [[name, str(order)] for name, order in sorting], "v": values},
+        default=__encode_cursor_value,
+        separators=(",", ":"),
+    ).encode()
+    return f"{__b64encode(payload)}.{__b64encode(__sign_cursor(payload, secret))}"
+
+
+def decode_cursor(
+    token: str, secret: str | bytes
+) -> tuple[list[tuple[str, OrderEnum]], list[Any]]:
+    """Verify a cursor token and return its sorting and keyset values."""
+    try:
+        encoded_payload, encoded_signature = token.split(".")
+        payload: bytes = __b64decode(encoded_payload)
+        signature: bytes = __b64decode(encoded_signature)
+    except ValueError as error:
+        raise ValueError("Invalid cursor") from error
+    if not hmac.compare_digest(signature, __sign_cursor(payload, secret)):
+        raise ValueError("Invalid cursor")
+    data: dict[str, Any] = json.loads(payload, object_hook=__decode_cursor_object)
+    sorting = [(name, OrderEnum(order)) for name, order in data["s"]]
+    return sorting, data["v"]
+
+
+def __decode_cursor_object(value: dict[str, Any]) -> Any:
+    if len(value) == 1 and next(iter(value)).startswith("$"):
+        return __decode_cursor_value(value)
+    return value
+
+
+def validate_cursor_schema(
+    secret: str | bytes,
+) -> Callable[[Optional[str], "ValidationInfo"], Optional[list[Any]]]:
+    def validate_schema(
+        provided_cursor: Optional[str], info: "ValidationInfo"
+    ) -> Optional[list[Any]]:
+        if provided_cursor is None:
+            return None
+        if not isinstance(provided_cursor, str):
+            raise ValueError("Invalid cursor")
+        sorting, values = decode_cursor(provided_cursor, secret)
+        if sorting != (info.data.get("sorting") or []):
+            raise ValueError("Cursor does not match the requested sorting")
+        return values
+
+    return validate_schema
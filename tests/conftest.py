@@ -56,3 +56,22 @@ def db_session(engine, tables):
     session.close()
     transaction.rollback()
     connection.close()
+
+
+@pytest.fixture()
+def add_users(db_session):
+    def add(ages):
+        db_session.add_all(
+            [
+                User(
+                    first_name=f"user{age}",
+                    last_name="X",
+                    age=age,
+                    created_at=datetime.datetime(2024, 1, 1),
+                )
+                for age in ages
+            ]
+        )
+        db_session.flush()
+
+    return add
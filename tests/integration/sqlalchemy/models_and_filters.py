@@ -1,7 +1,7 @@
 import enum
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Column, Date, Enum, Integer, String
+from sqlalchemy import JSON, Boolean, Column, Date, Enum, Integer, String
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 from sqlalchemy.orm import Mapped, declarative_base
 
@@ -36,7 +36,10 @@ class User(Base):
     birthday = Column(Date)
     gender = Column(Enum(GenderEnum))
     created_at: Mapped[str]
-    titles: Mapped[list[str]] = Column(PG_ARRAY(String), default=[])
+    # JSON variant so the table can be created on the SQLite test database
+    titles: Mapped[list[str]] = Column(
+        PG_ARRAY(String).with_variant(JSON(), "sqlite"), default=[]
+    )
 
 
 USER_PUBLIC_PREFIX = "user_public"
@@ -313,3 +316,25 @@ class UserAdvancedFilterExample(BaseFilter):
                 prefix=USER_PUBLIC_PREFIX,
             ),
         ]
+
+
+class UserCursorFilterExample(BaseFilter):
+    class FilterConfig:
+        model = User
+        pagination = PaginationEnum.CURSOR_BASED
+        cursor_secret = "test-secret"
+        sort_by = SortBy(
+            model_attrs={
+                "first_name": User.first_name,
+                "age": User.age,
+            },
+            alias_as_camelcase=True,
+        )
+        fields = [
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.GTE,),
+            ),
+        ]
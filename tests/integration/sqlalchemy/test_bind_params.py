@@ -0,0 +1,122 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import bindparam, select
+
+from fastapi_advanced_filters import (
+    BaseFilter,
+    FieldCriteria,
+    OperationEnum,
+    PaginationEnum,
+    SortBy,
+)
+from tests.integration.sqlalchemy.models_and_filters import User
+
+
+class UserBoundFilter(BaseFilter):
+    class FilterConfig:
+        bind_params = True
+        pagination = PaginationEnum.OFFSET_BASED
+        sort_by = SortBy(model_attrs={"age": User.age})
+        fields = [
+            FieldCriteria(
+                name="first_name",
+                field_type=str,
+                model_attr=User.first_name,
+                op=(OperationEnum.EQ, OperationEnum.ILIKE),
+            ),
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.GTE, OperationEnum.IN),
+            ),
+        ]
+
+
+def build_users_statement(m):
+    stmt = select(User.first_name)
+    if m.filters:
+        stmt = stmt.where(*m.filters)
+    if m.sorting:
+        stmt = stmt.order_by(*m.sorting)
+    return stmt.limit(bindparam("limit")).offset(bindparam("offset"))
+
+
+def test_same_shape_with_different_values():
+    a = UserBoundFilter(age__gte=18, first_name__ilike="al").get_filter_model()
+    b = UserBoundFilter(first_name__ilike="bo", age__gte=40).get_filter_model()
+    assert a.shape_key == b.shape_key
+    assert a.params == {
+        "age__gte": 18,
+        "first_name__ilike": "%al%",
+        "limit": 100,
+        "offset": 0,
+    }
+    assert b.params["age__gte"] == 40
+
+
+def test_pagination_keeps_its_values_in_bind_mode():
+    m = UserBoundFilter(limit=5, offset=10).get_filter_model()
+    assert (m.pagination.limit, m.pagination.offset) == (5, 10)
+    assert (m.params["limit"], m.params["offset"]) == (5, 10)
+    sql = str(UserBoundFilter(limit=5, offset=10).apply(select(User)))
+    assert "LIMIT :limit OFFSET :offset" in sql
+
+
+def test_shape_changes_with_active_ops_and_sorting():
+    base = UserBoundFilter(age__gte=18).get_filter_model().shape_key
+    assert UserBoundFilter(age__in="18").get_filter_model().shape_key != base
+    assert UserBoundFilter(age__gte=18, sort_by="-age").get_filter_model().shape_key
+    assert (
+        UserBoundFilter(age__gte=18, sort_by="-age").get_filter_model().shape_key
+        != base
+    )
+
+
+def test_cached_statement_is_reused_and_executes(db_session):
+    UserBoundFilter.get_statement_cache().clear()
+    first = UserBoundFilter(age__gte=35, sort_by="age").get_filter_model()
+    second = UserBoundFilter(age__gte=20, sort_by="age").get_filter_model()
+    stmt_1 = UserBoundFilter.get_cached_statement(first, build_users_statement)
+    stmt_2 = UserBoundFilter.get_cached_statement(second, build_users_statement)
+    assert stmt_1 is stmt_2
+    assert UserBoundFilter.get_statement_cache().hits == 1
+    assert db_session.execute(stmt_1, first.params).scalars().all() == ["Bob"]
+    assert db_session.execute(stmt_2, second.params).scalars().all() == [
+        "Alice",
+        "Bob",
+    ]
+
+
+def test_expanding_in_bind_param(db_session):
+    m = UserBoundFilter(age__in="30,40,50", limit=1, offset=1, sort_by="age")
+    result = m.get_filter_model()
+    assert result.params["age__in"] == [30, 40, 50]
+    stmt = UserBoundFilter.get_cached_statement(result, build_users_statement)
+    assert db_session.execute(stmt, result.params).scalars().all() == ["Bob"]
+
+
+def test_in_bind_param_is_an_array_on_postgresql():
+    from sqlalchemy.dialects import postgresql
+
+    result = UserBoundFilter(age__in="50,30,50").get_filter_model()
+    assert result.params["age__in"] == [30, 50]
+    assert str(result.filters[0].compile(dialect=postgresql.dialect())) == (
+        "users.age = ANY (%(age__in)s::INTEGER[])"
+    )
+
+
+def test_invalid_in_values_are_rejected():
+    with pytest.raises(ValidationError, match="age__in"):
+        UserBoundFilter(age__in="a,b")
+
+
+def test_literal_mode_embeds_values_in_shape():
+    from tests.integration.sqlalchemy.models_and_filters import (
+        UserAdvancedFilterExample,
+    )
+
+    a = UserAdvancedFilterExample(user_private__age__gt=18).get_filter_model()
+    b = UserAdvancedFilterExample(user_private__age__gt=19).get_filter_model()
+    assert a.params is None
+    assert a.shape_key != b.shape_key
@@ -0,0 +1,553 @@
+import asyncio
+import datetime
+from dataclasses import dataclass
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from fastapi_advanced_filters import (
+    BaseFilter,
+    CountStrategyEnum,
+    FieldCriteria,
+    OperationEnum,
+    PaginationEnum,
+    QSearch,
+    QueryResult,
+    Selectable,
+    SortBy,
+)
+from fastapi_advanced_filters.executors import build_count_statement
+from tests._utils import _sql
+from tests.integration.sqlalchemy.models_and_filters import (
+    Base,
+    User,
+    UserCursorFilterExample,
+)
+
+
+class UserExecFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        pagination = PaginationEnum.OFFSET_BASED
+        sort_by = SortBy(model_attrs={"age": User.age})
+        select_only = Selectable(
+            model_attrs={"first_name": User.first_name, "age": User.age}
+        )
+        q_search = QSearch(model_attrs=[User.first_name], op=OperationEnum.ILIKE)
+        fields = [
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.GTE, OperationEnum.IN),
+            ),
+        ]
+
+
+class UserBoundCursorFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        bind_params = True
+        pagination = PaginationEnum.CURSOR_BASED
+        cursor_secret = "test-secret"
+        fields = [
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.GTE,),
+            ),
+        ]
+
+
+@dataclass
+class UserRow:
+    id: int
+    age: int
+
+
+class UserRowFilter(UserExecFilter):
+    class FilterConfig(UserExecFilter.FilterConfig):
+        select_only = Selectable(
+            model_attrs={"first_name": User.first_name, "age": User.age},
+            alias_as_camelcase=True,
+            as_rows=True,
+        )
+
+
+class UserRowCursorFilter(UserCursorFilterExample):
+    class FilterConfig(UserCursorFilterExample.FilterConfig):
+        select_only = Selectable(
+            model_attrs={"id": User.id, "age": User.age}, row_factory=UserRow
+        )
+
+
+def test_apply_builds_a_single_statement():
+    f = UserExecFilter(age__gte=18, q_search="al", sort_by="-age", limit=10, offset=5)
+    stmt = f.apply(select(User).order_by(User.id))
+    sql = _sql(stmt)
+    assert sql.count("WHERE") == 1 and "(SELECT" not in sql
+    # the requested sorting replaces the existing ordering
+    assert "ORDER BY users.age DESC\n" in sql and "users.id" not in sql
+    assert sql.endswith("LIMIT 10 OFFSET 5")
+
+
+def test_apply_selection_and_count_statement():
+    f = UserExecFilter(age__gte=18, select="first_name", sort_by="age")
+    assert _sql(f.apply()).startswith("SELECT users.first_name \nFROM users")
+    count_sql = _sql(f.count())
+    assert count_sql.startswith("SELECT count(*) AS count_1 \nFROM users")
+    assert "ORDER BY" not in count_sql and "LIMIT" not in count_sql
+    # limited statements are counted as a subquery
+    assert "FROM (SELECT" in _sql(f.count(select(User).limit(3)))
+
+
+def test_apply_requires_a_statement_without_model():
+    class NoModel(BaseFilter):
+        class FilterConfig:
+            fields = []
+
+    with pytest.raises(AssertionError):
+        NoModel().apply()
+
+
+def test_execute_returns_entities_and_total(db_session, add_users):
+    add_users([20, 25])
+    result = UserExecFilter(age__gte=25, sort_by="age", limit=2).execute(
+        db_session, with_count=True
+    )
+    assert isinstance(result, QueryResult)
+    assert [u.age for u in result.items] == [25, 30]
+    assert result.total == 3
+    assert result.has_next is None and result.next_cursor is None
+
+
+def test_execute_returns_rows_for_selection(db_session):
+    result = UserExecFilter(select="first_name", sort_by="age").execute(db_session)
+    assert [tuple(row) for row in result.items] == [("Alice",), ("Bob",)]
+    assert result.total is None
+
+
+def test_execute_returns_row_mappings_without_orm_hydration(db_session):
+    db_session.expunge_all()
+    result = UserRowFilter(select="firstName", sort_by="age").execute(
+        db_session, with_count=True
+    )
+    assert [dict(row) for row in result.items] == [
+        {"firstName": "Alice"},
+        {"firstName": "Bob"},
+    ]
+    assert result.total == 2 and len(db_session.identity_map) == 0
+
+
+def test_row_mode_runs_through_the_session(db_session):
+    from sqlalchemy import event
+    from sqlalchemy.orm import with_loader_criteria
+
+    def only_smiths(state):
+        if state.is_select:
+            state.statement = state.statement.options(
+                with_loader_criteria(User, User.last_name == "Smith")
+            )
+
+    # pending objects are autoflushed before the query
+    db_session.add(
+        User(
+            first_name="Carol",
+            last_name="Smith",
+            age=50,
+            created_at=datetime.datetime(2024, 1, 1),
+        )
+    )
+    event.listen(db_session, "do_orm_execute", only_smiths)
+    try:
+        result = UserRowFilter(sort_by="age").execute(db_session, with_count=True)
+    finally:
+        event.remove(db_session, "do_orm_execute", only_smiths)
+    assert result.items == [
+        {"firstName": "Alice", "age": 30},
+        {"firstName": "Carol", "age": 50},
+    ]
+    assert result.total == 2
+
+
+def test_row_selection_defaults_to_every_selectable_column():
+    m = UserRowFilter().get_filter_model()
+    assert m.as_rows and m.row_factory is None
+    assert [c.name for c in m.selected_columns] == ["firstName", "age"]
+    assert 'users.first_name AS "firstName"' in _sql(UserRowFilter().apply())
+
+
+def test_row_factory_builds_items_and_cursor_pages(db_session, add_users):
+    add_users([35, 50])
+    first = UserRowCursorFilter(limit=3, sort_by="age").execute(db_session)
+    assert [row.age for row in first.items] == [30, 35, 40]
+    assert all(isinstance(row, UserRow) for row in first.items)
+    second = UserRowCursorFilter(
+        limit=3, sort_by="age", cursor=first.next_cursor
+    ).execute(db_session)
+    assert [row.age for row in second.items] == [50]
+    assert second.has_next is False
+
+
+def test_execute_cursor_pages(db_session, add_users):
+    add_users([35, 50])
+    first = UserCursorFilterExample(limit=2, sort_by="age").execute(
+        db_session, with_count=True
+    )
+    assert [u.age for u in first.items] == [30, 35]
+    assert first.has_next is True and first.total == 4
+    second = UserCursorFilterExample(
+        limit=2, sort_by="age", cursor=first.next_cursor
+    ).execute(db_session, with_count=True)
+    assert [u.age for u in second.items] == [40, 50]
+    # the total ignores the cursor position
+    assert second.total == 4
+    assert second.has_next is False and second.next_cursor is None
+
+
+def test_execute_cursor_with_bind_params(db_session, add_users):
+    add_users([35])
+    f = UserBoundCursorFilter(limit=2, age__gte=30)
+    result = f.execute(db_session, with_count=True)
+    assert f.get_filter_model().params == {"age__gte": 30, "limit": 2}
+    assert len(result.items) == 2 and result.has_next is True
+    assert result.total == 3
+
+
+def _strategy_filter(strategy, cap=1000):
+    class StrategyFilter(UserExecFilter):
+        class FilterConfig(UserExecFilter.FilterConfig):
+            count_strategy = strategy
+            count_cap = cap
+
+    return StrategyFilter
+
+
+def test_count_strategy_resolution():
+    assert UserExecFilter.get_count_strategy() == (None, 1000)
+    assert UserExecFilter.get_count_strategy(True)[0] == CountStrategyEnum.EXACT
+    capped = _strategy_filter(CountStrategyEnum.CAPPED, cap=5)
+    assert capped.get_count_strategy() == (CountStrategyEnum.CAPPED, 5)
+    assert capped.get_count_strategy(False) == (None, 5)
+
+
+def test_capped_count_statement():
+    f = UserExecFilter(age__gte=18, sort_by="age")
+    sql = _sql(build_count_statement(select(User), f.get_filter_model(), cap=5))
+    assert sql.startswith("SELECT count(*) AS count_1 \nFROM (SELECT 1 \nFROM users")
+    assert "ORDER BY" not in sql and sql.endswith("LIMIT 6) AS anon_1")
+
+
+@pytest.mark.parametrize(
+    "cap, total, total_capped", [(2, 2, True), (4, 4, False), (10, 4, False)]
+)
+def test_execute_capped_count(db_session, add_users, cap, total, total_capped):
+    add_users([50, 60])
+    result = _strategy_filter(CountStrategyEnum.CAPPED, cap)(limit=1).execute(
+        db_session
+    )
+    assert len(result.items) == 1
+    assert (result.total, result.total_capped) == (total, total_capped)
+
+
+def test_execute_has_next_probe(db_session):
+    has_next = _strategy_filter(CountStrategyEnum.HAS_NEXT)
+    first = has_next(limit=1, sort_by="age").execute(db_session)
+    assert [u.age for u in first.items] == [30]
+    assert first.has_next is True and first.total is None
+    last = has_next(limit=1, offset=1, sort_by="age").execute(db_session)
+    assert [u.age for u in last.items] == [40] and last.has_next is False
+
+
+def test_execute_window_count(db_session, add_users):
+    add_users([50])
+    window = _strategy_filter(CountStrategyEnum.WINDOW)
+    result = window(limit=2, sort_by="age").execute(db_session)
+    assert [u.age for u in result.items] == [30, 40] and result.total == 3
+    rows = window(select="first_name", sort_by="age").execute(db_session)
+    assert [tuple(row) for row in rows.items] == [("Alice",), ("Bob",), ("user50",)]
+    assert rows.total == 3
+    assert window(age__gte=99).execute(db_session).total == 0
+    assert window(limit=2, offset=10).execute(db_session).total is None
+
+
+class UserCachedFilter(UserExecFilter):
+    class FilterConfig(UserExecFilter.FilterConfig):
+        result_cache = True
+        result_cache_ttl = 60
+        result_cache_max_entries = 8
+
+
+class UserCachedEntityFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        result_cache = True
+        fields = [
+            FieldCriteria(
+                name="age", field_type=int, model_attr=User.age, op=(OperationEnum.IN,)
+            ),
+        ]
+
+
+def test_execute_uses_the_result_cache(db_session, add_users):
+    cache = UserCachedFilter.get_result_cache()
+    cache.clear()
+    first = UserCachedFilter(age__in="30,40", sort_by="age", select="first_name")
+    rows = first.execute(db_session)
+    add_users([35])
+    with Session(db_session.get_bind()) as other:
+        # same request on another session, different IN order: served from
+        # the cache, rows do not depend on the session that loaded them
+        second = UserCachedFilter(age__in="40,30", sort_by="age", select="first_name")
+        assert second.execute(other) is rows
+        assert [row.first_name for row in rows.items] == ["Alice", "Bob"]
+    counted = first.execute(db_session, with_count=True)
+    assert counted is not rows and counted.total == 2
+    # custom statements are only cached with an explicit key
+    stmt = select(User.first_name).where(User.last_name == "Smith")
+    UserCachedFilter().execute(db_session, stmt)
+    UserCachedFilter().execute(db_session, stmt, cache_key="smith")
+    assert UserCachedFilter().execute(db_session, stmt, cache_key="smith").items
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert UserCachedFilter.get_result_cache() is cache
+    assert UserExecFilter.get_result_cache() is None
+
+
+def test_result_cache_merges_entities_into_the_session(db_session):
+    cache = UserCachedEntityFilter.get_result_cache()
+    cache.clear()
+    request = UserCachedEntityFilter(age__in="30,40")
+    own = request.execute(db_session)
+    own.items[0].first_name = "Changed"
+    with Session(db_session.get_bind()) as other:
+        shared = request.execute(other)
+        assert cache.hits == 1
+        assert [user.first_name for user in shared.items] == ["Alice", "Bob"]
+        assert all(user in other for user in shared.items)
+        assert shared.items[0] is not own.items[0]
+        assert not other.dirty
+        # instances already in the session are returned as they are
+        assert request.execute(other).items == shared.items
+    assert request.execute(db_session).items == own.items
+    assert own.items[0].first_name == "Changed"
+    # rows holding entities cannot be detached from their session
+    stmt = select(User, User.age)
+    UserCachedEntityFilter().execute(db_session, stmt, cache_key="pairs")
+    assert len(cache) == 1
+
+
+def test_result_cache_is_scoped_per_session(db_session):
+    class ScopedFilter(UserCachedFilter):
+        class FilterConfig(UserCachedFilter.FilterConfig):
+            def result_cache_scope(session):
+                return session.info.get("tenant")
+
+    cache = ScopedFilter.get_result_cache()
+    request = ScopedFilter(sort_by="age", select="first_name")
+    db_session.info["tenant"] = "acme"
+    with Session(db_session.get_bind(), info={"tenant": "globex"}) as other:
+        first = request.execute(db_session)
+        assert request.execute(other) is not first
+        assert request.execute(db_session) is first
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert request.get_result_cache_key(None, scope="acme").endswith(":scope=acme")
+
+
+def test_result_cache_backend_from_config():
+    from fastapi_advanced_filters.caching import InMemoryResultCache
+
+    backend = InMemoryResultCache()
+
+    class Shared(UserExecFilter):
+        class FilterConfig(UserExecFilter.FilterConfig):
+            result_cache = True
+            result_cache_backend = backend
+
+    assert Shared.get_result_cache() is backend
+    assert (
+        Shared(limit=5).get_result_cache_key(CountStrategyEnum.EXACT).endswith(":exact")
+    )
+
+
+@pytest.fixture()
+def async_engine():
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    async def setup():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                User.__table__.insert(),
+                [
+                    {
+                        "first_name": f"user{age}",
+                        "last_name": "X",
+                        "age": age,
+                        "created_at": datetime.datetime(2024, 1, 1),
+                    }
+                    for age in (20, 30, 40)
+                ],
+            )
+
+    asyncio.run(setup())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def test_aexecute_runs_page_and_count(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async def run():
+        async with AsyncSession(async_engine) as session:
+            return await UserExecFilter(age__gte=25, sort_by="-age", limit=1).aexecute(
+                session, with_count=True
+            )
+
+    result = asyncio.run(run())
+    assert [u.age for u in result.items] == [40]
+    assert result.total == 2
+
+
+def test_aexecute_returns_row_mappings(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async def run():
+        async with AsyncSession(async_engine) as session:
+            f = UserRowFilter(age__gte=25, sort_by="-age", limit=1)
+            return await f.aexecute(session, with_count=True)
+
+    result = asyncio.run(run())
+    assert [dict(row) for row in result.items] == [{"firstName": "user40", "age": 40}]
+    assert result.total == 2
+
+
+def test_aexecute_uses_the_result_cache(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    UserCachedFilter.get_result_cache().clear()
+
+    async def run():
+        f = UserCachedFilter(age__gte=25, sort_by="age", select="age")
+        async with AsyncSession(async_engine) as session:
+            first = await f.aexecute(session)
+        async with AsyncSession(async_engine) as session:
+            return first, await f.aexecute(session)
+
+    first, second = asyncio.run(run())
+    assert first is second and [row.age for row in first.items] == [30, 40]
+
+
+def test_aexecute_on_a_connection_runs_sequentially(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async def run():
+        async with async_engine.connect() as conn:
+            async with AsyncSession(conn) as session:
+                return await UserCursorFilterExample(limit=2, sort_by="age").aexecute(
+                    session, with_count=True
+                )
+
+    result = asyncio.run(run())
+    assert [u.age for u in result.items] == [20, 30]
+    assert result.total == 3 and result.has_next is True
+
+
+def test_aexecute_coalesces_identical_requests(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    class Coalesced(UserExecFilter):
+        class FilterConfig(UserExecFilter.FilterConfig):
+            single_flight = True
+
+    async def run():
+        # one session per request, as in concurrent web requests
+        sessions = [AsyncSession(async_engine) for _ in range(3)]
+        try:
+            return await asyncio.gather(
+                *(
+                    Coalesced(age__in=values, sort_by="age", select="age").aexecute(
+                        session, with_count=True
+                    )
+                    for values, session in zip(("30,40", "40,30", "30,40"), sessions)
+                )
+            )
+        finally:
+            for session in sessions:
+                await session.close()
+
+    results = asyncio.run(run())
+    assert results[0] is results[1] is results[2]
+    assert [row.age for row in results[0].items] == [30, 40]
+    assert results[0].total == 2
+    single_flight = Coalesced.get_single_flight()
+    assert (single_flight.calls, single_flight.coalesced) == (1, 2)
+    assert UserExecFilter.get_single_flight() is None
+
+
+def test_aexecute_coalesces_entities_into_each_session(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    class Coalesced(UserCachedEntityFilter):
+        class FilterConfig(UserCachedEntityFilter.FilterConfig):
+            result_cache = False
+            single_flight = True
+
+    async def run():
+        sessions = [AsyncSession(async_engine) for _ in range(2)]
+        try:
+            results = await asyncio.gather(
+                *(Coalesced(age__in="30,40").aexecute(session) for session in sessions)
+            )
+            return [
+                [(user.age, user in session.sync_session) for user in result.items]
+                for result, session in zip(results, sessions)
+            ]
+        finally:
+            for session in sessions:
+                await session.close()
+
+    assert asyncio.run(run()) == [[(30, True), (40, True)]] * 2
+    single_flight = Coalesced.get_single_flight()
+    assert (single_flight.calls, single_flight.coalesced) == (1, 1)
+
+
+def test_aexecute_queries_rows_holding_entities_per_caller(async_engine):
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    class Coalesced(UserCachedEntityFilter):
+        class FilterConfig(UserCachedEntityFilter.FilterConfig):
+            result_cache = False
+            single_flight = True
+
+    stmt = select(User, User.age)
+
+    async def run():
+        sessions = [AsyncSession(async_engine) for _ in range(2)]
+        try:
+            results = await asyncio.gather(
+                *(
+                    Coalesced(age__in="30").aexecute(session, stmt, cache_key="pairs")
+                    for session in sessions
+                )
+            )
+            return [
+                [row.User in session.sync_session for row in result.items]
+                for result, session in zip(results, sessions)
+            ]
+        finally:
+            for session in sessions:
+                await session.close()
+
+    assert asyncio.run(run()) == [[True], [True]]
+    single_flight = Coalesced.get_single_flight()
+    assert (single_flight.calls, single_flight.coalesced) == (1, 1)
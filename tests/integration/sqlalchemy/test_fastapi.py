@@ -0,0 +1,64 @@
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import select
+
+from fastapi_advanced_filters import BaseFilter, FieldCriteria, OperationEnum
+from tests.integration.sqlalchemy.models_and_filters import User
+
+# Starlette's test client needs an HTTP client that is not a dependency.
+TestClient = pytest.importorskip("fastapi.testclient").TestClient
+
+
+class UserAgeFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        fields = [
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.IN, OperationEnum.NOTIN),
+            ),
+        ]
+
+
+received: list[UserAgeFilter] = []
+app = FastAPI()
+
+
+# The app runs in another thread than the SQLite connection, so the test
+# runs the query on the filter the endpoint received.
+@app.get("/users")
+def list_users(filters: UserAgeFilter = Depends()) -> None:
+    received.append(filters)
+
+
+@pytest.fixture
+def client():
+    received.clear()
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("age__in=30,40", ["Alice", "Bob"]),
+        ("age__in=30&age__in=40", ["Alice", "Bob"]),
+        ("age__in=40", ["Bob"]),
+        ("age__notin=30&age__notin=50", ["Bob"]),
+        ("", ["Alice", "Bob"]),
+    ],
+)
+def test_in_values_from_the_query_string(client, db_session, query, expected):
+    assert client.get(f"/users?{query}").status_code == 200
+    stmt = received[0].apply(select(User.first_name).order_by(User.id))
+    assert list(db_session.execute(stmt).scalars()) == expected
+
+
+@pytest.mark.parametrize("query", ["age__in=30,x", "age__in=30&age__in=x"])
+def test_invalid_in_values_are_rejected(client, query):
+    response = client.get(f"/users?{query}")
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:2] == ["query", "age__in"]
+    assert received == []
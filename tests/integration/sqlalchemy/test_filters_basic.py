@@ -1,8 +1,20 @@
 from datetime import date
+from uuid import UUID, uuid4
 
 import pytest
-from sqlalchemy import or_
+from pydantic import ValidationError
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    Uuid,
+    create_engine,
+    or_,
+    select,
+)
 
+from fastapi_advanced_filters import BaseFilter, FieldCriteria
 from fastapi_advanced_filters.enums import OperationEnum
 from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import OP_MAPPING
 from tests._utils import assert_sql_list_equal
@@ -31,7 +43,7 @@ from tests.integration.sqlalchemy.models_and_filters import (
         ),
         (
             {"user_private__birthday__btw": "1990-01-01,2000-12-31"},
-            [User.birthday.between(date(1990, 1, 1), date(2000, 12, 31))],
+            [(User.birthday >= date(1990, 1, 1)) & (User.birthday < date(2001, 1, 1))],
         ),
         (
             {"user_private__is_working__is": True},
@@ -58,10 +70,96 @@ def test_q_search_builds_boolean_clause_list():
     model = f.get_filter_model()
     actual = model.q_search
     expected = or_(
-        User.first_name.ilike("%John%"),
-        User.last_name.ilike("%John%"),
-        User.last_name.like("%John%"),
+        User.first_name.ilike("%John%", escape="/"),
+        User.last_name.ilike("%John%", escape="/"),
+        User.last_name.like("%John%", escape="/"),
     )
     from tests._utils import assert_sql_equal
 
     assert_sql_equal(actual, expected)
+
+
+def test_list_and_range_values_are_parsed_into_typed_values():
+    f = UserAdvancedFilterExample(
+        user_private__age__in="30,40",
+        user_private__age__notin=["50", "60,70"],
+        user_public__first_name__cont="a,b",
+        user_private__birthday__btw="1990-01-01,2000-12-31",
+    )
+    assert f.user_private__age__in == [30, 40]
+    assert f.user_private__age__notin == [50, 60, 70]
+    assert f.user_public__first_name__cont == ["a", "b"]
+    assert f.user_private__birthday__btw == (date(1990, 1, 1), date(2000, 12, 31))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"user_private__age__in": "30,x"},
+        {"user_private__birthday__btw": "1990-01-01"},
+        {"user_private__birthday__btw": "1990-01-01,2000-01-01,2010-01-01"},
+    ],
+)
+def test_unparsable_list_and_range_values_are_rejected(kwargs):
+    with pytest.raises(ValidationError):
+        UserAdvancedFilterExample(**kwargs)
+
+
+def test_typed_values_serialize_without_warnings():
+    f = UserAdvancedFilterExample(
+        user_private__age__in="30,40",
+        user_private__birthday__btw="1990-01-01,2000-12-31",
+    )
+    dumped = f.model_dump(exclude_none=True, include={"user_private__age__in"})
+    assert dumped == {"user_private__age__in": [30, 40]}
+    assert f.model_dump_json(include={"user_private__birthday__btw"}) == (
+        '{"user_private__birthday__btw":["1990-01-01","2000-12-31"]}'
+    )
+
+
+def test_list_and_range_fields_stay_query_parameters():
+    from fastapi.dependencies.utils import get_dependant
+
+    dependant = get_dependant(path="/", call=UserAdvancedFilterExample)
+    assert dependant.body_params == []
+    assert "user_private__age__in" in {p.name for p in dependant.query_params}
+
+
+tokens = Table(
+    "tokens",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("ext", Uuid, nullable=False),
+)
+TOKEN_IDS = [uuid4() for _ in range(3)]
+
+
+class TokenFilter(BaseFilter):
+    class FilterConfig:
+        fields = [
+            FieldCriteria(
+                name="ext",
+                field_type=UUID,
+                model_attr=tokens.c.ext,
+                op=(OperationEnum.IN, OperationEnum.NOTIN),
+            ),
+        ]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"ext__in": f"{TOKEN_IDS[0]},{TOKEN_IDS[2]}"}, [1, 3]),
+        ({"ext__notin": f"{TOKEN_IDS[0]},{TOKEN_IDS[2]}"}, [2]),
+    ],
+)
+def test_in_and_not_in_on_uuid_columns(kwargs, expected):
+    engine = create_engine("sqlite:///:memory:")
+    tokens.metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(
+            tokens.insert(),
+            [{"id": i, "ext": ext} for i, ext in enumerate(TOKEN_IDS, start=1)],
+        )
+        stmt = TokenFilter(**kwargs).apply(select(tokens.c.id).order_by(tokens.c.id))
+        assert list(connection.execute(stmt).scalars()) == expected
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi_advanced_filters import BaseFilter, FieldCriteria, OperationEnum
+from tests.integration.sqlalchemy.models_and_filters import (
+    User,
+    UserAdvancedFilterExample,
+    UserCustomizedFilterExample,
+)
+
+
+class TagFilter(BaseFilter):
+    class FilterConfig:
+        fields = [
+            FieldCriteria(
+                name="tags",
+                field_type=set[str],
+                model_attr=User.last_name,
+                op=(OperationEnum.EQ,),
+            ),
+            FieldCriteria(
+                name="meta",
+                field_type=dict[str, int],
+                model_attr=User.age,
+                op=(OperationEnum.EQ,),
+            ),
+        ]
+
+
+TAGS = ["alpha", "beta", "gamma", "delta", "epsilon"]
+
+
+def test_fingerprint_ignores_in_order_duplicates_and_defaults():
+    a = UserAdvancedFilterExample(
+        user_private__age__in="30,40,30", sort_by="-age", limit=10
+    )
+    b = UserAdvancedFilterExample(
+        user_private__age__in="40,30", sort_by="-age", limit=10, offset=0
+    )
+    assert a.canonical_form() == b.canonical_form()
+    assert a.fingerprint() == b.fingerprint()
+    assert len(a.fingerprint()) == 32
+
+
+def test_fingerprint_ignores_explicit_none_and_defaults():
+    assert (
+        UserCustomizedFilterExample(user__age__eq=None).fingerprint()
+        == UserCustomizedFilterExample().fingerprint()
+        == UserCustomizedFilterExample(user__address__eq="address").fingerprint()
+    )
+
+
+def test_fingerprint_changes_with_semantics():
+    base = UserAdvancedFilterExample(user_private__age__in="30,40")
+    fingerprints = {
+        base.fingerprint(),
+        UserAdvancedFilterExample(user_private__age__notin="30,40").fingerprint(),
+        UserAdvancedFilterExample(user_private__age__in="30").fingerprint(),
+        UserAdvancedFilterExample(
+            user_private__age__in="30,40", sort_by="age"
+        ).fingerprint(),
+        UserAdvancedFilterExample(
+            user_private__age__in="30,40", select="age"
+        ).fingerprint(),
+        UserAdvancedFilterExample(
+            user_private__age__in="30,40", offset=10
+        ).fingerprint(),
+        UserAdvancedFilterExample(
+            user_private__age__in="30,40", q_search="al"
+        ).fingerprint(),
+    }
+    assert len(fingerprints) == 7
+
+
+def test_fingerprint_depends_on_filter_class():
+    class Other(UserCustomizedFilterExample):
+        pass
+
+    assert Other().fingerprint() != UserCustomizedFilterExample().fingerprint()
+
+
+def test_fingerprint_does_not_depend_on_insertion_order_or_hash_seed():
+    fingerprint = TagFilter(tags__eq=set(TAGS), meta__eq={"b": 1, "a": 2}).fingerprint()
+    assert (
+        TagFilter(tags__eq=set(reversed(TAGS)), meta__eq={"a": 2, "b": 1}).fingerprint()
+        == fingerprint
+    )
+    script = (
+        "from tests.integration.sqlalchemy.test_fingerprint import TAGS, TagFilter\n"
+        "print(TagFilter(tags__eq=set(TAGS), meta__eq={'b': 1, 'a': 2}).fingerprint())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[3],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
@@ -0,0 +1,141 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+from sqlalchemy import text as sql_text
+from sqlalchemy.exc import CompileError
+
+from fastapi_advanced_filters import (
+    BaseFilter,
+    FieldCriteria,
+    FullTextQSearch,
+    OperationEnum,
+    PaginationEnum,
+    SortBy,
+)
+
+docs = Table(
+    "docs",
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("title", String),
+    Column("body", String),
+)
+
+
+class DocSearchFilter(BaseFilter):
+    class FilterConfig:
+        pagination = PaginationEnum.OFFSET_BASED
+        q_search = FullTextQSearch(
+            model_attrs=[docs.c.title, docs.c.body], rank_ordering=True, top_k=2
+        )
+        sort_by = SortBy({"rowid": docs.c.rowid})
+        fields = [
+            FieldCriteria(
+                name="title",
+                field_type=str,
+                model_attr=docs.c.title,
+                op=(OperationEnum.FTS,),
+            ),
+        ]
+
+    def get_base_statement(self):
+        return select(docs.c.rowid)
+
+
+@pytest.fixture(scope="module")
+def fts_session():
+    engine = create_engine("sqlite:///:memory:")
+    with engine.connect() as connection:
+        try:
+            connection.execute(
+                sql_text("CREATE VIRTUAL TABLE docs USING fts5(title, body)")
+            )
+        except Exception:  # pragma: no cover - sqlite built without FTS5
+            pytest.skip("SQLite FTS5 is not available")
+        connection.execute(
+            docs.insert(),
+            [
+                {"rowid": 1, "title": "fast api", "body": "filters for apis"},
+                {"rowid": 2, "title": "slow", "body": "api api api"},
+                {"rowid": 3, "title": "unrelated", "body": "nothing here"},
+                {"rowid": 4, "title": "api", "body": "search"},
+                {"rowid": 5, "title": 'c++ and o"reilly foo-bar', "body": "books"},
+            ],
+        )
+        yield connection
+
+
+def _ids(connection, f):
+    return list(connection.execute(f.apply()).scalars())
+
+
+def test_full_text_q_search_ranks_and_caps_results(fts_session):
+    ids = _ids(fts_session, DocSearchFilter(q_search="api", limit=10, offset=0))
+    assert len(ids) == 2
+    assert set(ids) <= {1, 2, 4}
+    ranked = list(
+        fts_session.execute(
+            sql_text(
+                "SELECT rowid FROM docs WHERE docs MATCH 'api' ORDER BY bm25(docs)"
+            )
+        ).scalars()
+    )
+    assert ids == ranked[:2]
+
+
+def test_full_text_top_k_bounds_later_pages(fts_session):
+    assert (
+        len(_ids(fts_session, DocSearchFilter(q_search="api", limit=1, offset=1))) == 1
+    )
+    assert _ids(fts_session, DocSearchFilter(q_search="api", limit=5, offset=2)) == []
+
+
+def test_explicit_sorting_replaces_rank_ordering(fts_session):
+    f = DocSearchFilter(q_search="api", limit=10, offset=0, sort_by="-rowid")
+    assert _ids(fts_session, f) == [4, 2]
+
+
+def test_fts_field_operation(fts_session):
+    f = DocSearchFilter(title__fts="api", limit=10, offset=0, sort_by="rowid")
+    assert _ids(fts_session, f) == [1, 4]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("c++", [5]),
+        ('o"reilly', [5]),
+        ("AND", [5]),
+        ("foo-bar", [5]),
+        # not a filter on the title column
+        ("title:api", []),
+        ("  ", []),
+    ],
+)
+def test_full_text_terms_are_matched_literally(fts_session, query, expected):
+    f = DocSearchFilter(title__fts=query, limit=10, offset=0, sort_by="rowid")
+    assert _ids(fts_session, f) == expected
+
+
+def test_full_text_compiles_for_postgresql():
+    from sqlalchemy.dialects import postgresql
+
+    result = DocSearchFilter(q_search="fast api").get_filter_model()
+    dialect = postgresql.dialect()
+    assert str(result.q_search.compile(dialect=dialect)) == (
+        "to_tsvector('english'::regconfig, coalesce(docs.title, %(coalesce_1)s) "
+        "|| %(coalesce_2)s || coalesce(docs.body, %(coalesce_3)s)) "
+        "@@ websearch_to_tsquery('english'::regconfig, %(param_1)s)"
+    )
+    assert str(result.sorting[0].compile(dialect=dialect)).startswith(
+        "ts_rank(to_tsvector('english'::regconfig"
+    )
+    assert str(result.sorting[0].compile(dialect=dialect)).endswith(") DESC")
+    assert result.pagination.limit == 2
+
+
+def test_full_text_rank_is_rejected_by_other_dialects():
+    from sqlalchemy.dialects import mysql
+
+    result = DocSearchFilter(q_search="api").get_filter_model()
+    with pytest.raises(CompileError):
+        result.sorting[0].compile(dialect=mysql.dialect())
@@ -0,0 +1,97 @@
+from sqlalchemy import select
+
+from fastapi_advanced_filters import BaseFilter, FieldCriteria, OperationEnum
+from fastapi_advanced_filters.operation_mapping import sqlalchemy_mapping
+from tests.integration.sqlalchemy.models_and_filters import User
+
+
+class UserOffloadFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        in_offload_threshold = 2
+        fields = [
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.IN, OperationEnum.NOTIN, OperationEnum.GTE),
+            ),
+            FieldCriteria(
+                name="first_name",
+                field_type=str,
+                model_attr=User.first_name,
+                op=(OperationEnum.IN,),
+            ),
+        ]
+
+
+def test_offloaded_in_composes_with_other_filters(db_session):
+    f = UserOffloadFilter(age__in="30,40,50,60", age__gte=35)
+    stmt = f.apply()
+    # Normalization narrows the list to the values matching `age >= 35`.
+    assert "IN (VALUES (40), (50), (60))" in str(stmt.compile(db_session.bind))
+    assert [u.first_name for u in db_session.execute(stmt).scalars()] == ["Bob"]
+
+
+def test_offloaded_not_in_and_strings(db_session):
+    rows = db_session.execute(
+        UserOffloadFilter(age__notin="10,20,30").apply(select(User.first_name))
+    ).scalars()
+    assert list(rows) == ["Bob"]
+    rows = db_session.execute(
+        UserOffloadFilter(first_name__in="Alice,O'Hara,Zed").apply(
+            select(User.first_name)
+        )
+    ).scalars()
+    assert list(rows) == ["Alice"]
+
+
+def test_short_lists_stay_in_lists():
+    sql = str(UserOffloadFilter(age__in="30,40").apply())
+    assert "IN (__[POSTCOMPILE_param_1])" in sql
+
+
+def test_offload_is_opt_in(db_session):
+    class NoOffload(UserOffloadFilter):
+        class FilterConfig(UserOffloadFilter.FilterConfig):
+            in_offload_threshold = None
+
+    class DefaultFilter(BaseFilter):
+        class FilterConfig:
+            model = User
+            fields = UserOffloadFilter.FilterConfig.fields
+
+    for filter_cls in (NoOffload, DefaultFilter):
+        stmt = filter_cls(age__in="1,2,3,4").apply()
+        assert "VALUES" not in str(stmt.compile(db_session.bind))
+
+
+def test_bind_params_never_offload(db_session):
+    class BoundOffload(UserOffloadFilter):
+        class FilterConfig(UserOffloadFilter.FilterConfig):
+            bind_params = True
+
+    f = BoundOffload(age__in="30,40,50")
+    assert "VALUES" not in str(f.apply().compile(db_session.bind))
+    assert [u.age for u in f.execute(db_session).items] == [30, 40]
+
+
+def test_in_value_parsers_are_bound_at_class_creation(db_session, monkeypatch):
+    class BoundOffload(UserOffloadFilter):
+        class FilterConfig(UserOffloadFilter.FilterConfig):
+            bind_params = True
+
+    calls = []
+    lookup = sqlalchemy_mapping.value_parser
+    monkeypatch.setattr(
+        sqlalchemy_mapping,
+        "value_parser",
+        lambda field: calls.append(field) or lookup(field),
+    )
+    stmt = UserOffloadFilter(age__in="30,40,50,60", age__notin="60").apply()
+    assert "IN (VALUES (30), (40), (50))" in str(stmt.compile(db_session.bind))
+    assert [u.age for u in BoundOffload(age__in="30,40").execute(db_session).items] == [
+        30,
+        40,
+    ]
+    assert calls == []
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import select
+
+from fastapi_advanced_filters import (
+    BaseFilter,
+    FieldCriteria,
+    MatchModeEnum,
+    OperationEnum,
+)
+from tests.integration.sqlalchemy.models_and_filters import User
+
+
+class UserMatchFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        fields = [
+            FieldCriteria(
+                name="first_name",
+                field_type=str,
+                model_attr=User.first_name,
+                op=(
+                    OperationEnum.STARTSWITH,
+                    OperationEnum.ENDSWITH,
+                    OperationEnum.IEQ,
+                ),
+            ),
+            FieldCriteria(
+                name="last_name",
+                field_type=str,
+                model_attr=User.last_name,
+                op=(OperationEnum.LIKE, OperationEnum.ILIKE),
+                match_mode=MatchModeEnum.STARTSWITH,
+            ),
+        ]
+
+
+class UserBoundMatchFilter(UserMatchFilter):
+    class FilterConfig(UserMatchFilter.FilterConfig):
+        bind_params = True
+
+
+def _names(db_session, f):
+    stmt = f.apply(select(User.first_name).order_by(User.first_name))
+    params = f.get_filter_model().params or {}
+    return list(db_session.execute(stmt, params).scalars())
+
+
+@pytest.mark.parametrize("filter_cls", [UserMatchFilter, UserBoundMatchFilter])
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"first_name__startswith": "Al"}, ["Alice"]),
+        ({"first_name__endswith": "ob"}, ["Bob"]),
+        ({"first_name__ieq": "ALICE"}, ["Alice"]),
+        ({"last_name__like": "Jo"}, ["Bob"]),
+        ({"last_name__like": "ones"}, []),
+        ({"last_name__ilike": "sm"}, ["Alice"]),
+    ],
+)
+def test_match_ops(db_session, filter_cls, kwargs, expected):
+    assert _names(db_session, filter_cls(**kwargs)) == expected
+
+
+def test_match_mode_sets_like_pattern():
+    result = UserBoundMatchFilter(last_name__like="Jo").get_filter_model()
+    assert result.params == {"last_name__like": "Jo%"}
+    sql = str(UserMatchFilter(first_name__startswith="Al").apply())
+    assert "users.first_name LIKE :first_name_1" in sql
@@ -0,0 +1,121 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event
+
+from fastapi_advanced_filters import BaseFilter, FieldCriteria, OperationEnum
+from tests._utils import _sql
+from tests.integration.sqlalchemy.models_and_filters import User
+
+ALL_OPS = (
+    OperationEnum.EQ,
+    OperationEnum.NEQ,
+    OperationEnum.IN,
+    OperationEnum.NOTIN,
+    OperationEnum.GT,
+    OperationEnum.GTE,
+    OperationEnum.LT,
+    OperationEnum.LTE,
+)
+
+
+class UserNormalizedFilter(BaseFilter):
+    class FilterConfig:
+        model = User
+        fields = [
+            FieldCriteria(name="age", field_type=int, model_attr=User.age, op=ALL_OPS),
+            FieldCriteria(
+                name="first_name",
+                field_type=str,
+                model_attr=User.first_name,
+                op=ALL_OPS,
+            ),
+        ]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"age__gt": 50, "age__lt": 10},
+        {"age__gt": 30, "age__lte": 30},
+        {"age__gte": 30, "age__lte": 30, "age__neq": 30},
+        {"age__in": "10,20", "age__notin": "20,10"},
+        {"age__eq": 5, "age__gte": 10},
+    ],
+)
+def test_unsatisfiable_filters_are_flagged(kwargs):
+    result = UserNormalizedFilter(**kwargs).get_filter_model()
+    assert result.empty is True
+    assert [_sql(f) for f in result.filters] == ["false"]
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"age__in": "10,30,40", "age__gte": 30}, ["users.age IN (30, 40)"]),
+        ({"age__eq": 30, "age__in": "40,30"}, ["users.age = 30"]),
+        ({"age__in": "10,30,40", "age__neq": 10, "age__lt": 40}, ["users.age IN (30)"]),
+        ({"age__gt": 10, "age__gte": 20}, ["users.age >= 20"]),
+        (
+            {"age__gte": 20, "age__gt": 20, "age__lt": 50},
+            ["users.age > 20", "users.age < 50"],
+        ),
+        ({"age__gte": 30, "age__lte": 30}, ["users.age >= 30", "users.age <= 30"]),
+        (
+            {"first_name__in": "Bob,Alice", "age__notin": "1,2", "age__gt": 0},
+            [
+                "(users.age NOT IN (1, 2))",
+                "users.age > 0",
+                "users.first_name IN ('Alice', 'Bob')",
+            ],
+        ),
+    ],
+)
+def test_predicates_are_merged_per_column(kwargs, expected):
+    result = UserNormalizedFilter(**kwargs).get_filter_model()
+    assert result.empty is False
+    assert sorted(_sql(f) for f in result.filters) == sorted(expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"first_name__eq": "a", "first_name__in": "A,b"},
+        {"first_name__gt": "b", "first_name__lt": "B"},
+    ],
+)
+def test_string_filters_are_not_merged(kwargs):
+    # Whether 'a' matches 'A' depends on the collation of the column.
+    result = UserNormalizedFilter(**kwargs).get_filter_model()
+    assert result.empty is False and len(result.filters) == 2
+
+
+def test_unparsable_values_are_rejected_before_normalization():
+    with pytest.raises(ValidationError):
+        UserNormalizedFilter(age__in="1,x", age__gt=5)
+
+
+def test_normalization_can_be_disabled():
+    class Raw(UserNormalizedFilter):
+        class FilterConfig(UserNormalizedFilter.FilterConfig):
+            normalize_filters = False
+
+    result = Raw(age__gt=50, age__lt=10).get_filter_model()
+    assert result.empty is False and len(result.filters) == 2
+
+
+def test_empty_result_skips_the_database(db_session):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        f = UserNormalizedFilter(age__gt=50, age__lt=10)
+        result = f.execute(db_session, with_count=True)
+        assert db_session.execute(f.apply()).all() == []
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert result.items == [] and result.total == 0
+    assert len(statements) == 1
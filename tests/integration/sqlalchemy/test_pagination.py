@@ -1,8 +1,13 @@
 import pytest
 from pydantic import ValidationError
+from sqlalchemy import select
 
+from fastapi_advanced_filters import Selectable
+from tests._utils import _sql
 from tests.integration.sqlalchemy.models_and_filters import (
+    User,
     UserAdvancedFilterExample,
+    UserCursorFilterExample,
     UserCustomizedFilterExample,
 )
 
@@ -59,3 +64,124 @@ def test_page_based_pagination_none_values_invalid(page, size):
 def test_page_based_pagination_strings_cast():
     m = UserCustomizedFilterExample(page="1", size="10").get_filter_model()
     assert m.pagination and (m.pagination.limit, m.pagination.offset) == (10, 0)
+
+
+def _fetch_page(db_session, f):
+    m = f.get_filter_model()
+    stmt = select(User)
+    conditions = list(m.filters or [])
+    if m.pagination.seek is not None:
+        conditions.append(m.pagination.seek)
+    rows = (
+        db_session.execute(
+            stmt.where(*conditions).order_by(*m.sorting).limit(m.pagination.limit)
+        )
+        .scalars()
+        .all()
+    )
+    return rows, m.pagination.next_cursor(rows[-1]) if rows else None
+
+
+def test_cursor_pagination_first_page_has_no_seek():
+    m = UserCursorFilterExample(limit=5).get_filter_model()
+    assert m.pagination.limit == 5
+    assert m.pagination.offset is None and m.pagination.seek is None
+    # the primary key is appended as a tiebreaker
+    assert [_sql(s) for s in m.sorting] == [_sql(User.id.asc())]
+
+
+def test_cursor_pagination_walks_all_pages(db_session, add_users):
+    add_users([25, 35, 35, 35, 50])
+    seen = []
+    cursor = None
+    while True:
+        kwargs = {"limit": 2, "sort_by": "-age", "age__gte": 30}
+        if cursor:
+            kwargs["cursor"] = cursor
+        rows, cursor = _fetch_page(db_session, UserCursorFilterExample(**kwargs))
+        if not rows:
+            break
+        seen.extend((u.age, u.id) for u in rows)
+    assert seen == sorted(seen, key=lambda r: (-r[0], r[1]))
+    assert [age for age, _ in seen] == [50, 40, 35, 35, 35, 30]
+
+
+def _walk_pages(db_session, filter_cls, **kwargs):
+    seen, cursor = [], None
+    while True:
+        result = filter_cls(**kwargs, **({"cursor": cursor} if cursor else {})).execute(
+            db_session
+        )
+        seen.extend(result.items)
+        if not result.has_next:
+            return seen
+        cursor = result.next_cursor
+
+
+@pytest.mark.parametrize("sort_by", ["age", "-age"])
+def test_cursor_pagination_returns_rows_with_null_sort_keys(
+    db_session, add_users, sort_by
+):
+    add_users([None, 25, None, 50])
+    users = _walk_pages(db_session, UserCursorFilterExample, limit=2, sort_by=sort_by)
+    ages = [user.age for user in users]
+    assert len(ages) == 6 and ages[-2:] == [None, None]
+    assert ages[:4] == sorted(ages[:4], reverse=sort_by.startswith("-"))
+
+
+class UserCursorSelectFilter(UserCursorFilterExample):
+    class FilterConfig(UserCursorFilterExample.FilterConfig):
+        select_only = Selectable(model_attrs={"first_name": User.first_name})
+
+
+class UserCursorRowFilter(UserCursorFilterExample):
+    class FilterConfig(UserCursorFilterExample.FilterConfig):
+        select_only = Selectable(
+            model_attrs={"first_name": User.first_name}, as_rows=True
+        )
+
+
+def test_cursor_pagination_projects_unselected_cursor_keys(db_session, add_users):
+    add_users([25, 50])
+    rows = _walk_pages(
+        db_session, UserCursorSelectFilter, limit=1, sort_by="age", select="first_name"
+    )
+    assert [row.first_name for row in rows] == ["user25", "Alice", "Bob", "user50"]
+    items = _walk_pages(db_session, UserCursorRowFilter, limit=3, sort_by="-age")
+    assert items == [
+        {"first_name": "user50"},
+        {"first_name": "Bob"},
+        {"first_name": "Alice"},
+        {"first_name": "user25"},
+    ]
+
+
+def test_cursor_pagination_mixed_directions(db_session, add_users):
+    add_users([35, 35])
+    first, cursor = _fetch_page(
+        db_session, UserCursorFilterExample(limit=3, sort_by="-age,firstName")
+    )
+    rest, _ = _fetch_page(
+        db_session,
+        UserCursorFilterExample(limit=10, sort_by="-age,firstName", cursor=cursor),
+    )
+    ordered = first + rest
+    assert len(ordered) == 4
+    assert [(u.age, u.first_name) for u in ordered] == sorted(
+        ((u.age, u.first_name) for u in ordered), key=lambda r: (-r[0], r[1])
+    )
+
+
+def test_cursor_rejects_tampered_token():
+    token = UserCursorFilterExample().build_next_cursor(User(id=1))
+    with pytest.raises(ValidationError):
+        UserCursorFilterExample(cursor=token[:-2] + "AA")
+    with pytest.raises(ValidationError):
+        UserCursorFilterExample(cursor="not-a-cursor")
+
+
+def test_cursor_must_match_sorting():
+    token = UserCursorFilterExample(sort_by="age").build_next_cursor(User(id=1, age=30))
+    assert UserCursorFilterExample(sort_by="age", cursor=token).cursor == [30, 1]
+    with pytest.raises(ValidationError):
+        UserCursorFilterExample(sort_by="-age", cursor=token)
@@ -27,9 +27,9 @@ def test_filter_and_q_search_pipeline():
     assert_sql_equal(
         m.q_search,
         or_(
-            User.first_name.ilike("%John%"),
-            User.last_name.ilike("%John%"),
-            User.last_name.like("%John%"),
+            User.first_name.ilike("%John%", escape="/"),
+            User.last_name.ilike("%John%", escape="/"),
+            User.last_name.like("%John%", escape="/"),
         ),
     )
 
@@ -47,9 +47,9 @@ def test_full_pipeline_all_features():
     assert_sql_equal(
         m.q_search,
         or_(
-            User.first_name.ilike("%John%"),
-            User.last_name.ilike("%John%"),
-            User.last_name.like("%John%"),
+            User.first_name.ilike("%John%", escape="/"),
+            User.last_name.ilike("%John%", escape="/"),
+            User.last_name.like("%John%", escape="/"),
         ),
     )
     assert [str(c) for c in m.selected_columns] == [
@@ -1,7 +1,18 @@
 import pytest
-from sqlalchemy import or_
+from pydantic import ValidationError
+from sqlalchemy import or_, select
 
-from tests._utils import assert_sql_equal
+from fastapi_advanced_filters import (
+    AdvancedQSearch,
+    BaseFilter,
+    FieldCriteria,
+    OperationEnum,
+    PaginationEnum,
+    QSearch,
+    SortBy,
+    TermLimits,
+)
+from tests._utils import _sql, assert_sql_equal
 from tests.integration.sqlalchemy.models_and_filters import (
     AdvancedQ,
     SimpleQ,
@@ -17,8 +28,8 @@ def test_simple_q_search_or_ilike(query):
     m = filters.get_filter_model()
     # We expect an OR of ILIKE against first_name and last_name
     expected = or_(
-        User.first_name.ilike(f"%{query}%"),
-        User.last_name.ilike(f"%{query}%"),
+        User.first_name.ilike(f"%{query}%", escape="/"),
+        User.last_name.ilike(f"%{query}%", escape="/"),
     )
     assert_sql_equal(m.q_search, expected)
 
@@ -33,9 +44,9 @@ def test_advanced_q_search_or_like_ilike(query):
     filters = UserAdvancedFilterExample(q_search=query)
     actual = filters.get_filter_model().q_search
     expected = or_(
-        User.first_name.ilike(f"%{query}%"),
-        User.last_name.ilike(f"%{query}%"),
-        User.last_name.like(f"%{query}%"),
+        User.first_name.ilike(f"%{query}%", escape="/"),
+        User.last_name.ilike(f"%{query}%", escape="/"),
+        User.last_name.like(f"%{query}%", escape="/"),
     )
     assert_sql_equal(actual, expected)
 
@@ -43,3 +54,134 @@ def test_advanced_q_search_or_like_ilike(query):
 def test_q_search_mixins_direct_build():
     assert SimpleQ(q_search="abc").build_q_search() is not None
     assert AdvancedQ(q_search="x").build_q_search() is not None
+
+
+class UserLimitedSearch(BaseFilter):
+    class FilterConfig:
+        q_search = QSearch(
+            model_attrs=[User.first_name, User.last_name],
+            term_limits=TermLimits(min_length=2, max_terms=2),
+        )
+        fields = [
+            FieldCriteria(
+                name="last_name",
+                field_type=str,
+                model_attr=User.last_name,
+                op=(OperationEnum.ILIKE,),
+                term_limits=TermLimits(min_length=3, reject=True),
+            ),
+        ]
+
+
+def _names(db_session, f):
+    stmt = f.apply(select(User.first_name).order_by(User.first_name))
+    return list(db_session.execute(stmt).scalars())
+
+
+def test_like_wildcards_in_input_match_literally(db_session):
+    assert _names(db_session, UserSimpleFilterExample(q_search="%")) == []
+    assert _names(db_session, UserSimpleFilterExample(q_search="_ob")) == []
+    assert _names(db_session, UserSimpleFilterExample(q_search="ob")) == ["Bob"]
+
+
+@pytest.mark.parametrize("query", ["a", "%", "al ic e", "  "])
+def test_q_search_out_of_term_limits_is_skipped(query):
+    result = UserLimitedSearch(q_search=query).get_filter_model()
+    assert result.q_search is None
+
+
+def test_q_search_within_term_limits(db_session):
+    assert _names(db_session, UserLimitedSearch(q_search="li")) == ["Alice"]
+
+
+def test_field_out_of_term_limits_is_rejected(db_session):
+    assert _names(db_session, UserLimitedSearch(last_name__ilike="smi")) == ["Alice"]
+    with pytest.raises(ValidationError, match="term limits"):
+        UserLimitedSearch(last_name__ilike="sm")
+
+
+class UserRejectingSearch(BaseFilter):
+    class FilterConfig:
+        q_search = QSearch(
+            model_attrs=[User.first_name],
+            term_limits=TermLimits(min_length=2, reject=True),
+        )
+
+
+def test_q_search_out_of_term_limits_is_rejected(db_session):
+    assert _names(db_session, UserRejectingSearch(q_search="li")) == ["Alice"]
+    assert UserRejectingSearch().get_filter_model().q_search is None
+    with pytest.raises(ValidationError, match="q_search"):
+        UserRejectingSearch(q_search="a")
+
+
+class UserUnionSearch(BaseFilter):
+    class FilterConfig:
+        model = User
+        pagination = PaginationEnum.OFFSET_BASED
+        sort_by = SortBy({"age": User.age})
+        q_search = QSearch(
+            model_attrs=[User.first_name, User.last_name],
+            union_rewrite=True,
+        )
+        fields = [
+            FieldCriteria(
+                name="age",
+                field_type=int,
+                model_attr=User.age,
+                op=(OperationEnum.GTE,),
+            ),
+        ]
+
+
+class UserAdvancedUnionSearch(BaseFilter):
+    class FilterConfig:
+        q_search = AdvancedQSearch(
+            model_attrs_with_op={
+                OperationEnum.STARTSWITH: [User.first_name],
+                OperationEnum.ILIKE: [User.last_name],
+            },
+            union_rewrite=True,
+        )
+
+
+def test_union_rewrite_builds_semi_join_on_primary_key():
+    sql = _sql(UserUnionSearch(q_search="o").get_filter_model().q_search)
+    assert sql.startswith("users.id IN (SELECT users.id \nFROM users \nWHERE")
+    assert "UNION SELECT users.id" in sql
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"q_search": "e"}, ["Alice", "Bob"]),
+        ({"q_search": "jones"}, ["Bob"]),
+        ({"q_search": "e", "age__gte": 35}, ["Bob"]),
+        ({"q_search": "e", "sort_by": "-age", "limit": 1, "offset": 0}, ["Bob"]),
+    ],
+)
+def test_union_rewrite_composes_with_filters_and_pagination(
+    db_session, kwargs, expected
+):
+    assert _names(db_session, UserUnionSearch(**kwargs)) == expected
+
+
+def test_advanced_union_rewrite(db_session):
+    f = UserAdvancedUnionSearch(q_search="Bo")
+    assert "UNION" in _sql(f.get_filter_model().q_search)
+    assert _names(db_session, f) == ["Bob"]
+    assert _names(db_session, UserAdvancedUnionSearch(q_search="smi")) == ["Alice"]
+
+
+def test_union_rewrite_falls_back_to_or_across_entities():
+    from sqlalchemy import Column, Integer, MetaData, String, Table
+
+    other = Table("other", MetaData(), Column("id", Integer), Column("v", String))
+
+    class MixedSearch(BaseFilter):
+        class FilterConfig:
+            q_search = QSearch(
+                model_attrs=[User.first_name, other.c.v], union_rewrite=True
+            )
+
+    assert "UNION" not in _sql(MixedSearch(q_search="x").get_filter_model().q_search)
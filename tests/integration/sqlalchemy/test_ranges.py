@@ -0,0 +1,99 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, select
+
+from fastapi_advanced_filters import BaseFilter, FieldCriteria, OperationEnum
+
+events = Table(
+    "events",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+class EventFilter(BaseFilter):
+    class FilterConfig:
+        fields = [
+            FieldCriteria(
+                name="created_at",
+                field_type=datetime,
+                model_attr=events.c.created_at,
+                op=(
+                    OperationEnum.IN,
+                    OperationEnum.BTW,
+                    OperationEnum.GT,
+                    OperationEnum.GTE,
+                    OperationEnum.LT,
+                    OperationEnum.LTE,
+                ),
+            ),
+        ]
+
+
+class BoundEventFilter(EventFilter):
+    class FilterConfig(EventFilter.FilterConfig):
+        bind_params = True
+
+
+@pytest.fixture(scope="module")
+def events_connection():
+    engine = create_engine("sqlite:///:memory:")
+    events.metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(
+            events.insert(),
+            [
+                {"id": 1, "created_at": datetime(2024, 1, 30, 23, 59)},
+                {"id": 2, "created_at": datetime(2024, 1, 31, 0, 0)},
+                {"id": 3, "created_at": datetime(2024, 1, 31, 18, 30)},
+                {"id": 4, "created_at": datetime(2024, 2, 1, 0, 0)},
+            ],
+        )
+        yield connection
+
+
+@pytest.mark.parametrize("filter_cls", [EventFilter, BoundEventFilter])
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"created_at__btw": "2024-01-31,2024-01-31"}, [2, 3]),
+        ({"created_at__btw": "2024-01-31,2024-01-30"}, [1, 2, 3]),
+        ({"created_at__btw": "2024-01-31,2024-01-31T12:00:00"}, [2]),
+        ({"created_at__lte": "2024-01-31"}, [1, 2, 3]),
+        ({"created_at__gt": "2024-01-31"}, [4]),
+        ({"created_at__gte": "2024-01-31", "created_at__lt": "2024-02-01"}, [2, 3]),
+        ({"created_at__gt": "2024-01-31T00:00:00"}, [3, 4]),
+        (
+            {
+                "created_at__gte": "2024-01-31T12:00:00",
+                "created_at__lte": "2024-01-31",
+            },
+            [3],
+        ),
+        ({"created_at__gt": "2024-01-30", "created_at__lt": "2024-02-01"}, [2, 3]),
+        (
+            {
+                "created_at__in": "2024-01-31T18:30:00,2024-02-01T00:00:00",
+                "created_at__lte": "2024-01-31",
+            },
+            [3],
+        ),
+        ({"created_at__gt": "2024-01-31", "created_at__lte": "2024-01-31"}, []),
+    ],
+)
+def test_whole_days_cover_datetime_columns(
+    events_connection, filter_cls, kwargs, expected
+):
+    f = filter_cls(**kwargs)
+    stmt = f.apply(select(events.c.id).order_by(events.c.id))
+    params = f.get_filter_model().params or {}
+    assert list(events_connection.execute(stmt, params).scalars()) == expected
+
+
+def test_whole_days_are_normalized_like_the_sql():
+    f = EventFilter(created_at__gte="2024-01-31T12:00:00", created_at__lte="2024-01-31")
+    assert not f.get_filter_model().empty
+    f = EventFilter(created_at__gt="2024-01-31", created_at__lte="2024-01-31")
+    assert f.get_filter_model().empty
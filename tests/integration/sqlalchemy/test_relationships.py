@@ -0,0 +1,350 @@
+import pytest
+from sqlalchemy import ForeignKey, create_engine, event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+)
+
+from fastapi_advanced_filters import (
+    BaseFilter,
+    FieldCriteria,
+    LogicalOperator,
+    OperationEnum,
+    PaginationEnum,
+    QSearch,
+    RelationshipLoaderEnum,
+    Selectable,
+    SortBy,
+)
+from tests._utils import _sql
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Country(Base):
+    __tablename__ = "countries"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+class Company(Base):
+    __tablename__ = "companies"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    country_id: Mapped[int] = mapped_column(ForeignKey("countries.id"))
+    country: Mapped[Country] = relationship()
+
+
+class Customer(Base):
+    __tablename__ = "customers"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    company_id: Mapped[int | None] = mapped_column(ForeignKey("companies.id"))
+    manager_id: Mapped[int | None] = mapped_column(ForeignKey("customers.id"))
+    company: Mapped[Company | None] = relationship()
+    manager: Mapped["Customer | None"] = relationship(remote_side=[id])
+    orders: Mapped[list["Order"]] = relationship()
+
+
+class Order(Base):
+    __tablename__ = "orders"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"))
+    status: Mapped[str]
+    total: Mapped[int]
+
+
+class CustomerFilter(BaseFilter):
+    class FilterConfig:
+        model = Customer
+        fields = [
+            FieldCriteria(
+                name="order_status",
+                field_type=str,
+                model_attr="orders.status",
+                op=(OperationEnum.EQ, OperationEnum.IN),
+            ),
+            FieldCriteria(
+                name="order_total",
+                field_type=int,
+                model_attr="orders.total",
+                op=(OperationEnum.GT, OperationEnum.LT),
+            ),
+            FieldCriteria(
+                name="company",
+                field_type=str,
+                model_attr="company.name",
+                op=(OperationEnum.EQ,),
+            ),
+            FieldCriteria(
+                name="country",
+                field_type=str,
+                model_attr="company.country.name",
+                op=(OperationEnum.EQ,),
+            ),
+            FieldCriteria(
+                name="manager",
+                field_type=str,
+                model_attr="manager.name",
+                op=(OperationEnum.EQ,),
+            ),
+            FieldCriteria(
+                name="anyone",
+                field_type=str,
+                model_attrs_with_logical_op=(
+                    [Customer.name, "manager.name"],
+                    LogicalOperator.OR,
+                ),
+                op=(OperationEnum.EQ,),
+            ),
+        ]
+        sort_by = SortBy(model_attrs={"name": Customer.name, "company": "company.name"})
+        q_search = QSearch(model_attrs=[Customer.name, "company.name"])
+
+
+class BoundCustomerFilter(CustomerFilter):
+    class FilterConfig(CustomerFilter.FilterConfig):
+        bind_params = True
+
+
+class CustomerSelectFilter(BaseFilter):
+    class FilterConfig:
+        model = Customer
+        select_only = Selectable(
+            model_attrs={
+                "name": Customer.name,
+                "company": Customer.company,
+                "orders": Customer.orders,
+            },
+            load_entities=True,
+        )
+
+
+class CustomerJoinedSelectFilter(BaseFilter):
+    class FilterConfig:
+        model = Customer
+        select_only = Selectable(
+            model_attrs={"name": Customer.name, "orders": Customer.orders},
+            load_entities=True,
+            relationship_loader=RelationshipLoaderEnum.JOINED,
+        )
+        pagination = PaginationEnum.OFFSET_BASED
+
+
+class CustomerCursorSelectFilter(BaseFilter):
+    class FilterConfig:
+        model = Customer
+        pagination = PaginationEnum.CURSOR_BASED
+        cursor_secret = "secret"
+        sort_by = SortBy({"name": Customer.name})
+        select_only = Selectable({"company": Customer.company}, load_entities=True)
+
+
+@pytest.fixture(scope="module")
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        france, germany = Country(id=1, name="FR"), Country(id=2, name="DE")
+        acme = Company(id=1, name="Acme", country=france)
+        globex = Company(id=2, name="Globex", country=germany)
+        alice = Customer(id=1, name="Alice", company=acme)
+        session.add_all(
+            [
+                alice,
+                Customer(id=2, name="Bob", company=globex, manager=alice),
+                Customer(id=3, name="Carol", manager=alice),
+                Order(customer_id=1, status="paid", total=100),
+                Order(customer_id=1, status="paid", total=50),
+                Order(customer_id=1, status="open", total=10),
+                Order(customer_id=2, status="open", total=500),
+            ]
+        )
+        session.commit()
+        yield session
+
+
+def names(session, f):
+    stmt = f.apply(select(Customer.name).order_by(Customer.id))
+    return list(session.execute(stmt, f.get_filter_model().params).scalars())
+
+
+@pytest.mark.parametrize("filter_cls", [CustomerFilter, BoundCustomerFilter])
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"order_status__eq": "paid"}, ["Alice"]),
+        ({"order_status__in": "open,paid"}, ["Alice", "Bob"]),
+        # Both predicates hold for some order, not necessarily the same one.
+        ({"order_total__gt": 60, "order_total__lt": 20}, ["Alice"]),
+        ({"company__eq": "Acme", "country__eq": "FR"}, ["Alice"]),
+        ({"country__eq": "DE"}, ["Bob"]),
+        ({"manager__eq": "Alice"}, ["Bob", "Carol"]),
+        ({"anyone__eq": "Alice"}, ["Alice", "Bob", "Carol"]),
+        ({"q_search": "Acme"}, ["Alice"]),
+        ({"q_search": "Carol"}, ["Carol"]),
+    ],
+)
+def test_relationship_paths_filter_rows_once(session, filter_cls, kwargs, expected):
+    assert names(session, filter_cls(**kwargs)) == expected
+
+
+def test_to_many_paths_use_exists_without_joins():
+    f = CustomerFilter(order_status__eq="paid", order_total__gt=60)
+    sql = _sql(f.apply(select(Customer)))
+    assert sql.count("EXISTS") == 2
+    assert "JOIN" not in sql and "DISTINCT" not in sql
+    assert f.get_filter_model().joins is None
+
+
+def test_to_one_joins_are_shared_between_filters_and_sorting():
+    f = CustomerFilter(
+        company__eq="Acme", country__eq="FR", q_search="a", sort_by="-company"
+    )
+    sql = _sql(f.apply(select(Customer)))
+    assert sql.count("LEFT OUTER JOIN companies AS") == 1
+    assert sql.count("LEFT OUTER JOIN countries AS") == 1
+    assert "EXISTS" not in sql
+    assert len(f.get_filter_model().joins) == 2
+
+
+def test_sorting_by_a_to_one_path_keeps_rows_without_relationship(session):
+    stmt = CustomerFilter(sort_by="-company,name").apply(select(Customer.name))
+    assert list(session.execute(stmt).scalars()) == ["Bob", "Alice", "Carol"]
+
+
+def test_execute_counts_each_row_once(session):
+    result = CustomerFilter(order_status__in="open,paid", limit=10).execute(
+        session, with_count=True
+    )
+    assert [customer.name for customer in result.items] == ["Alice", "Bob"]
+    assert result.total == 2
+
+
+def test_invalid_relationship_path_fails_at_class_creation():
+    with pytest.raises(AssertionError, match="not a relationship"):
+
+        class WrongFilter(BaseFilter):
+            class FilterConfig:
+                model = Customer
+                fields = [
+                    FieldCriteria(
+                        name="wrong",
+                        field_type=str,
+                        model_attr="name.length",
+                        op=(OperationEnum.EQ,),
+                    )
+                ]
+
+
+def test_cursor_pagination_rejects_relationship_sort_keys():
+    with pytest.raises(AssertionError, match="cursor-based pagination"):
+
+        class CursorFilter(BaseFilter):
+            class FilterConfig:
+                model = Customer
+                pagination = PaginationEnum.CURSOR_BASED
+                cursor_secret = "secret"
+                sort_by = SortBy({"company_name": "company.name"})
+
+
+def test_sorting_by_a_to_many_path_fails_at_class_creation():
+    with pytest.raises(ValueError, match="to-many relationship"):
+
+        class OrderSortFilter(BaseFilter):
+            class FilterConfig:
+                model = Customer
+                sort_by = SortBy({"order_total": "orders.total"})
+
+
+def test_declared_paths_are_resolved_at_class_creation():
+    paths = CustomerFilter.__dict__["__attribute_paths__"]
+    assert {"company.name", "orders.total", "manager.name"} <= paths.keys()
+    assert CustomerFilter.resolve_attribute_path("company.name") is (
+        paths["company.name"]
+    )
+
+
+@pytest.fixture
+def statements(session):
+    # A fresh session, so no attribute is already loaded in the identity map.
+    captured = []
+
+    def capture(conn, cursor, statement, *args):
+        captured.append(statement)
+
+    event.listen(session.bind, "before_cursor_execute", capture)
+    with Session(session.bind) as fresh:
+        yield fresh, captured
+    event.remove(session.bind, "before_cursor_execute", capture)
+
+
+def test_entity_selection_loads_only_selected_columns_and_relationships(statements):
+    fresh, captured = statements
+    f = CustomerSelectFilter(select="name,company")
+    assert f.get_filter_model().selected_columns is None
+    customers = f.execute(fresh, stmt=select(Customer).order_by(Customer.id)).items
+    assert [(c.name, c.company and c.company.name) for c in customers] == [
+        ("Alice", "Acme"),
+        ("Bob", "Globex"),
+        ("Carol", None),
+    ]
+    page_sql, companies_sql = captured
+    assert "customers.name" in page_sql and "customers.company_id" in page_sql
+    assert "manager_id" not in page_sql and "companies.name" in companies_sql
+    with pytest.raises(InvalidRequestError):
+        customers[0].orders
+    with pytest.raises(InvalidRequestError):
+        customers[0].manager_id
+
+
+def test_entity_selection_of_relationships_only_loads_the_primary_key(statements):
+    fresh, captured = statements
+    f = CustomerSelectFilter(select="orders")
+    customers = f.execute(fresh, stmt=select(Customer).order_by(Customer.id)).items
+    assert [len(c.orders) for c in customers] == [3, 1, 0]
+    assert captured[0].startswith("SELECT customers.id \nFROM customers")
+    assert len(captured) == 2
+
+
+def test_joined_entity_selection_returns_each_entity_once(statements):
+    fresh, captured = statements
+    result = CustomerJoinedSelectFilter(select="name,orders", limit=2).execute(
+        fresh, stmt=select(Customer).order_by(Customer.id), with_count=True
+    )
+    assert [(c.name, len(c.orders)) for c in result.items] == [
+        ("Alice", 3),
+        ("Bob", 1),
+    ]
+    assert result.total == 3
+    assert len(captured) == 2 and "LEFT OUTER JOIN orders" in captured[0]
+
+
+def test_entity_selection_loads_the_sort_and_cursor_keys(statements):
+    fresh, _ = statements
+    request = {"select": "company", "sort_by": "-name", "limit": 2}
+    page = CustomerCursorSelectFilter(**request).execute(fresh)
+    assert [(c.name, c.company and c.company.name) for c in page.items] == [
+        ("Carol", None),
+        ("Bob", "Globex"),
+    ]
+    following = CustomerCursorSelectFilter(**request, cursor=page.next_cursor)
+    customers = following.execute(fresh).items
+    assert [c.name for c in customers] == ["Alice"]
+    with pytest.raises(InvalidRequestError):
+        customers[0].manager_id
+
+
+def test_column_selection_is_unchanged_without_load_entities():
+    m = CustomerFilter().get_filter_model()
+    assert m.load_options is None and m.selected_columns is None
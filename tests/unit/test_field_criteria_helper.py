@@ -1,9 +1,18 @@
+import gc
+import weakref
+from typing import Annotated
+
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
 from fastapi_advanced_filters.data_classes import FieldCriteria
 from fastapi_advanced_filters.enums import OperationEnum
 from fastapi_advanced_filters.filter_metaclass.helpers.field_criteria import (
     attrs_to_field_criteria,
+    field_annotations_from_model,
     from_field_criteria_to_attr,
 )
+from fastapi_advanced_filters.filters import BaseFilter
+from tests.integration.sqlalchemy.models_and_filters import User
 
 
 class DummyModel:
@@ -39,3 +48,84 @@ def test_from_field_criteria_to_attr_required_and_optional():
     gt_field = attrs["age__gt"].__metadata__[0]
     assert eq_field.default
     assert gt_field.default is None
+
+
+def test_all_fields_are_discovered_from_the_mapper_columns():
+    names = [
+        crit.name
+        for crit in attrs_to_field_criteria(
+            User, fields="__all__", prefix=None, op=(OperationEnum.EQ,)
+        )
+    ]
+    assert names == sorted(column.key for column in User.__table__.columns)
+    assert (
+        next(
+            attrs_to_field_criteria(User, fields="age", op=(OperationEnum.EQ,))
+        ).field_type
+        is int
+    )
+
+
+def test_field_annotations_are_shared_per_model_configuration():
+    op = (OperationEnum.EQ, OperationEnum.IN)
+    first = field_annotations_from_model(User, "__all__", "shared", op)
+    assert field_annotations_from_model(User, "__all__", "shared", op) is first
+    assert field_annotations_from_model(User, ["age"], "shared", op) is not first
+    assert field_annotations_from_model(User, ["age"], "other", op) is not first
+
+    def make():
+        class F(BaseFilter):
+            class FilterConfig:
+                model = User
+                prefix = "shared"
+                fields = "__all__"
+                default_op = op
+
+        return F
+
+    f, g = make(), make()
+    assert f.get_filter_plan()["shared__age__in"].field_criteria is (
+        g.get_filter_plan()["shared__age__in"].field_criteria
+    )
+    assert g(shared__age__in="1,2").shared__age__in == [1, 2]
+    assert f(shared__age__eq=3).build_filters() is not None
+
+
+def test_field_criteria_lists_are_memoized_unless_unhashable():
+    crit = FieldCriteria(
+        name="age",
+        field_type=int,
+        op=(OperationEnum.EQ,),
+        model_attr=User.age,
+        fields_kwargs={"ge": 0},
+    )
+    first = field_annotations_from_model(User, [crit], None, None)
+    assert set(first) == {"age__eq"}
+    assert field_annotations_from_model(User, [crit], None, None) is first
+
+    unhashable = FieldCriteria(
+        name="age", field_type=int, op=(OperationEnum.EQ,), model_attr=[User.age]
+    )
+    first = field_annotations_from_model(User, [unhashable], None, None)
+    assert field_annotations_from_model(User, [unhashable], None, None) is not first
+
+
+def test_field_annotations_are_collected_with_their_model():
+    def make():
+        class Base(DeclarativeBase):
+            pass
+
+        class Model(Base):
+            __tablename__ = "model"
+            id: Mapped[int] = mapped_column(primary_key=True)
+
+        first = field_annotations_from_model(Model, "__all__")
+        assert field_annotations_from_model(Model, "__all__") is first
+        return weakref.ref(Model)
+
+    model_ref = make()
+    # Evict the annotations from the (bounded) cache of typing subscriptions.
+    for i in range(1024):
+        Annotated[int, i]
+    gc.collect()
+    assert model_ref() is None
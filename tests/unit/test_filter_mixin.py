@@ -176,3 +176,43 @@ def test_asserts_when_model_attrs_not_sequence():
 
     with pytest.raises(AssertionError):
         DF(wrong__eq="x").build_filters()
+
+
+def test_filter_plan_built_lazily_and_cached_per_class():
+    class DF(DummyFilter):
+        pass
+
+    assert "__filter_plan__" not in DF.__dict__
+    plan = DF.get_filter_plan()
+    assert DF.get_filter_plan() is plan
+    assert plan["name__eq"].logical_op is not None
+    assert plan["unknown__lte"].operation is None
+
+
+def test_build_filters_walks_set_fields_in_declaration_order(monkeypatch):
+    def fail(*args, **kwargs):  # pragma: no cover - must not be reached
+        raise AssertionError("build_filters must not serialize the model")
+
+    df = DummyFilter(name__eq="A", plain="x", age__gt=30)
+    monkeypatch.setattr(DummyFilter, "model_dump", fail)
+    built = df.build_filters()
+    # age__gt is declared before name__eq, regardless of the kwargs order
+    assert built[0] == ("age_column", ">", 30)
+    assert built[1][0] == "OR"
+
+
+def test_get_active_filters_skips_explicit_none():
+    df = DummyFilter(age__gt=None, name__eq="A")
+    assert [entry.name for entry, _ in df.get_active_filters()] == ["name__eq"]
+
+
+def test_get_active_filters_keeps_declaration_order_with_every_field_set():
+    # FastAPI's `Depends()` passes every field, most of them as `None`.
+    df = DummyFilter(
+        **{name: None for name in DummyFilter.model_fields}
+        | {"name__eq": "A", "age__gt": 3}
+    )
+    assert [entry.name for entry, _ in df.get_active_filters()] == [
+        "age__gt",
+        "name__eq",
+    ]
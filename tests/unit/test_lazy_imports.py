@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import fastapi_advanced_filters
+from fastapi_advanced_filters import operation_mapping
+from fastapi_advanced_filters.operation_mapping import sqlalchemy_mapping
+
+
+def test_enums_and_data_classes_do_not_load_backends():
+    code = (
+        "import sys\n"
+        "from fastapi_advanced_filters import FieldCriteria, OperationEnum\n"
+        "assert 'sqlalchemy' not in sys.modules, 'sqlalchemy'\n"
+        "assert 'pydantic' not in sys.modules, 'pydantic'\n"
+        "assert 'fastapi_advanced_filters.filters' not in sys.modules, 'filters'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes_resolve_to_their_modules():
+    from fastapi_advanced_filters.filters import BaseFilter
+
+    assert fastapi_advanced_filters.BaseFilter is BaseFilter
+    assert operation_mapping.SQLALCHEMY_OP_MAPPING is sqlalchemy_mapping.OP_MAPPING
+    assert (
+        fastapi_advanced_filters.SQLALCHEMY_BIND_OP_MAPPING
+        is sqlalchemy_mapping.BIND_OP_MAPPING
+    )
+    assert set(fastapi_advanced_filters.__all__) <= set(dir(fastapi_advanced_filters))
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        fastapi_advanced_filters.missing
+    with pytest.raises(AttributeError):
+        operation_mapping.missing
@@ -1,3 +1,5 @@
+import pytest
+
 from fastapi_advanced_filters.data_classes import FieldCriteria
 from fastapi_advanced_filters.enums import OperationEnum, PaginationEnum
 from fastapi_advanced_filters.filter_metaclass.helpers import (
@@ -32,6 +34,19 @@ def test_pagination_annotations_offset_and_page_based():
     assert set(page.keys()) == {"page", "page_size"}
 
 
+def test_pagination_annotations_cursor_based_requires_secret():
+    class C1:
+        pagination = PaginationEnum.CURSOR_BASED
+        cursor_secret = "secret"
+
+    class C2:
+        pagination = PaginationEnum.CURSOR_BASED
+
+    assert set(generate_annotations_for_pagination(C1).keys()) == {"limit", "cursor"}
+    with pytest.raises(AssertionError):
+        generate_annotations_for_pagination(C2)
+
+
 def test_fields_list_of_fieldcriteria_is_used():
     fc = FieldCriteria(name="age", field_type=int, op=(OperationEnum.GT,))
 
@@ -41,3 +56,80 @@ def test_fields_list_of_fieldcriteria_is_used():
     annotations = FilterMetaClass.generate_annotations_for_filters(C)
     # The annotation name is generated as age__gt
     assert "age__gt" in annotations
+
+
+def test_filter_plan_precompiled_at_class_creation():
+    from fastapi_advanced_filters.filters import BaseFilter
+
+    fc = FieldCriteria(
+        name="age", field_type=int, op=(OperationEnum.GT,), model_attr="age_col"
+    )
+
+    class F(BaseFilter):
+        class FilterConfig:
+            fields = [fc]
+
+    plan = F.__dict__["__filter_plan__"]
+    assert set(plan.keys()) == {"age__gt"}
+    entry = plan["age__gt"]
+    assert entry.op == OperationEnum.GT and entry.field_criteria is fc
+    assert entry.operation is not None and entry.logical_op is None
+    assert F.get_filter_plan() is plan
+    # the plan is read-only
+    with pytest.raises(TypeError):
+        plan["other"] = entry
+
+    class G(F):
+        pass
+
+    # subclasses get their own plan, not the parent's
+    assert G.__dict__["__filter_plan__"] is not plan
+
+
+def test_defer_build_builds_schema_and_plan_on_first_use():
+    from fastapi_advanced_filters.filters import BaseFilter
+
+    fc = FieldCriteria(
+        name="age", field_type=int, op=(OperationEnum.GT,), model_attr="age_col"
+    )
+
+    class F(BaseFilter):
+        class FilterConfig:
+            fields = [fc]
+            defer_build = True
+
+    class G(F):
+        pass
+
+    for cls in (F, G):
+        assert cls.__pydantic_complete__ is False
+        assert "__filter_plan__" not in cls.__dict__
+    assert "age__gt" in F.model_fields
+    assert "age__gt" in F.model_json_schema()["properties"]
+    assert F(age__gt=5).age__gt == 5
+    assert set(F.get_filter_plan()) == {"age__gt"}
+
+
+def test_warm_up_builds_deferred_subclasses():
+    from fastapi_advanced_filters.filters import BaseFilter
+
+    class F(BaseFilter):
+        class FilterConfig:
+            fields = [
+                FieldCriteria(
+                    name="age",
+                    field_type=int,
+                    op=(OperationEnum.IN,),
+                    model_attr="age_col",
+                )
+            ]
+            defer_build = True
+
+    class G(F):
+        pass
+
+    F.warm_up()
+    for cls in (F, G):
+        assert cls.__pydantic_complete__ is True
+        assert set(cls.__dict__["__filter_plan__"]) == {"age__in"}
+    assert G(age__in="1,2").age__in == [1, 2]
@@ -1,5 +1,14 @@
-from fastapi_advanced_filters.data_classes import FieldCriteria, Selectable, SortBy
-from fastapi_advanced_filters.enums import OperationEnum
+import pytest
+
+from fastapi_advanced_filters.data_classes import (
+    AdvancedQSearch,
+    FieldCriteria,
+    QSearch,
+    Selectable,
+    SortBy,
+)
+from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum
+from fastapi_advanced_filters.utils import EMPTY_MAPPING
 
 
 def test_sortby_alias_camelcase_cache_and_access():
@@ -26,6 +35,13 @@ def test_selectable_alias_and_plain():
     assert sel2.get_attr("email") == 2
 
 
+def test_selectable_row_mode_and_entity_loading_are_exclusive():
+    assert Selectable(model_attrs={"a": 1}, row_factory=dict).returns_rows()
+    assert not Selectable(model_attrs={"a": 1}).returns_rows()
+    with pytest.raises(AssertionError, match="both load entities and return rows"):
+        Selectable(model_attrs={"a": 1}, load_entities=True, as_rows=True)
+
+
 def test_field_criteria_alias_and_names_with_prefix():
     fc = FieldCriteria(
         name="age",
@@ -51,3 +67,40 @@ def test_field_criteria_names_without_prefix_and_plain_alias():
     assert fc.get_name() == "status"
     assert fc.get_field_name(OperationEnum.EQ) == "status__eq"
     assert fc.get_alias_name(OperationEnum.EQ) == "status__eq"
+
+
+def test_metadata_objects_use_slots_and_read_only_storage():
+    fc = FieldCriteria(name="a", field_type=int, op=[OperationEnum.EQ])
+    other = FieldCriteria(name="b", field_type=int, op=(OperationEnum.EQ,))
+    qs = QSearch(model_attrs=["a", "b"])
+    aqs = AdvancedQSearch(model_attrs_with_op={OperationEnum.EQ: ["a"]})
+    for obj in (fc, qs, aqs, SortBy(model_attrs={}), Selectable(model_attrs={})):
+        assert not hasattr(obj, "__dict__")
+    assert fc.op == (OperationEnum.EQ,)
+    assert fc.fields_kwargs is other.fields_kwargs is EMPTY_MAPPING
+    assert hash(fc) != hash(other)
+    assert qs.model_attrs == ("a", "b")
+    assert aqs.model_attrs_with_op[OperationEnum.EQ] == ("a",)
+    with pytest.raises(TypeError):
+        aqs.model_attrs_with_op[OperationEnum.IN] = ("b",)
+
+
+def test_field_criteria_freezes_logical_op_attrs_and_kwargs():
+    kwargs = {"ge": 0}
+    fc = FieldCriteria(
+        name="a",
+        field_type=int,
+        op=(OperationEnum.EQ,),
+        model_attrs_with_logical_op=(["x", "y"], LogicalOperator.OR),
+        fields_kwargs=kwargs,
+    )
+    kwargs["le"] = 10
+    assert fc.model_attrs_with_logical_op == (("x", "y"), LogicalOperator.OR)
+    assert dict(fc.fields_kwargs) == {"ge": 0}
+
+
+def test_camelcase_aliases_are_shared_between_instances():
+    first = SortBy(model_attrs={"first_name": 1}, alias_as_camelcase=True)
+    second = Selectable(model_attrs={"first_name": 2}, alias_as_camelcase=True)
+    assert first.get_names()[0] is second.get_names()[0]
+    assert first.model_attrs == {"first_name": 1}
@@ -0,0 +1,68 @@
+import pytest
+
+from fastapi_advanced_filters.caching import (
+    InMemoryResultCache,
+    ResultCacheBackend,
+    estimate_size,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_result_cache_lru_eviction_and_counters():
+    cache = InMemoryResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+    cache.delete("a")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == cache.evictions == 0
+
+
+def test_result_cache_ttl():
+    clock = Clock()
+    cache = InMemoryResultCache(clock=clock)
+    cache.set("a", "value", ttl=10)
+    cache.set("b", "forever")
+    clock.now = 9.9
+    assert cache.get("a") == "value"
+    clock.now = 10
+    assert cache.get("a") is None and len(cache) == 1
+    assert cache.get("b") == "forever"
+
+
+def test_result_cache_byte_accounting():
+    cache = InMemoryResultCache(max_bytes=10, sizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "yyyy")
+    assert cache.current_bytes == 8
+    cache.set("c", "zzzz")
+    assert cache.get("a") is None and cache.evictions == 1
+    assert cache.current_bytes == 8
+    # values larger than the whole budget are never stored
+    cache.set("d", "x" * 11)
+    assert cache.get("d") is None and cache.current_bytes == 8
+    # replacing an entry releases its previous size
+    cache.set("b", "y")
+    assert cache.current_bytes == 5
+
+
+def test_result_cache_backend_interface_and_sizes():
+    with pytest.raises(TypeError):
+        ResultCacheBackend()
+    assert isinstance(InMemoryResultCache(), ResultCacheBackend)
+    assert estimate_size([1, 2, 3]) > 0
+    assert estimate_size(lambda: None) > 0
+    with pytest.raises(AssertionError):
+        InMemoryResultCache(max_entries=0)
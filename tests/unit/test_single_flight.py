@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from fastapi_advanced_filters.caching import SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    started = []
+
+    async def query():
+        started.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def run():
+        results = await asyncio.gather(
+            *(single_flight.do("key", query) for _ in range(5)),
+            single_flight.do("other", query),
+        )
+        # completed calls are forgotten: a new call runs again
+        await single_flight.do("key", query)
+        return results
+
+    results = asyncio.run(run())
+    assert len({id(result) for result in results[:5]}) == 1
+    assert results[5] is not results[0]
+    assert len(started) == 3
+    assert (single_flight.calls, single_flight.coalesced) == (3, 4)
+    assert len(single_flight) == 0
+
+
+def test_single_flight_shares_errors():
+    single_flight = SingleFlight()
+
+    async def query():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            *(single_flight.do("key", query) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(run())
+    assert all(isinstance(error, ValueError) for error in errors)
+
+
+def test_single_flight_survives_caller_cancellation():
+    single_flight = SingleFlight()
+
+    async def query():
+        await asyncio.sleep(0.01)
+        return "rows"
+
+    async def run():
+        leader = asyncio.ensure_future(single_flight.do("key", query))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("key", query))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "rows"
@@ -1,5 +1,20 @@
+import datetime
+
 import pytest
-from sqlalchemy import Boolean, Column, Date, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    select,
+)
+from sqlalchemy.dialects import mssql, mysql, oracle, postgresql, sqlite
 
 from fastapi_advanced_filters.enums import LogicalOperator, OperationEnum, OrderEnum
 from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
@@ -8,8 +23,15 @@ from fastapi_advanced_filters.operation_mapping.sqlalchemy_mapping import (
     SORTING_MAPPING,
     between,
     contains,
+    cursor_ordering,
+    endswith,
+    iequals,
     in_funct,
+    in_values,
+    keyset_condition,
     not_in_funct,
+    startswith,
+    value_parser,
 )
 
 
@@ -64,13 +86,40 @@ def test_contains_array_path_branch():
 def test_between_for_numeric_and_date():
     col_int = Column("i", Integer())
     res_num = between(col_int, "10,1,5")
-    s = _sql(res_num)
-    assert " BETWEEN 1 AND 10" in s or " BETWEEN 10 AND 1" in s
+    assert _sql(res_num) == "i >= 1 AND i <= 10"
 
     col_date = Column("d", Date())
-    res_date = between(col_date, "2020-01-01,2020-01-10")
-    s2 = _sql(res_date)
-    assert "2020-01-01" in s2 and "2020-01-10" in s2
+    res_date = between(col_date, "2020-01-10,2020-01-01")
+    assert _sql(res_date) == "d >= '2020-01-01' AND d < '2020-01-11'"
+
+
+def test_between_keeps_float_and_decimal_values():
+    assert _sql(between(Column("f", Float()), "0.5,2.25")) == "f >= 0.5 AND f <= 2.25"
+    assert _sql(between(Column("n", Numeric()), "1.10,3")) == "n >= 1.10 AND n <= 3"
+    with pytest.raises(ValueError):
+        between(Column("i", Integer()), "1.5,3")
+
+
+def test_datetime_ranges_are_half_open_over_whole_days():
+    col = Column("ts", DateTime())
+    assert _sql(between(col, "2024-01-01,2024-01-31")) == (
+        "ts >= '2024-01-01 00:00:00' AND ts < '2024-02-01 00:00:00'"
+    )
+    assert _sql(between(col, "2024-01-01,2024-01-31T12:30:00")) == (
+        "ts >= '2024-01-01 00:00:00' AND ts <= '2024-01-31 12:30:00'"
+    )
+    expected = {
+        OperationEnum.GT: "ts >= '2024-02-01 00:00:00'",
+        OperationEnum.GTE: "ts >= '2024-01-31 00:00:00'",
+        OperationEnum.LT: "ts < '2024-01-31 00:00:00'",
+        OperationEnum.LTE: "ts < '2024-02-01 00:00:00'",
+    }
+    for op, sql in expected.items():
+        assert _sql(OP_MAPPING[op](col, "2024-01-31")) == sql
+    at_noon = datetime.datetime(2024, 1, 31, 12)
+    assert _sql(OP_MAPPING[OperationEnum.LTE](col, at_noon)) == (
+        "ts <= '2024-01-31 12:00:00'"
+    )
 
 
 def test_between_invalid_type_raises():
@@ -140,3 +189,107 @@ def test_not_in_funct_value_error_returns_none():
     # -> returns None
     col = Column("i", Integer())
     assert not_in_funct(col, "a,b") is None
+
+
+def test_keyset_condition_row_value_and_expanded_forms():
+    a = Column("a", Integer, nullable=False)
+    b = Column("b", Integer, nullable=False)
+    uniform = keyset_condition([(a, OrderEnum.DESC), (b, OrderEnum.DESC)], [1, 2])
+    assert _sql(uniform) == "(a, b) < (1, 2)"
+    mixed = keyset_condition([(a, OrderEnum.DESC), (b, OrderEnum.ASC)], [1, 2])
+    assert _sql(mixed) == "a < 1 OR a = 1 AND b > 2"
+    assert _sql(keyset_condition([(a, OrderEnum.ASC)], [1])) == "a > 1"
+
+
+def test_keyset_condition_and_ordering_sort_nulls_last():
+    a, b = Column("a", Integer), Column("b", Integer, nullable=False)
+    keys = [(a, OrderEnum.ASC), (b, OrderEnum.ASC)]
+    assert _sql(keyset_condition(keys, [1, 2])) == (
+        "a > 1 OR a IS NULL OR a = 1 AND b > 2"
+    )
+    assert _sql(keyset_condition(keys, [None, 2])) == "a IS NULL AND b > 2"
+    assert [_sql(term) for term in cursor_ordering(a, OrderEnum.DESC)] == [
+        "CASE WHEN (a IS NULL) THEN 1 ELSE 0 END",
+        "a DESC",
+    ]
+    assert [_sql(term) for term in cursor_ordering(b, OrderEnum.ASC)] == ["b ASC"]
+
+
+def test_in_values_dedupes_sorts_and_parses_dates():
+    assert in_values(Column("i", Integer()), "3,1,3,2") == [1, 2, 3]
+    assert in_values(Column("d", Date()), "2024-02-01,2024-01-01") == [
+        datetime.date(2024, 1, 1),
+        datetime.date(2024, 2, 1),
+    ]
+    assert in_values(Column("d", Date()), "2024-13-01") is None
+    column = Column("i", Integer())
+    parser = value_parser(column)
+    assert value_parser(column) is parser
+    assert parser("2") == parser(2) == 2
+
+
+def test_in_funct_statement_does_not_depend_on_the_number_of_values():
+    table = Table("t", MetaData(), Column("a", Integer()))
+    short = select(table).where(in_funct(table.c.a, "1,2"))
+    long = select(table).where(in_funct(table.c.a, "1,2,3,4,5"))
+    assert short._generate_cache_key() == long._generate_cache_key()
+    assert _sql(long.whereclause) == "t.a IN (1, 2, 3, 4, 5)"
+    assert _sql(not_in_funct(table.c.a, "2,1")) == "(t.a NOT IN (1, 2))"
+
+
+def test_in_funct_uses_any_array_on_postgresql():
+    column = Column("a", Integer())
+    dialect = postgresql.dialect()
+    compiled = in_funct(column, "2,1,2").compile(dialect=dialect)
+    assert str(compiled) == "a = ANY (%(param_1)s::INTEGER[])"
+    assert compiled.params == {"param_1": [1, 2]}
+    assert str(not_in_funct(column, "1").compile(dialect=dialect)) == (
+        "a != ALL (%(param_1)s::INTEGER[])"
+    )
+    assert str((~in_funct(column, "1")).compile(dialect=dialect)) == (
+        "a != ALL (%(param_1)s::INTEGER[])"
+    )
+
+
+def test_in_funct_offloads_long_lists_to_a_derived_table():
+    column = Column("a", Integer())
+    semi = in_funct(column, "3,1,2", offload_threshold=2)
+    anti = not_in_funct(column, "3,1,2", offload_threshold=2)
+    dialect = sqlite.dialect()
+    assert str(semi.compile(dialect=dialect)) == "a IN (VALUES (1), (2), (3))"
+    assert (
+        str(anti.compile(dialect=dialect))
+        == str((~semi).compile(dialect=dialect))
+        == "a NOT IN (VALUES (1), (2), (3))"
+    )
+    # dialects without a matching VALUES syntax keep the IN list
+    for dialect in (mysql.dialect(), mssql.dialect(), oracle.dialect()):
+        assert "VALUES" not in str(semi.compile(dialect=dialect))
+    assert _sql(semi) == "a IN (1, 2, 3)"
+    assert _sql(anti) == "(a NOT IN (1, 2, 3))"
+    dialect = postgresql.dialect()
+    assert str(semi.compile(dialect=dialect)) == (
+        "a IN (SELECT unnest(%(param_1)s::INTEGER[]))"
+    )
+    assert str(anti.compile(dialect=dialect)) == (
+        "(a IS NOT NULL AND NOT EXISTS (SELECT 1 FROM unnest(%(param_1)s::INTEGER[]) "
+        "AS in_values (v) WHERE in_values.v = a))"
+    )
+    # short lists and disabled offloading keep the IN list
+    assert _sql(in_funct(column, "1,2", offload_threshold=2)) == "a IN (1, 2)"
+    assert _sql(in_funct(column, "1,2,3", offload_threshold=None)) == "a IN (1, 2, 3)"
+
+
+def test_prefix_suffix_and_case_folded_equality():
+    col = Column("name", String())
+    assert _sql(startswith(col, "Al")) == "name LIKE 'Al%' ESCAPE '/'"
+    assert _sql(endswith(col, "ce")) == "name LIKE '%ce' ESCAPE '/'"
+    assert _sql(iequals(col, "ALICE")) == "lower(name) = lower('ALICE')"
+
+
+def test_endswith_matches_reversed_prefix_on_postgresql():
+    col = Column("name", String())
+    compiled = endswith(col, "ce").compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    assert str(compiled) == "reverse(name) LIKE 'ec%%' ESCAPE '/'"
@@ -0,0 +1,22 @@
+from fastapi_advanced_filters.caching import StatementCache
+
+
+def test_statement_cache_lru_eviction_and_counters():
+    cache = StatementCache(maxsize=2)
+    built = []
+
+    def build(key):
+        built.append(key)
+        return f"stmt-{key}"
+
+    assert cache.get_or_build("a", lambda: build("a")) == "stmt-a"
+    assert cache.get_or_build("b", lambda: build("b")) == "stmt-b"
+    # touch "a" so "b" is the least recently used entry
+    assert cache.get_or_build("a", lambda: build("a")) == "stmt-a"
+    cache.get_or_build("c", lambda: build("c"))
+    assert len(cache) == 2
+    cache.get_or_build("b", lambda: build("b"))
+    assert built == ["a", "b", "c", "b"]
+    assert (cache.hits, cache.misses) == (1, 4)
+    cache.clear()
+    assert len(cache) == 0 and cache.hits == 0
@@ -1,6 +1,17 @@
+import datetime
+from decimal import Decimal
+
 import pytest
 
+from fastapi_advanced_filters.enums import OperationEnum, OrderEnum
 from fastapi_advanced_filters.utils import (
+    canonical_value,
+    decode_cursor,
+    encode_cursor,
+    escape_like,
+    freeze,
+    quote_match_terms,
+    split_comma_separated,
     to_camel_case,
     to_snake_case,
     validate_selectable_schema,
@@ -64,3 +75,53 @@ def test_validate_sortable_schema():
     with pytest.raises(ValueError) as e:
         validate_sortable_schema(["name"])("name,ascending")
         assert str(e) == "Field 'ascending' is not sortable"
+
+
+def test_cursor_round_trip_keeps_value_types():
+    values = [datetime.datetime(2024, 1, 2, 3, 4), Decimal("1.50"), "a", 3, None]
+    token = encode_cursor([("age", OrderEnum.DESC)], values, "secret")
+    sorting, decoded = decode_cursor(token, "secret")
+    assert sorting == [("age", OrderEnum.DESC)]
+    assert decoded == values
+
+
+def test_cursor_rejects_tampering_and_wrong_secret():
+    token = encode_cursor([], [1], "secret")
+    payload, signature = token.split(".")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(token, "other")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(payload + "x." + signature, "secret")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor("garbage", "secret")
+
+
+def test_canonical_value_treats_in_values_as_a_set():
+    assert canonical_value(OperationEnum.IN, "b,a,b") == ("a", "b")
+    assert canonical_value(OperationEnum.NOTIN, [2, 1, 2]) == (1, 2)
+    assert canonical_value(OperationEnum.EQ, "b,a") == "b,a"
+    assert canonical_value(OperationEnum.BTW, [2, 1]) == (2, 1)
+
+
+def test_freeze_sorts_sets_and_dict_items():
+    assert freeze({"b", "a"}) == freeze(frozenset({"a", "b"})) == ("a", "b")
+    assert freeze({"b": [1], "a": {2}}) == freeze({"a": {2}, "b": [1]})
+    assert freeze({"b": [1], "a": {2}}) == (("a", (2,)), ("b", (1,)))
+
+
+def test_quote_match_terms():
+    assert quote_match_terms('c++ o"reilly  title:api') == (
+        '"c++" "o""reilly" "title:api"'
+    )
+    assert quote_match_terms(" ") == '""'
+
+
+def test_escape_like():
+    assert escape_like("50%_off/now") == "50/%/_off//now"
+    assert escape_like(12) == "12"
+
+
+def test_split_comma_separated():
+    assert split_comma_separated("1,2") == ["1", "2"]
+    assert split_comma_separated(["1,2", "3", 4]) == ["1", "2", "3", 4]
+    assert split_comma_separated(5) == 5